@@ -1 +1,16 @@
-from geofeather.core import to_geofeather, from_geofeather
+from geofeather.core import (
+    to_geofeather,
+    from_geofeather,
+    iter_geofeather,
+    read_geofeather_dataset,
+    to_geofeather_dataset,
+    GeoFeatherWriter,
+    read_geofeather_metadata,
+    to_geoparquet,
+    from_geoparquet,
+)
+from geofeather.sindex import PackedRTree, read_sindex
+from geofeather.stats import GeoFeatherStats, record_stats
+from geofeather.cache import GeoFeatherCache
+from geofeather.shared import SharedGeoFeather, attach_geofeather, publish_geofeather
+from geofeather.convert import convert_geofeather
@@ -0,0 +1,173 @@
+"""Asyncio versions of the geofeather read and write functions.
+
+Each function runs the corresponding blocking function in an executor, so that
+reading, writing, encoding, and decoding do not block the event loop.  By
+default, the default executor of the event loop is used; pass a
+concurrent.futures.ThreadPoolExecutor to bound the number of files read or
+written at the same time:
+
+>>> executor = ThreadPoolExecutor(max_workers=4)
+>>> df = await from_geofeather("test.feather", executor=executor)
+
+Use run() to run other functions, e.g., geofeather.pygeos.from_geofeather, in
+an executor.
+"""
+
+import asyncio
+from functools import partial
+from threading import Lock
+
+from geofeather import core
+
+# maximum number of batches read ahead of the consumer by iter_geofeather
+MAX_PENDING = 2
+
+
+async def run(func, *args, executor=None, **kwargs):
+    """Run a blocking function in an executor.
+
+    Parameters
+    ----------
+    func : callable
+    *args, **kwargs
+        passed to func
+    executor : concurrent.futures.Executor, optional (default: None)
+        If not provided, the default executor of the event loop is used.
+
+    Returns
+    -------
+    result of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+async def to_geofeather(df, path, executor=None, **kwargs):
+    """Serialize a geopandas GeoDataFrame to a feather file in an executor.
+
+    Parameters
+    ----------
+    df : geopandas.GeoDataFrame
+    path : str
+    executor : concurrent.futures.Executor, optional (default: None)
+        If not provided, the default executor of the event loop is used.
+    **kwargs
+        See geofeather.to_geofeather.
+    """
+    await run(core.to_geofeather, df, path, executor=executor, **kwargs)
+
+
+async def from_geofeather(path, executor=None, **kwargs):
+    """Deserialize a geopandas GeoDataFrame from a feather file in an executor.
+
+    Parameters
+    ----------
+    path : str
+    executor : concurrent.futures.Executor, optional (default: None)
+        If not provided, the default executor of the event loop is used.
+    **kwargs
+        See geofeather.from_geofeather.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+    """
+    return await run(core.from_geofeather, path, executor=executor, **kwargs)
+
+
+async def read_geofeather_dataset(paths, executor=None, **kwargs):
+    """Deserialize multiple feather files into a single geopandas GeoDataFrame
+    in an executor.
+
+    Parameters
+    ----------
+    paths : str or list-like of str
+    executor : concurrent.futures.Executor, optional (default: None)
+        If not provided, the default executor of the event loop is used.
+    **kwargs
+        See geofeather.read_geofeather_dataset.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+    """
+    return await run(core.read_geofeather_dataset, paths, executor=executor, **kwargs)
+
+
+async def iter_geofeather(
+    path, max_pending=MAX_PENDING, executor=None, iter_func=None, **kwargs
+):
+    """Deserialize a feather file into geopandas GeoDataFrames, one record batch
+    at a time, in an executor.
+
+    Batches are read and decoded ahead of the consumer, but at most max_pending
+    batches are held until the consumer is ready for them; reading pauses until
+    then.
+
+    Parameters
+    ----------
+    path : str
+    max_pending : int, optional (default: 2)
+        maximum number of batches read ahead of the consumer
+    executor : concurrent.futures.Executor, optional (default: None)
+        If not provided, the default executor of the event loop is used.
+    iter_func : callable, optional (default: geofeather.iter_geofeather)
+        Function used to read batches, e.g., geofeather.pygeos.iter_geofeather.
+    **kwargs
+        See geofeather.iter_geofeather.
+
+    Yields
+    ------
+    geopandas.GeoDataFrame
+    """
+    loop = asyncio.get_running_loop()
+    batches = (iter_func or core.iter_geofeather)(path, **kwargs)
+
+    # the generator must not be advanced and closed at the same time by
+    # different threads of the executor
+    lock = Lock()
+    done = object()
+
+    def read_next():
+        with lock:
+            return next(batches, done)
+
+    def close():
+        with lock:
+            batches.close()
+
+    queue = asyncio.Queue(maxsize=max_pending)
+
+    async def produce():
+        try:
+            while True:
+                df = await loop.run_in_executor(executor, read_next)
+                # waits while max_pending batches are waiting for the consumer
+                await queue.put(df)
+                if df is done:
+                    break
+
+        except Exception as ex:
+            await queue.put(ex)
+
+    producer = loop.create_task(produce())
+
+    try:
+        while True:
+            df = await queue.get()
+            if df is done:
+                break
+
+            if isinstance(df, Exception):
+                raise df
+
+            yield df
+
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+        await loop.run_in_executor(executor, close)
@@ -0,0 +1,203 @@
+"""In-process cache of DataFrames read from feather files.
+
+Results are keyed by the path, size, and modification time of the file, and the
+columns, bbox, lite, and filters options used to read it, so that files that
+have changed on disk are read again.  The least recently used results are evicted
+once the estimated memory used by cached results exceeds a budget.
+"""
+
+from collections import OrderedDict
+import os
+from threading import Lock
+
+import numpy as np
+from geopandas import GeoDataFrame
+from pandas.compat._optional import import_optional_dependency
+
+from geofeather.core import from_geofeather
+from geofeather.lazy import LazyGeometryArray
+
+# default memory budget of a cache: 1 GiB
+MAX_BYTES = 1 << 30
+
+# estimated memory used by each geometry object and each of its coordinates
+GEOMETRY_BYTES = 100
+COORDINATE_BYTES = 24
+
+
+def _sizeof(df):
+    """Estimate the memory used by a DataFrame, including its geometries.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        may contain a "geometry" column of shapely or pygeos geometries
+
+    Returns
+    -------
+    int
+    """
+    size = df.drop(columns=["geometry"], errors="ignore").memory_usage(
+        index=True, deep=True
+    )
+
+    if "geometry" not in df.columns:
+        return int(size.sum())
+
+    if isinstance(df["geometry"].array, LazyGeometryArray):
+        # geometries decoded later are not included
+        return int(size.sum() + df["geometry"].array.nbytes)
+
+    if isinstance(df, GeoDataFrame):
+        lib = import_optional_dependency("shapely")
+    else:
+        lib = import_optional_dependency("pygeos")
+
+    geometry = np.asarray(df["geometry"].values, dtype=object)
+    num_coords = lib.get_num_coordinates(geometry).sum()
+
+    return int(
+        size.sum() + GEOMETRY_BYTES * len(geometry) + COORDINATE_BYTES * num_coords
+    )
+
+
+def _view(df):
+    """Copy a cached DataFrame, so that modifying the copy in place does not
+    modify the cache.
+
+    Only references to geometries are copied; geometries are immutable, so
+    they are shared with the cache.  Copies of lazy geometry arrays share
+    decoded geometries with the cache until geometries are set.
+    """
+    view = df.copy()
+
+    # crs attribute of DataFrames containing pygeos geometries is not copied
+    if not isinstance(df, GeoDataFrame) and hasattr(df, "crs"):
+        view.crs = df.crs
+
+    return view
+
+
+class GeoFeatherCache(object):
+    """Least recently used cache of DataFrames read from feather files.
+
+    Cached DataFrames are returned as copies, so returned DataFrames can be
+    modified, including in place, without modifying the cache.  Geometries are
+    not copied; they are immutable, so they are shared with the cache.
+
+    The cache is safe to use from multiple threads.
+
+    Parameters
+    ----------
+    max_bytes : int, optional (default: 1 GiB)
+        Memory budget of the cache.  Memory used by each DataFrame is estimated
+        from its columns and the number of coordinates of its geometries.
+        DataFrames larger than this are not cached.
+    read : callable, optional (default: geofeather.from_geofeather)
+        Function used to read files, e.g., geofeather.pygeos.from_geofeather.
+
+    Attributes
+    ----------
+    size : int
+        estimated memory used by cached DataFrames in bytes
+    hits : int
+        number of reads returned from the cache
+    misses : int
+        number of reads that read the file
+
+    Examples
+    --------
+    >>> cache = GeoFeatherCache(max_bytes=512 * 1024 * 1024)
+    >>> df = cache.from_geofeather("admin.feather", columns=["name", "geometry"])
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES, read=from_geofeather):
+        self.max_bytes = max_bytes
+        self.read = read
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def from_geofeather(
+        self, path, columns=None, bbox=None, lite=None, filters=None, **kwargs
+    ):
+        """Read a feather file, or return the cached result of reading it.
+
+        Parameters
+        ----------
+        path : str
+            path to feather file to read
+        columns : list-like (optional, default: None)
+        bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        lite : str, optional (default: None)
+        filters : list of tuples or list of lists of tuples, optional (default: None)
+            See from_geofeather.
+        **kwargs
+            Other options passed to the read function (e.g., memory_map or
+            threads).  Except for lazy, these do not change the result, so are
+            not part of the key of cached results.  Geometries that are decoded
+            by lazy results are cached along with them.
+
+        Returns
+        -------
+        geopandas.GeoDataFrame or pandas.DataFrame
+        """
+        path = os.path.abspath(str(path))
+        stat = os.stat(path)
+
+        key = (
+            path,
+            stat.st_size,
+            stat.st_mtime_ns,
+            tuple(columns) if columns is not None else None,
+            tuple(float(v) for v in bbox) if bbox is not None else None,
+            lite,
+            repr(filters) if filters is not None else None,
+            # lazy results are DataFrames instead of GeoDataFrames
+            bool(kwargs.get("lazy")),
+        )
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _view(self._entries[key][0])
+
+            self.misses += 1
+
+        if filters is not None:
+            kwargs["filters"] = filters
+
+        df = self.read(path, columns=columns, bbox=bbox, lite=lite, **kwargs)
+        size = _sizeof(df)
+
+        with self._lock:
+            # results for previous versions of the file are stale
+            for stale in [
+                k for k in self._entries if k[0] == path and k[1:3] != key[1:3]
+            ]:
+                self._remove(stale)
+
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (df, size)
+                self.size += size
+
+                while self.size > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+
+        return _view(df)
+
+    def _remove(self, key):
+        _, size = self._entries.pop(key)
+        self.size -= size
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
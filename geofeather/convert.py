@@ -0,0 +1,233 @@
+"""Convert feather files written by geofeather to the feather or parquet files
+written by geopandas (GeoDataFrame.to_feather / to_parquet), which can be read
+with geopandas.read_feather / read_parquet.
+
+WKB geometries are copied as is, one record batch at a time, and the CRS and
+geometry metadata are rewritten as "geo" metadata; geometries are never
+decoded.
+
+Convert files from the command line with:
+
+$ python -m geofeather.convert --format parquet --output-dir out/ *.feather
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from geofeather.core import (
+    BBOX_COLUMN,
+    GEO_METADATA_KEY,
+    METADATA_KEY,
+    _geo_metadata,
+    _get_metadata,
+    _read_crs,
+    _write_options,
+)
+from geofeather.stats import GeoFeatherStats
+
+FORMATS = ("feather", "parquet")
+
+
+def _convert_schema(schema, geo_metadata):
+    """Create the schema of a converted file.
+
+    The legacy "wkb" column is renamed to "geometry", the "bbox" column is
+    removed, and the geofeather metadata is replaced by "geo" metadata.
+
+    Parameters
+    ----------
+    schema : pyarrow.Schema
+    geo_metadata : dict
+
+    Returns
+    -------
+    tuple of (pyarrow.Schema, list of int)
+        schema and indexes of the columns of the source file that are kept
+    """
+    indexes = [i for i, name in enumerate(schema.names) if name != BBOX_COLUMN]
+    fields = [schema.field(i) for i in indexes]
+    fields = [
+        field.with_name("geometry") if field.name == "wkb" else field
+        for field in fields
+    ]
+
+    schema_metadata = {
+        k: v for k, v in (schema.metadata or {}).items() if k != METADATA_KEY
+    }
+    schema_metadata[GEO_METADATA_KEY] = json.dumps(geo_metadata).encode("UTF-8")
+
+    return pa.schema(fields, metadata=schema_metadata), indexes
+
+
+def convert_geofeather(src, dst, format="feather", compression=None):
+    """Convert a feather file written by geofeather to a feather or parquet file
+    that can be read by geopandas.read_feather or geopandas.read_parquet.
+
+    Geometries are not decoded: WKB geometries are copied one record batch at a
+    time, so only one record batch is held in memory.  The CRS (including from
+    a .crs file for files created with geofeather < 0.5) is stored in the "geo"
+    metadata used by geopandas.  Stored bounds and spatial indexes are not
+    converted.
+
+    Parameters
+    ----------
+    src : str
+        path to feather file written by geofeather; geometries must be stored
+        as WKB
+    dst : str
+        path to file to write
+    format : str, optional (default: "feather")
+        "feather" or "parquet".  Each record batch is written to a parquet file
+        as a row group.
+    compression : str, optional (default: None)
+        Compression codec.  If not provided, "lz4" is used for feather files if
+        available, and "snappy" for parquet files.
+
+    Returns
+    -------
+    GeoFeatherStats
+        rows, file_size (of src), arrow_bytes, and duration of the conversion
+    """
+    if format not in FORMATS:
+        raise ValueError("format must be one of {}".format(", ".join(FORMATS)))
+
+    if os.path.abspath(str(src)) == os.path.abspath(str(dst)):
+        raise ValueError("src and dst must be different files")
+
+    stats = GeoFeatherStats("convert_geofeather", str(src))
+    start = time.perf_counter()
+
+    with pa.memory_map(str(src)) as source:
+        reader = pa.ipc.open_file(source)
+        metadata = _get_metadata(reader.schema)
+
+        encoding = metadata.get("encoding", "wkb")
+        if encoding != "wkb":
+            raise ValueError(
+                "{} stores geometries with {} encoding; only WKB geometries can "
+                "be converted without decoding them".format(src, encoding)
+            )
+
+        geo_metadata = _geo_metadata(metadata, _read_crs(src, metadata))
+        schema, indexes = _convert_schema(reader.schema, geo_metadata)
+
+        if format == "feather":
+            writer = pa.ipc.new_file(
+                str(dst), schema, options=_write_options(compression)
+            )
+        else:
+            writer = pq.ParquetWriter(
+                str(dst), schema, compression=compression or "snappy"
+            )
+
+        rows = 0
+        arrow_bytes = 0
+        with writer:
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                batch = pa.RecordBatch.from_arrays(
+                    [batch.column(index) for index in indexes], schema=schema
+                )
+                writer.write_batch(batch)
+                rows += batch.num_rows
+                arrow_bytes += batch.nbytes
+
+    stats.duration = time.perf_counter() - start
+    stats.rows = rows
+    stats.file_size = os.path.getsize(str(src))
+    stats.arrow_bytes = arrow_bytes
+
+    return stats
+
+
+def _output_path(path, output_dir, format):
+    name = os.path.splitext(os.path.basename(str(path)))[0]
+    return os.path.join(output_dir, "{}.{}".format(name, format))
+
+
+def _throughput(stats):
+    duration = stats.duration or 1e-9
+    return "{:,} rows, {:.1f} MB in {:.2f}s ({:,.0f} rows/s, {:.1f} MB/s)".format(
+        stats.rows,
+        stats.file_size / 1e6,
+        stats.duration,
+        stats.rows / duration,
+        stats.file_size / 1e6 / duration,
+    )
+
+
+def main(argv=None):
+    """Convert feather files from the command line; see --help."""
+    parser = argparse.ArgumentParser(
+        prog="python -m geofeather.convert",
+        description="Convert feather files written by geofeather to feather or "
+        "parquet files that can be read by geopandas, without decoding "
+        "geometries.",
+    )
+    parser.add_argument("paths", nargs="+", help="feather files to convert")
+    parser.add_argument(
+        "-o", "--output-dir", required=True, help="directory to write files"
+    )
+    parser.add_argument("-f", "--format", choices=FORMATS, default="feather")
+    parser.add_argument("-c", "--compression", default=None)
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of files to convert at the same time (default: based on the "
+        "number of CPUs)",
+    )
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    outputs = [_output_path(path, args.output_dir, args.format) for path in args.paths]
+    if len(set(outputs)) < len(outputs):
+        parser.error("paths must have different file names")
+
+    def convert(paths):
+        src, dst = paths
+        return convert_geofeather(
+            src, dst, format=args.format, compression=args.compression
+        )
+
+    start = time.perf_counter()
+    total = GeoFeatherStats("convert_geofeather", list(args.paths))
+    total.rows = 0
+    total.file_size = 0
+    errors = 0
+
+    # pyarrow releases the GIL while reading, compressing, and writing, so
+    # files are converted concurrently in threads
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            (src, dst, executor.submit(convert, (src, dst)))
+            for src, dst in zip(args.paths, outputs)
+        ]
+        for src, dst, future in futures:
+            try:
+                stats = future.result()
+            except Exception as ex:
+                errors += 1
+                print("{}: {}".format(src, ex), file=sys.stderr)
+                continue
+
+            total.rows += stats.rows
+            total.file_size += stats.file_size
+            print("{} -> {}: {}".format(src, dst, _throughput(stats)))
+
+    total.duration = time.perf_counter() - start
+    print("converted {} files: {}".format(len(futures) - errors, _throughput(total)))
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
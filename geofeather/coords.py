@@ -0,0 +1,456 @@
+"""Encoding of geometries as Arrow arrays of coordinates.
+
+This is an alternative to storing geometries as WKB.  Geometries of a single type
+are stored following the "separated" GeoArrow layout: coordinates are stored in a
+struct array of contiguous float64 arrays ("x", "y", and optionally "z"), nested
+within list arrays whose offsets identify the coordinates of each ring, part, and
+geometry.
+
+Points are stored directly as a struct of coordinates, and are thus stored as two
+(or three) float64 arrays.
+
+Coordinates may optionally be quantized to a grid: these are stored as int32
+values of (coordinate - offset) / scale.  Within each innermost part (e.g., ring
+or linestring), x and y values after the first are stored as the difference from
+the previous value (delta encoding), so that they are small and compress well.
+Each part is decoded independently, so that record batches can be decoded
+separately.
+
+The functions here operate using a geometry module that provides the vectorized
+geometry functions shared by ``pygeos`` and ``shapely`` >= 2.0.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+DIMENSIONS = ("x", "y", "z")
+
+# geometry type ids supported by each encoding.  Single part geometries are
+# promoted to their multi part equivalents where both are present.
+ENCODING_TYPE_IDS = {
+    "point": {0},
+    "linestring": {1},
+    "polygon": {3},
+    "multipoint": {0, 4},
+    "multilinestring": {1, 5},
+    "multipolygon": {3, 6},
+}
+
+ENCODINGS = tuple(ENCODING_TYPE_IDS.keys())
+
+# multi part encoding of each single part encoding, which can also store the
+# single part geometries
+MULTI_PART_ENCODINGS = {
+    "point": "multipoint",
+    "linestring": "multilinestring",
+    "polygon": "multipolygon",
+}
+
+# quantized values are stored as int32; NaN values (e.g., coordinates of empty
+# points) are stored as the minimum int32 value
+QUANTIZED_NAN = np.iinfo("int32").min
+QUANTIZED_MAX = np.iinfo("int32").max
+
+# offsets of Arrow list arrays are stored as int32
+OFFSET_MAX = np.iinfo("int32").max
+
+# functions used to split geometries of each encoding into their nested
+# components, from outermost to innermost; coordinates are extracted from the
+# innermost components
+NESTING = {
+    "point": [],
+    "linestring": [],
+    "polygon": ["get_rings"],
+    "multipoint": [],
+    "multilinestring": ["get_parts"],
+    "multipolygon": ["get_parts", "get_rings"],
+}
+
+# functions and empty geometries used to construct geometries of each encoding
+# from their nested components, from innermost to outermost
+CONSTRUCTORS = {
+    "linestring": [("linestrings", "LINESTRING EMPTY")],
+    "polygon": [("linearrings", "LINEARRING EMPTY"), ("polygons", "POLYGON EMPTY")],
+    "multipoint": [("multipoints", "MULTIPOINT EMPTY")],
+    "multilinestring": [
+        ("linestrings", "LINESTRING EMPTY"),
+        ("multilinestrings", "MULTILINESTRING EMPTY"),
+    ],
+    "multipolygon": [
+        ("linearrings", "LINEARRING EMPTY"),
+        ("polygons", "POLYGON EMPTY"),
+        ("multipolygons", "MULTIPOLYGON EMPTY"),
+    ],
+}
+
+
+def get_encoding(geometries, lib):
+    """Determine the coordinate encoding for an array of geometries.
+
+    Parameters
+    ----------
+    geometries : ndarray of geometry objects
+    lib : module
+        geometry module (pygeos or shapely >= 2.0)
+
+    Returns
+    -------
+    str
+        one of ENCODINGS
+    """
+    type_ids = set(np.unique(lib.get_type_id(geometries))) - {-1}
+
+    for encoding, encoding_type_ids in ENCODING_TYPE_IDS.items():
+        if type_ids.issubset(encoding_type_ids):
+            return encoding
+
+    raise ValueError(
+        "coordinate encoding requires geometries of a single type (or single and multi part geometries of the same type), "
+        "geometry collections and linear rings are not supported; use WKB encoding instead"
+    )
+
+
+def _offsets(index, size):
+    """Convert an array of parent indexes into an array of offsets.
+
+    Parameters
+    ----------
+    index : ndarray of int
+        index of the parent of each item; must be sorted
+    size : int
+        number of parents
+
+    Returns
+    -------
+    ndarray of int32
+    """
+    # index is sorted, so the last offset is the number of items
+    if len(index) > OFFSET_MAX:
+        raise ValueError(
+            "too many parts or coordinates to encode in one array ({:,}); use WKB "
+            "encoding or write smaller chunks with GeoFeatherWriter".format(len(index))
+        )
+
+    offsets = np.zeros(size + 1, dtype="int32")
+    np.cumsum(np.bincount(index, minlength=size), out=offsets[1:])
+    return offsets
+
+
+def quantize_offset(geometries, lib, scale):
+    """Calculate the offset used to quantize coordinates.
+
+    This is the center of the bounds of all coordinates, aligned to the grid,
+    so that quantized values are centered on zero.
+
+    Parameters
+    ----------
+    geometries : ndarray of geometry objects
+    lib : module
+        geometry module (pygeos or shapely >= 2.0)
+    scale : float
+        size of grid cells
+
+    Returns
+    -------
+    list of float
+        offset of each dimension (x, y, z)
+    """
+    coords = lib.get_coordinates(np.asarray(geometries, dtype=object), include_z=True)
+    offset = []
+    for values in coords.T:
+        values = values[~np.isnan(values)]
+        center = (values.min() + values.max()) / 2 if len(values) else 0
+        offset.append(float(np.round(center / scale) * scale))
+
+    return offset
+
+
+def _quantize(values, scale, offset):
+    """Quantize coordinate values to int32.
+
+    Parameters
+    ----------
+    values : ndarray of float64
+    scale : float
+    offset : float
+
+    Returns
+    -------
+    ndarray of int64
+        NaN values are QUANTIZED_NAN
+    """
+    values = np.round((values - offset) / scale)
+    missing = np.isnan(values)
+    if (np.abs(values[~missing]) > QUANTIZED_MAX).any():
+        raise ValueError(
+            "coordinates are too far from the offset to be quantized to int32 at precision {}; "
+            "use a larger precision".format(scale)
+        )
+
+    values[missing] = QUANTIZED_NAN
+    return values.astype("int64")
+
+
+def _dequantize(values, scale, offset):
+    """Convert quantized int values to coordinate values."""
+    out = values * scale + offset
+    out[values == QUANTIZED_NAN] = np.nan
+    return out
+
+
+def _starts(offsets, size):
+    """Create a mask of the first value of each part identified by offsets."""
+    starts = np.zeros(size, dtype="bool")
+    starts[offsets[:-1][np.diff(offsets) > 0]] = True
+    return starts
+
+
+def _delta_encode(values, starts):
+    """Delta encode values, restarting at the start of each part."""
+    deltas = values.copy()
+    deltas[1:] -= values[:-1]
+    deltas[starts] = values[starts]
+
+    if (np.abs(deltas) > QUANTIZED_MAX).any():
+        raise ValueError(
+            "distance between consecutive coordinates is too large to be quantized to int32; "
+            "use a larger precision"
+        )
+
+    return deltas
+
+
+def _delta_decode(deltas, starts):
+    """Decode delta encoded values, restarting at the start of each part."""
+    deltas = deltas.astype("int64")
+    values = np.cumsum(deltas)
+    # subtract the cumulative sum of all previous parts from each part
+    before = (values - deltas)[starts]
+    return values - before[np.cumsum(starts) - 1]
+
+
+def _coords_to_arrow(coords, mask=None, quantize=None, offsets=None):
+    """Convert an array of coordinates to an Arrow struct array.
+
+    Parameters
+    ----------
+    coords : ndarray of shape (n, ndim)
+    mask : pyarrow.BooleanArray, optional (default: None)
+        True where values are null
+    quantize : dict, optional (default: None)
+        "scale" and "offset" used to quantize coordinates
+    offsets : ndarray of int, optional (default: None)
+        offsets of the innermost parts of the coordinates; if provided with
+        quantize, x and y values are delta encoded within each part
+
+    Returns
+    -------
+    pyarrow.StructArray
+    """
+    ndim = coords.shape[1]
+    arrays = [coords[:, i] for i in range(ndim)]
+
+    if quantize is not None:
+        arrays = [
+            _quantize(values, quantize["scale"], quantize["offset"][i])
+            for i, values in enumerate(arrays)
+        ]
+
+        if offsets is not None:
+            starts = _starts(offsets, len(coords))
+            arrays[:2] = [_delta_encode(values, starts) for values in arrays[:2]]
+
+        arrays = [values.astype("int32") for values in arrays]
+
+    return pa.StructArray.from_arrays(
+        [pa.array(values) for values in arrays],
+        names=DIMENSIONS[:ndim],
+        mask=mask,
+    )
+
+
+def _coords_from_arrow(array, quantize=None, offsets=None):
+    """Convert an Arrow struct array to an array of coordinates.
+
+    Parameters
+    ----------
+    array : pyarrow.StructArray
+    quantize : dict, optional (default: None)
+        "scale" and "offset" used to quantize coordinates
+    offsets : ndarray of int, optional (default: None)
+        offsets of the innermost parts of the coordinates; must be provided if
+        x and y values were delta encoded
+
+    Returns
+    -------
+    ndarray of shape (n, ndim)
+    """
+    fields = array.flatten()
+
+    if quantize is None:
+        arrays = [field.to_numpy(zero_copy_only=False) for field in fields]
+
+    else:
+        # fields of missing geometries are null
+        arrays = [
+            field.fill_null(QUANTIZED_NAN).to_numpy().astype("int64")
+            for field in fields
+        ]
+
+        if offsets is not None:
+            starts = _starts(offsets, len(array))
+            arrays[:2] = [_delta_decode(values, starts) for values in arrays[:2]]
+
+        arrays = [
+            _dequantize(values, quantize["scale"], quantize["offset"][i])
+            for i, values in enumerate(arrays)
+        ]
+
+    return np.column_stack(arrays)
+
+
+def to_arrow(geometries, lib, encoding=None, quantize=None):
+    """Encode an array of geometries into an Arrow array of coordinates.
+
+    Parameters
+    ----------
+    geometries : ndarray of geometry objects
+    lib : module
+        geometry module (pygeos or shapely >= 2.0)
+    encoding : str, optional (default: None)
+        one of ENCODINGS; if not provided, it is determined from the geometries
+    quantize : dict, optional (default: None)
+        If provided, coordinates are quantized using "scale" (size of grid
+        cells) and "offset" (list of offset of each dimension; see
+        quantize_offset).
+
+    Returns
+    -------
+    tuple of (pyarrow.Array, str)
+        encoded array and encoding
+    """
+    geometries = np.asarray(geometries, dtype=object)
+
+    if encoding is None:
+        encoding = get_encoding(geometries, lib)
+
+    else:
+        type_ids = set(np.unique(lib.get_type_id(geometries))) - {-1}
+        if not type_ids.issubset(ENCODING_TYPE_IDS[encoding]):
+            raise ValueError(
+                "geometries are not compatible with {} encoding".format(encoding)
+            )
+
+    missing = lib.is_missing(geometries)
+    include_z = bool(lib.has_z(geometries).any())
+    mask = pa.array(missing) if missing.any() else None
+
+    if encoding == "point":
+        coords, index = lib.get_coordinates(
+            geometries, include_z=include_z, return_index=True
+        )
+        # empty points have no coordinates, these are stored as NaN
+        values = np.full((len(geometries), 3 if include_z else 2), np.nan)
+        values[index] = coords
+        return _coords_to_arrow(values, mask=mask, quantize=quantize), encoding
+
+    parts = geometries
+    offsets = []
+    for func in NESTING[encoding]:
+        size = len(parts)
+        parts, index = getattr(lib, func)(parts, return_index=True)
+        offsets.append(_offsets(index, size))
+
+    coords, index = lib.get_coordinates(parts, include_z=include_z, return_index=True)
+    offsets.append(_offsets(index, len(parts)))
+
+    array = _coords_to_arrow(coords, quantize=quantize, offsets=offsets[-1])
+    for i, level_offsets in enumerate(reversed(offsets)):
+        # only the outermost level contains missing values
+        level_mask = mask if i == len(offsets) - 1 else None
+        array = pa.ListArray.from_arrays(level_offsets, array, mask=level_mask)
+
+    return array, encoding
+
+
+def _build(lib, func, empty, values, offsets):
+    """Construct geometries from nested components identified by offsets."""
+    size = len(offsets) - 1
+    out = np.empty(size, dtype=object)
+    out[:] = lib.from_wkt(empty)
+
+    if len(values):
+        indices = np.repeat(np.arange(size), np.diff(offsets))
+        getattr(lib, func)(values, indices=indices, out=out)
+
+    return out
+
+
+def _from_arrow_array(array, encoding, lib, quantize=None):
+    if encoding == "point":
+        coords = _coords_from_arrow(array, quantize=quantize)
+        geometries = lib.points(coords)
+
+        # empty points are stored as NaN coordinates
+        empty = np.isnan(coords).all(axis=1)
+        if empty.any():
+            geometries[empty] = lib.from_wkt("POINT EMPTY")
+
+    else:
+        offsets = []
+        values = array
+        for _ in range(len(NESTING[encoding]) + 1):
+            level_offsets = values.offsets.to_numpy()
+            start, stop = level_offsets[0], level_offsets[-1]
+            offsets.append(level_offsets - start)
+            values = values.values.slice(start, stop - start)
+
+        coords = _coords_from_arrow(values, quantize=quantize, offsets=offsets[-1])
+
+        if encoding == "multipoint":
+            values = lib.points(coords)
+        else:
+            values = coords
+
+        for (func, empty), level_offsets in zip(
+            CONSTRUCTORS[encoding], reversed(offsets)
+        ):
+            values = _build(lib, func, empty, values, level_offsets)
+
+        geometries = values
+
+    if array.null_count:
+        geometries[array.is_null().to_numpy(zero_copy_only=False)] = None
+
+    return geometries
+
+
+def from_arrow(array, encoding, lib, quantize=None):
+    """Decode an Arrow array of coordinates into an array of geometries.
+
+    Parameters
+    ----------
+    array : pyarrow.Array or pyarrow.ChunkedArray
+    encoding : str
+        one of ENCODINGS
+    lib : module
+        geometry module (pygeos or shapely >= 2.0)
+    quantize : dict, optional (default: None)
+        "scale" and "offset" used to quantize coordinates; see to_arrow.
+
+    Returns
+    -------
+    ndarray of geometry objects
+    """
+    if isinstance(array, pa.ChunkedArray):
+        if array.num_chunks == 0:
+            return np.array([], dtype=object)
+
+        return np.concatenate(
+            [
+                _from_arrow_array(chunk, encoding, lib, quantize=quantize)
+                for chunk in array.chunks
+            ]
+        )
+
+    return _from_arrow_array(array, encoding, lib, quantize=quantize)
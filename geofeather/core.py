@@ -1,89 +1,1976 @@
 import json
 import os
+from glob import glob
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pyarrow.feather import read_table
 from geopandas import GeoDataFrame
-from geopandas.array import from_wkb
+from geopandas.array import GeometryArray, from_wkb
 
-from pandas import DataFrame
+try:
+    from geopandas.array import to_wkb
+except ImportError:  # pragma: no cover
+    # older versions of geopandas do not provide a vectorized WKB encoder
+    to_wkb = None
 
+from pandas import DataFrame, isna
+from pandas.compat._optional import import_optional_dependency
+from pyproj import CRS
 
-def _to_geofeather(df, path, crs):
+from geofeather import coords
+from geofeather.lazy import LazyGeometryArray
+from geofeather.stats import current_stats, instrument, phase
+from geofeather.sindex import (
+    PackedRTree,
+    hilbert_distance,
+    read_sindex,
+    remove_sindex,
+    write_sindex,
+)
+
+# key in the schema metadata of the feather file used to store geofeather metadata
+METADATA_KEY = b"geofeather"
+
+# supported encodings for the geometry column
+ENCODINGS = ("wkb", "geoarrow")
+
+# default maximum number of rows in each record batch, same as for feather files
+CHUNKSIZE = 64 * 1024
+
+# supported compression codecs, same as for feather files
+COMPRESSIONS = ("lz4", "zstd", "uncompressed")
+
+# name of the optional column containing the bounds of each geometry, and its fields
+BBOX_COLUMN = "bbox"
+BBOX_FIELDS = ("xmin", "ymin", "xmax", "ymax")
+
+# name of the file in the root directory of a partitioned dataset that lists
+# its partitions
+MANIFEST_FILENAME = "_manifest.json"
+
+# key in the schema metadata used by geopandas (GeoParquet) to store geometry
+# metadata
+GEO_METADATA_KEY = b"geo"
+
+# version of the GeoParquet specification of the "geo" metadata
+GEO_METADATA_VERSION = "1.0.0"
+
+# modes for reading stored bounds in place of geometries
+LITE_MODES = ("bounds", "center")
+
+# orders in which rows can be sorted before writing
+SORT_METHODS = ("hilbert",)
+
+# key in the custom metadata of each record batch used to store the bounds of
+# all geometries in that batch
+BATCH_BBOX_KEY = b"bbox"
+
+
+# names of geometry types, indexed by geometry type id
+GEOMETRY_TYPES = (
+    "Point",
+    "LineString",
+    "LinearRing",
+    "Polygon",
+    "MultiPoint",
+    "MultiLineString",
+    "MultiPolygon",
+    "GeometryCollection",
+)
+
+
+def _crs_to_json(crs):
+    """Convert a CRS to a JSON-serializable object.
+
+    Parameters
+    ----------
+    crs : pyproj.CRS, str, or dict
+
+    Returns
+    -------
+    dict or None
+    """
+    if not crs:
+        return None
+
+    # geopandas CRS is now pyproj.CRS object
+    if hasattr(crs, "to_wkt"):
+        return {"wkt": crs.to_wkt()}
+
+    # fallbackfor older versions
+    if isinstance(crs, str):
+        return {"proj4": crs}
+
+    return crs
+
+
+def _crs_equals(crs, other):
+    """Check if two CRS are the same.
+
+    Parameters
+    ----------
+    crs : pyproj.CRS, str, dict, or None
+    other : pyproj.CRS, str, dict, or None
+
+    Returns
+    -------
+    bool
+    """
+    if not crs or not other:
+        return not crs and not other
+
+    return CRS.from_user_input(crs) == CRS.from_user_input(other)
+
+
+def _crs_from_json(crs):
+    """Convert a CRS stored by _crs_to_json to a str or dict.
+
+    Parameters
+    ----------
+    crs : dict or None
+
+    Returns
+    -------
+    dict or str
+    """
+    if crs is not None:
+        if "wkt" in crs:
+            return crs["wkt"]
+        elif "proj4" in crs:
+            return crs["proj4"]
+
+    return crs
+
+
+def _bbox_to_arrow(bounds):
+    """Convert an array of bounds to an Arrow struct array.
+
+    Parameters
+    ----------
+    bounds : ndarray of shape (n, 4)
+        xmin, ymin, xmax, ymax of each geometry; NaN for missing or empty geometries
+
+    Returns
+    -------
+    pyarrow.StructArray
+        missing or empty geometries are null
+    """
+    missing = np.isnan(bounds).all(axis=1)
+
+    return pa.StructArray.from_arrays(
+        [pa.array(bounds[:, i]) for i in range(4)],
+        names=BBOX_FIELDS,
+        mask=pa.array(missing) if missing.any() else None,
+    )
+
+
+def _to_table(
+    df,
+    geometry=None,
+    encoding="wkb",
+    crs=None,
+    bounds=None,
+    preserve_index=None,
+    metadata=None,
+    schema=None,
+):
+    """Convert a pandas DataFrame to a pyarrow Table.
+
+    The geometry encoding and CRS are stored in the schema metadata.
+
+    df is not modified.  Attribute columns are converted by pyarrow, which does
+    not copy numeric columns without missing values, so the DataFrame does not
+    need to be copied in order to replace its "geometry" column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Must contain a column "geometry" with WKB-encoded geometry, unless
+        geometry is provided.
+    geometry : pyarrow.Array, optional (default: None)
+        encoded geometry data to write in place of the "geometry" column of df.
+    encoding : str, optional (default: "wkb")
+        encoding of the geometry data; either "wkb" or one of the coordinate
+        encodings in geofeather.coords.ENCODINGS.
+    crs : str or dict, optional (default: None)
+    bounds : ndarray of shape (n, 4), optional (default: None)
+        If provided, these are added as a "bbox" column after all other columns.
+    preserve_index : bool, optional (default: None)
+        passed to pyarrow.Table.from_pandas
+    metadata : dict, optional (default: None)
+        additional geofeather metadata to store in the schema metadata, e.g.,
+        "geometry_types" and "bbox"; see _geometry_metadata.
+    schema : pyarrow.Schema, optional (default: None)
+        types of the attribute columns, excluding "geometry".  If not
+        provided, these are inferred from df.  Only used if geometry is
+        provided.
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    if geometry is None:
+        table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+
+    else:
+        if schema is None:
+            table = pa.Table.from_pandas(
+                df,
+                columns=[c for c in df.columns if c != "geometry"],
+                preserve_index=preserve_index,
+            )
+        else:
+            table = pa.Table.from_pandas(
+                df, schema=schema, preserve_index=preserve_index
+            )
+        table = table.add_column(df.columns.get_loc("geometry"), "geometry", geometry)
+
+    if bounds is not None:
+        if BBOX_COLUMN in df.columns:
+            raise ValueError(
+                "'{}' column is reserved for geometry bounds".format(BBOX_COLUMN)
+            )
+
+        table = table.append_column(BBOX_COLUMN, _bbox_to_arrow(bounds))
+
+    geofeather_metadata = {"encoding": encoding, "crs": _crs_to_json(crs)}
+    geofeather_metadata.update(metadata or {})
+
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[METADATA_KEY] = json.dumps(geofeather_metadata).encode("UTF-8")
+
+    return table.replace_schema_metadata(schema_metadata)
+
+
+def _make_geometry_metadata(geometry_types, total_bounds):
+    """Create the metadata describing the geometries stored in a file.
+
+    Parameters
+    ----------
+    geometry_types : list-like of str
+        names of geometry types present, excluding missing geometries
+    total_bounds : ndarray of (xmin, ymin, xmax, ymax)
+        NaN if there are no non-empty geometries
+
+    Returns
+    -------
+    dict
+    """
+    return {
+        "geometry_types": sorted(geometry_types),
+        "bbox": (
+            None if np.isnan(total_bounds).any() else [float(v) for v in total_bounds]
+        ),
+    }
+
+
+def _geo_metadata(metadata, crs, bounds=False):
+    """Create the "geo" metadata used by geopandas from geofeather metadata.
+
+    Parameters
+    ----------
+    metadata : dict
+        geofeather metadata; see _get_metadata
+    crs : str or dict or None
+    bounds : bool, optional (default: False)
+        If True, the "bbox" column is listed as the covering of the geometry
+        column, as defined by GeoParquet 1.1.
+
+    Returns
+    -------
+    dict
+    """
+    column = {
+        "encoding": "WKB",
+        "crs": CRS.from_user_input(crs).to_json_dict() if crs else None,
+        # empty list if geometry types are not known
+        "geometry_types": sorted(metadata.get("geometry_types") or []),
+    }
+
+    if metadata.get("bbox") is not None:
+        column["bbox"] = metadata["bbox"]
+
+    if bounds:
+        column["covering"] = {
+            "bbox": {field: [BBOX_COLUMN, field] for field in BBOX_FIELDS}
+        }
+
+    return {
+        "primary_column": "geometry",
+        "columns": {"geometry": column},
+        "version": GEO_METADATA_VERSION,
+        "creator": {"library": "geofeather"},
+    }
+
+
+def _write_options(compression=None, compression_level=None):
+    """Options for writing feather files.
+
+    Parameters
+    ----------
+    compression : str, optional (default: None)
+        One of COMPRESSIONS.  If not provided, uses the same compression as the
+        default for feather files: "lz4" if available, otherwise "uncompressed".
+    compression_level : int, optional (default: None)
+        If not provided, uses the default level of the codec.
+
+    Returns
+    -------
+    pyarrow.ipc.IpcWriteOptions
+    """
+    if compression is None:
+        compression = "lz4" if pa.Codec.is_available("lz4_frame") else "uncompressed"
+
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            "compression must be one of {}".format(", ".join(COMPRESSIONS))
+        )
+
+    if compression == "uncompressed":
+        return pa.ipc.IpcWriteOptions(compression=None)
+
+    return pa.ipc.IpcWriteOptions(
+        compression=pa.Codec(compression, compression_level=compression_level)
+    )
+
+
+def _dictionary_encode(table, columns):
+    """Dictionary encode columns of a Table.
+
+    A single dictionary is used for all chunks of each column, since feather
+    files do not support replacing dictionaries between record batches.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    columns : list-like of str
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    for name in columns:
+        if name in ("geometry", BBOX_COLUMN) or name not in table.column_names:
+            raise ValueError("'{}' is not an attribute column".format(name))
+
+        index = table.column_names.index(name)
+        column = table.column(index)
+        if not pa.types.is_dictionary(column.type):
+            table = table.set_column(index, name, column.dictionary_encode())
+
+    return table
+
+
+def _write_table(writer, table, chunksize=None):
+    """Write a Table to an open Arrow IPC file writer in record batches.
+
+    If the table contains a "bbox" column, the bounds of all geometries in each
+    record batch are stored in the custom metadata of that batch.
+
+    Parameters
+    ----------
+    writer : pyarrow.ipc.RecordBatchFileWriter
+    table : pyarrow.Table
+    chunksize : int, optional (default: None)
+        maximum number of rows in each record batch; defaults to CHUNKSIZE.
+
+    Returns
+    -------
+    list of int
+        number of rows in each record batch
+    """
+    num_rows = []
+    for batch in table.to_batches(max_chunksize=chunksize or CHUNKSIZE):
+        metadata = None
+
+        if BBOX_COLUMN in table.column_names:
+            fields = batch.column(BBOX_COLUMN).flatten()
+            bbox = [
+                pc.min(fields[0]),
+                pc.min(fields[1]),
+                pc.max(fields[2]),
+                pc.max(fields[3]),
+            ]
+            # bbox is null if there are no non-empty geometries in this batch
+            bbox = None if not bbox[0].is_valid else [v.as_py() for v in bbox]
+            metadata = {BATCH_BBOX_KEY: json.dumps(bbox).encode("UTF-8")}
+
+        writer.write_batch(batch, custom_metadata=metadata)
+        num_rows.append(batch.num_rows)
+
+    return num_rows
+
+
+def _write_sindex(path, bounds, batch_rows):
+    """Build a spatial index from the bounds of geometries and write it to a
+    .sindex file associated with a feather file.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file
+    bounds : ndarray of shape (n, 4)
+    batch_rows : list of int
+        number of rows in each record batch of the feather file
+    """
+    tree = PackedRTree.build(bounds, batch_offsets=np.cumsum([0] + batch_rows).tolist())
+    write_sindex(tree, path)
+
+
+def _to_geofeather(
+    df,
+    path,
+    crs,
+    geometry=None,
+    encoding="wkb",
+    bounds=None,
+    sindex=False,
+    metadata=None,
+    compression=None,
+    compression_level=None,
+    chunksize=None,
+    dictionary_columns=None,
+    schema=None,
+):
     """Serializes a pandas DataFrame to a feather file on disk.
-    This also creates a .crs file with CRS information for this dataset.
+
+    The CRS and geometry encoding are stored in the schema metadata of the file.
+
+    Parameters
+    ----------
+    df : geopandas.GeoDataFrame
+        Must contain a column "geometry" with WKB-encoded geometry, unless
+        geometry is provided.
+    path : str
+        path to feather file to write
+    crs : str or dict
+    geometry : pyarrow.Array, optional (default: None)
+        encoded geometry data to write in place of the "geometry" column of df.
+    encoding : str, optional (default: "wkb")
+        encoding of the geometry data; either "wkb" or one of the coordinate
+        encodings in geofeather.coords.ENCODINGS.
+    bounds : ndarray of shape (n, 4), optional (default: None)
+        If provided, bounds of each geometry are stored in a "bbox" column, and
+        the bounds of each record batch are stored in its metadata.
+    sindex : bool, optional (default: False)
+        If True, a spatial index is built from bounds (which must be provided)
+        and stored in a .sindex file.  Otherwise, any existing .sindex file is
+        removed, since it would no longer match the feather file.
+    metadata : dict, optional (default: None)
+        additional geofeather metadata to store in the schema metadata.
+    compression : str, optional (default: None)
+    compression_level : int, optional (default: None)
+        See _write_options.
+    chunksize : int, optional (default: None)
+        maximum number of rows in each record batch; defaults to CHUNKSIZE.
+    dictionary_columns : list-like of str, optional (default: None)
+        attribute columns to dictionary encode.
+    schema : pyarrow.Schema, optional (default: None)
+        types of the attribute columns; see _to_table.
+    """
+
+    with phase("to_arrow"):
+        table = _to_table(
+            df,
+            geometry=geometry,
+            encoding=encoding,
+            crs=crs,
+            bounds=bounds,
+            metadata=metadata,
+            schema=schema,
+        )
+
+        if dictionary_columns:
+            table = _dictionary_encode(table, dictionary_columns)
+
+    with phase("write"):
+        options = _write_options(compression, compression_level)
+        with pa.ipc.new_file(str(path), table.schema, options=options) as writer:
+            batch_rows = _write_table(writer, table, chunksize=chunksize)
+
+    with phase("sindex"):
+        if sindex:
+            _write_sindex(path, bounds, batch_rows)
+        else:
+            remove_sindex(path)
+
+    stats = current_stats()
+    if stats is not None:
+        stats.file_size = os.path.getsize(str(path))
+        stats.arrow_bytes = table.nbytes
+
+
+def _to_geoparquet(
+    df,
+    path,
+    crs,
+    geometry=None,
+    encoding="wkb",
+    bounds=None,
+    metadata=None,
+    compression=None,
+    compression_level=None,
+    row_group_size=None,
+):
+    """Serializes a pandas DataFrame to a parquet file on disk.
+
+    The CRS and geometry encoding are stored in the schema metadata of the
+    file, same as for feather files.  For WKB geometries, "geo" metadata is
+    also stored so that the file can be read by geopandas.read_parquet.
+
+    Parameters
+    ----------
+    df : geopandas.GeoDataFrame
+        Must contain a column "geometry" with WKB-encoded geometry, unless
+        geometry is provided.
+    path : str
+        path to parquet file to write
+    crs : str or dict
+    geometry : pyarrow.Array, optional (default: None)
+        encoded geometry data to write in place of the "geometry" column of df.
+    encoding : str, optional (default: "wkb")
+    bounds : ndarray of shape (n, 4), optional (default: None)
+        If provided, bounds of each geometry are stored in a "bbox" column;
+        parquet stores the minimum and maximum of each of its fields for each
+        row group.
+    metadata : dict, optional (default: None)
+        additional geofeather metadata to store in the schema metadata.
+    compression : str, optional (default: None)
+        parquet compression codec; defaults to "snappy".
+    compression_level : int, optional (default: None)
+    row_group_size : int, optional (default: None)
+        maximum number of rows in each row group; defaults to CHUNKSIZE.
+    """
+
+    with phase("to_arrow"):
+        table = _to_table(
+            df,
+            geometry=geometry,
+            encoding=encoding,
+            crs=crs,
+            bounds=bounds,
+            metadata=metadata,
+        )
+
+        if encoding == "wkb":
+            schema_metadata = dict(table.schema.metadata)
+            schema_metadata[GEO_METADATA_KEY] = json.dumps(
+                _geo_metadata(metadata or {}, crs, bounds=bounds is not None)
+            ).encode("UTF-8")
+            table = table.replace_schema_metadata(schema_metadata)
+
+    with phase("write"):
+        pq.write_table(
+            table,
+            str(path),
+            row_group_size=row_group_size or CHUNKSIZE,
+            compression=compression or "snappy",
+            compression_level=compression_level,
+        )
+
+    stats = current_stats()
+    if stats is not None:
+        stats.file_size = os.path.getsize(str(path))
+        stats.arrow_bytes = table.nbytes
+
+
+def _check_precision(encoding, precision):
+    """Validate the precision used to quantize coordinates.
+
+    Parameters
+    ----------
+    encoding : str
+    precision : float or None
+    """
+    if precision is None:
+        return
+
+    if encoding == "wkb":
+        raise ValueError(
+            "precision requires a coordinate encoding, e.g., encoding='geoarrow'"
+        )
+
+    if not precision > 0:
+        raise ValueError("precision must be greater than 0")
+
+
+def _to_wkb(geometry):
+    """Encodes a GeoSeries to WKB.
+
+    Uses the vectorized encoder provided by geopandas where available, which
+    operates over the whole GeometryArray in a single call.  Otherwise falls back
+    to encoding each geometry individually.
+
+    Parameters
+    ----------
+    geometry : geopandas.GeoSeries
+
+    Returns
+    -------
+    numpy object array of bytes
+    """
+    if to_wkb is not None:
+        return to_wkb(geometry.values)
+
+    return geometry.apply(lambda g: g.wkb).values
+
+
+def _quantize(df, precision):
+    """Create the parameters used to quantize the coordinates of the shapely
+    geometries in the "geometry" column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    precision : float
+        size of grid cells
+
+    Returns
+    -------
+    dict
+        "scale" and "offset"; see geofeather.coords.to_arrow
+    """
+    shapely = import_optional_dependency(
+        "shapely",
+        extra="shapely >= 2.0 is required for geoarrow encoding.",
+        min_version="2.0",
+    )
+
+    return {
+        "scale": float(precision),
+        "offset": coords.quantize_offset(df.geometry.values, shapely, precision),
+    }
+
+
+def _encode_geometry(df, encoding="wkb", quantize=None):
+    """Encode the "geometry" column of a DataFrame containing shapely geometries.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    encoding : str, optional (default: "wkb")
+        "wkb", "geoarrow", or one of the coordinate encodings in
+        geofeather.coords.ENCODINGS
+    quantize : dict, optional (default: None)
+        parameters used to quantize coordinates; see _quantize.  Not supported
+        for "wkb".
+
+    Returns
+    -------
+    tuple of (pyarrow.Array, str)
+        encoded geometry and its encoding
+    """
+    if encoding == "wkb":
+        return pa.array(_to_wkb(df.geometry), type=pa.binary()), encoding
+
+    shapely = import_optional_dependency(
+        "shapely",
+        extra="shapely >= 2.0 is required for geoarrow encoding.",
+        min_version="2.0",
+    )
+    return coords.to_arrow(
+        df.geometry.values,
+        shapely,
+        encoding=None if encoding == "geoarrow" else encoding,
+        quantize=quantize,
+    )
+
+
+def _get_metadata(schema):
+    """Get the geofeather metadata stored in the schema metadata of a file.
+
+    Parameters
+    ----------
+    schema : pyarrow.Schema
+
+    Returns
+    -------
+    dict
+        empty for files created with geofeather < 0.5, which did not store
+        metadata
+    """
+    metadata = (schema.metadata or {}).get(METADATA_KEY)
+    return json.loads(metadata) if metadata else {}
+
+
+def _read_schema(path):
+    """Read the schema of a feather file, without reading its data.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    pyarrow.Schema
+    """
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def _read_crs(path, metadata=None):
+    """Read the CRS stored in the schema metadata of a feather file, or from
+    the .crs file associated with the feather file for files created with
+    geofeather < 0.5.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file
+    metadata : dict, optional (default: None)
+        geofeather metadata of the file; see _get_metadata
+
+    Returns
+    -------
+    dict or str
+        None if the file does not have a CRS
+    """
+    if metadata and "crs" in metadata:
+        return _crs_from_json(metadata["crs"])
+
+    crs = None
+    crsfilename = "{}.crs".format(path)
+    if os.path.exists(crsfilename):
+        crs = _crs_from_json(json.loads(open(crsfilename).read()))
+    else:
+        warnings.warn(
+            "{} coordinate reference system file is missing. No crs will be set for this GeoDataFrame.".format(
+                crsfilename
+            )
+        )
+
+    return crs
+
+
+def _legacy_columns(columns, names):
+    """Shim to support files created with geofeather 0.1.0, which stored geometry
+    in a "wkb" column instead of a "geometry" column.
+
+    Parameters
+    ----------
+    columns : list-like or None
+        columns requested by the caller
+    names : list-like
+        names of columns in the file
+
+    Returns
+    -------
+    list or None
+        columns to read from the file
+    """
+    if columns is not None and "geometry" in columns and "wkb" in names:
+        return ["wkb" if c == "geometry" else c for c in columns]
+
+    return columns
+
+
+def _rename_legacy(table):
+    """Shim to support files created with geofeather 0.1.0; renames the "wkb"
+    column to "geometry".
+    """
+    if "wkb" in table.column_names:
+        return table.rename_columns(
+            ["geometry" if c == "wkb" else c for c in table.column_names]
+        ).replace_schema_metadata(table.schema.metadata)
+
+    return table
+
+
+def _bbox_mask(bounds, bbox):
+    """Determine which bounds intersect a bounding box.
+
+    Parameters
+    ----------
+    bounds : pyarrow.StructArray
+        struct array of xmin, ymin, xmax, ymax
+    bbox : tuple of (xmin, ymin, xmax, ymax)
+
+    Returns
+    -------
+    pyarrow.BooleanArray
+        null where bounds are null
+    """
+    xmin, ymin, xmax, ymax = bounds.flatten()
+
+    return pc.and_(
+        pc.and_(pc.less_equal(xmin, bbox[2]), pc.greater_equal(xmax, bbox[0])),
+        pc.and_(pc.less_equal(ymin, bbox[3]), pc.greater_equal(ymax, bbox[1])),
+    )
+
+
+def _intersects_bbox(bounds, bbox):
+    """Determine which bounds intersect a bounding box.
+
+    Parameters
+    ----------
+    bounds : ndarray of shape (n, 4)
+    bbox : tuple of (xmin, ymin, xmax, ymax)
+
+    Returns
+    -------
+    ndarray of bool
+    """
+    bounds = np.asarray(bounds).reshape(-1, 4)
+
+    return (
+        (bounds[:, 0] <= bbox[2])
+        & (bounds[:, 2] >= bbox[0])
+        & (bounds[:, 1] <= bbox[3])
+        & (bounds[:, 3] >= bbox[1])
+    )
+
+
+def _filter_columns(columns, filters):
+    """Determine the columns that must be read to evaluate filters.
+
+    Parameters
+    ----------
+    columns : list-like or None
+        columns requested by the caller
+    filters : list of tuples or list of lists of tuples
+        See from_geofeather.
+
+    Returns
+    -------
+    tuple of (list or None, list)
+        columns to read, and columns that are only read to evaluate filters
+    """
+    if not filters:
+        raise ValueError("filters must not be empty")
+
+    if isinstance(filters[0], list):
+        # disjunction of conjunctions
+        names = [f[0] for conjunction in filters for f in conjunction]
+    else:
+        names = [f[0] for f in filters]
+
+    if "geometry" in names or BBOX_COLUMN in names:
+        raise ValueError("filters can only be used with attribute columns")
+
+    if columns is None:
+        return columns, []
+
+    extra = [c for c in dict.fromkeys(names) if c not in columns]
+    return list(columns) + extra, extra
+
+
+def _filter_table(table, filters, extra=None):
+    """Select the rows of a Table that match filters, using Arrow compute
+    kernels, before any columns are converted to pandas or decoded.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    filters : list of tuples or list of lists of tuples
+        See from_geofeather.
+    extra : list, optional (default: None)
+        columns that are only used to evaluate filters, which are removed from
+        the result; see _filter_columns.
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    table = table.filter(pq.filters_to_expression(filters))
+
+    if extra:
+        table = table.drop_columns(extra)
+
+    return table
+
+
+def _read_geofeather(path, columns=None, memory_map=False, bbox=None, filters=None):
+    """Read a pyarrow Table stored in a feather file.
+
+    The CRS is read from the schema metadata of the file, or from the
+    corresponding .crs file for files created with geofeather < 0.5.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file to read
+    columns : list-like (optional, default: None)
+        Subset of columns to read from the file.  If not provided, all columns are read.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it into memory.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided and the file contains a "bbox" column, only rows with bounds
+        that intersect bbox are read.  See _iter_geofeather.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        If provided, only rows that match filters are returned; see
+        from_geofeather.
+
+    Returns
+    -------
+    tuple of (pyarrow.Table, dict or str)
+        Table will contain a "geometry" column with encoded geometry data.
+        crs will be a dict or str depending on what was serialized.
+    """
+    if filters is not None:
+        columns, extra = _filter_columns(columns, filters)
+
+    with phase("read"):
+        if bbox is not None:
+            tables = list(
+                _iter_geofeather(
+                    path, columns=columns, memory_map=memory_map, bbox=bbox
+                )
+            )
+            if tables:
+                table = pa.concat_tables(tables)
+
+            else:
+                # no rows intersect bbox; return an empty table with the same columns
+                schema = _read_schema(path)
+                names = _legacy_columns(columns, schema.names) or schema.names
+                if BBOX_COLUMN in schema.names and BBOX_COLUMN not in names:
+                    names = list(names) + [BBOX_COLUMN]
+
+                schema = pa.schema(
+                    [schema.field(c) for c in names], metadata=schema.metadata
+                )
+                table = _rename_legacy(schema.empty_table())
+
+        else:
+            if columns is not None:
+                columns = _legacy_columns(columns, _read_schema(path).names)
+
+            table = _rename_legacy(
+                read_table(path, columns=columns, memory_map=memory_map)
+            )
+
+    stats = current_stats()
+    if stats is not None:
+        stats.file_size = os.path.getsize(str(path))
+        stats.arrow_bytes = table.nbytes
+
+    if filters is not None:
+        with phase("filter"):
+            table = _filter_table(table, filters, extra)
+
+    with phase("crs"):
+        crs = _read_crs(path, _get_metadata(table.schema))
+
+    return table, crs
+
+
+def _row_groups(parquet_file, bbox):
+    """Select the row groups of a parquet file that may intersect a bounding box,
+    based on the statistics of the fields of its "bbox" column.
+
+    Parameters
+    ----------
+    parquet_file : pyarrow.parquet.ParquetFile
+    bbox : tuple of (xmin, ymin, xmax, ymax)
+
+    Returns
+    -------
+    list of int
+    """
+    metadata = parquet_file.metadata
+    paths = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+    xmin, ymin, xmax, ymax = [
+        paths["{}.{}".format(BBOX_COLUMN, field)] for field in BBOX_FIELDS
+    ]
+
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        stats = [row_group.column(j).statistics for j in (xmin, ymin, xmax, ymax)]
+
+        if not all(s is not None and s.has_min_max for s in stats):
+            # no statistics (e.g., all bounds are null); filter rows instead
+            row_groups.append(i)
+            continue
+
+        if _intersects_bbox(
+            (stats[0].min, stats[1].min, stats[2].max, stats[3].max), bbox
+        )[0]:
+            row_groups.append(i)
+
+    return row_groups
+
+
+def _read_geoparquet(path, columns=None, bbox=None, filters=None):
+    """Read a pyarrow Table stored in a parquet file written by to_geoparquet.
+
+    Parameters
+    ----------
+    path : str
+        path to parquet file to read
+    columns : list-like (optional, default: None)
+        Subset of columns to read from the file.  If not provided, all columns are read.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided and the file contains a "bbox" column, row groups whose
+        bounds do not intersect bbox are skipped without reading them, and only
+        rows with bounds that intersect bbox are returned.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        If provided, only rows that match filters are returned; see
+        from_geofeather.
+
+    Returns
+    -------
+    tuple of (pyarrow.Table, dict or str)
+        Table will contain a "geometry" column with encoded geometry data, and
+        will also contain the "bbox" column if bbox is provided and it is
+        present in the file.
+    """
+    if filters is not None:
+        columns, extra = _filter_columns(columns, filters)
+
+    with phase("read"):
+        parquet_file = pq.ParquetFile(str(path))
+        names = parquet_file.schema_arrow.names
+
+        if bbox is not None and BBOX_COLUMN in names:
+            if columns is not None and BBOX_COLUMN not in columns:
+                columns = list(columns) + [BBOX_COLUMN]
+
+            table = parquet_file.read_row_groups(
+                _row_groups(parquet_file, bbox), columns=columns
+            )
+            table = table.filter(_bbox_mask(table.column(BBOX_COLUMN), bbox))
+
+        else:
+            table = parquet_file.read(columns=columns)
+
+    stats = current_stats()
+    if stats is not None:
+        stats.file_size = os.path.getsize(str(path))
+        stats.arrow_bytes = table.nbytes
+
+    if filters is not None:
+        with phase("filter"):
+            table = _filter_table(table, filters, extra)
+
+    with phase("crs"):
+        crs = _read_crs(path, _get_metadata(table.schema))
+
+    return table, crs
+
+
+def _has_bounds(path):
+    """Determine if a parquet file stores the bounds of each geometry."""
+    return BBOX_COLUMN in pq.read_schema(str(path)).names
+
+
+def _read_geoparquet_attributes(path, columns, bbox=None, filters=None):
+    """Read attribute columns from a parquet file without reading geometries.
+
+    Parameters
+    ----------
+    path : str
+        path to parquet file to read
+    columns : list-like
+        columns to read; must not include "geometry"
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only rows whose stored bounds intersect bbox are read; the
+        file must contain a "bbox" column.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        See from_geofeather.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    table, _ = _read_geoparquet(path, columns=columns, bbox=bbox, filters=filters)
+
+    if BBOX_COLUMN in table.column_names and BBOX_COLUMN not in columns:
+        table = table.drop_columns([BBOX_COLUMN])
+
+    with phase("to_pandas"):
+        return table.to_pandas()
+
+
+def _iter_geofeather(path, columns=None, batch_size=None, memory_map=False, bbox=None):
+    """Read pyarrow Tables from a feather file, one record batch at a time.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file to read; must be a feather V2 (Arrow IPC) file
+    columns : list-like (optional, default: None)
+        Subset of columns to read from the file.  If not provided, all columns are read.
+    batch_size : int, optional (default: None)
+        Maximum number of rows in each Table.  Record batches in the file that
+        are larger than this are split.  If not provided, each record batch is
+        returned as stored in the file.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided and the file contains a "bbox" column, record batches whose
+        bounds do not intersect bbox are skipped without reading their other
+        columns, and only rows with bounds that intersect bbox are returned.
+        If the file has a spatial index (.sindex file), it is used to select
+        these rows instead of scanning the "bbox" column.
+        Files without a "bbox" column are not filtered.
+
+    Yields
+    ------
+    pyarrow.Table
+        Table will contain a "geometry" column with encoded geometry data, and
+        will also contain the "bbox" column if bbox is provided and it is present
+        in the file.
+    """
+    source = pa.memory_map(str(path)) if memory_map else pa.OSFile(str(path))
+
+    with source:
+        names = pa.ipc.open_file(source).schema.names
+        use_bbox = bbox is not None and BBOX_COLUMN in names
+
+        options = None
+        if columns is not None:
+            columns = _legacy_columns(columns, names)
+            if use_bbox and BBOX_COLUMN not in columns:
+                columns = list(columns) + [BBOX_COLUMN]
+
+            options = pa.ipc.IpcReadOptions(
+                included_fields=[names.index(c) for c in columns]
+            )
+
+        reader = pa.ipc.open_file(source, options=options)
+
+        tree = read_sindex(path) if use_bbox else None
+        if (
+            tree is not None
+            and len(tree.batch_offsets) != reader.num_record_batches + 1
+        ):
+            warnings.warn(
+                "{}.sindex spatial index does not match the feather file and is ignored.".format(
+                    path
+                )
+            )
+            tree = None
+
+        if tree is not None:
+            # row positions (within the file) of rows that intersect bbox
+            ids = tree.query(bbox)
+            batch_offsets = tree.batch_offsets
+
+        elif use_bbox:
+            # only reads the bbox column and the metadata of each record batch
+            bbox_reader = pa.ipc.open_file(
+                source,
+                options=pa.ipc.IpcReadOptions(
+                    included_fields=[names.index(BBOX_COLUMN)]
+                ),
+            )
+
+        for i in range(reader.num_record_batches):
+            if tree is not None:
+                start, stop = np.searchsorted(
+                    ids, [batch_offsets[i], batch_offsets[i + 1]]
+                )
+                if start == stop:
+                    continue
+
+                indices = ids[start:stop] - batch_offsets[i]
+
+            elif use_bbox:
+                batch, metadata = bbox_reader.get_batch_with_custom_metadata(i)
+                if metadata is not None and BATCH_BBOX_KEY in metadata:
+                    batch_bbox = json.loads(metadata[BATCH_BBOX_KEY])
+                    if batch_bbox is None or not _intersects_bbox(batch_bbox, bbox)[0]:
+                        continue
+
+                mask = _bbox_mask(batch.column(0), bbox)
+                if not pc.any(mask).as_py():
+                    continue
+
+            table = _rename_legacy(pa.Table.from_batches([reader.get_batch(i)]))
+
+            if tree is not None:
+                table = table.take(indices)
+
+            elif use_bbox:
+                table = table.filter(mask)
+
+            if columns is not None:
+                # restore the order of columns requested by the caller
+                table = table.select(["geometry" if c == "wkb" else c for c in columns])
+
+            if batch_size is None or table.num_rows <= batch_size:
+                yield table
+
+            else:
+                for batch in table.to_batches(max_chunksize=batch_size):
+                    yield pa.Table.from_batches([batch])
+
+
+def _total_bounds(bounds):
+    """Calculate the total bounds of an array of bounds.
+
+    Parameters
+    ----------
+    bounds : ndarray of shape (n, 4)
+        NaN for missing or empty geometries
+
+    Returns
+    -------
+    list of [xmin, ymin, xmax, ymax] or None
+        None if there are no non-empty geometries
+    """
+    bounds = bounds[~np.isnan(bounds).any(axis=1)]
+    if len(bounds) == 0:
+        return None
+
+    return [
+        float(bounds[:, 0].min()),
+        float(bounds[:, 1].min()),
+        float(bounds[:, 2].max()),
+        float(bounds[:, 3].max()),
+    ]
+
+
+def _partition_key(key):
+    """Convert a partition key to a JSON-serializable value."""
+    if isinstance(key, tuple):
+        return [_partition_key(value) for value in key]
+
+    if isna(key):
+        return None
+
+    return key.item() if hasattr(key, "item") else key
+
+
+def _partition(df, bounds, partition_by=None, grid=None):
+    """Determine the rows in each partition of a DataFrame.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    bounds : ndarray of shape (n, 4)
+        bounds of each geometry
+    partition_by : str or list of str, optional (default: None)
+        column(s) used to partition rows
+    grid : float or tuple of (float, float), optional (default: None)
+        width and height of the tiles of a grid used to partition rows, based
+        on the center of the bounds of each geometry
+
+    Returns
+    -------
+    list of (key, ndarray of int)
+        key and row positions of each partition.  Keys of grid partitions are
+        [column, row] of the tile, or None for missing or empty geometries.
+    """
+    if (partition_by is None) == (grid is None):
+        raise ValueError("Exactly one of partition_by or grid must be provided")
+
+    if partition_by is not None:
+        groups = df.groupby(partition_by, sort=True, dropna=False).indices
+        return [(_partition_key(key), indices) for key, indices in groups.items()]
+
+    width, height = grid if np.iterable(grid) else (grid, grid)
+    tiles = DataFrame(
+        {
+            "x": np.floor((bounds[:, 0] + bounds[:, 2]) / 2 / width),
+            "y": np.floor((bounds[:, 1] + bounds[:, 3]) / 2 / height),
+        }
+    )
+    groups = tiles.groupby(["x", "y"], sort=True, dropna=False).indices
+
+    return [
+        (None if isna(x) else [int(x), int(y)], indices)
+        for (x, y), indices in groups.items()
+    ]
+
+
+def _to_geofeather_dataset(df, root, crs, write, bounds, partition_by=None, grid=None):
+    """Write each partition of a DataFrame to a feather file in a directory,
+    along with a manifest of the partitions.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    root : str
+        directory to write files; created if it does not exist
+    crs : str or dict
+    write : callable
+        function that writes a DataFrame to a path, given the types of its
+        attribute columns: write(df, path, schema)
+    bounds : ndarray of shape (n, 4)
+        bounds of each geometry
+    partition_by : str or list of str, optional (default: None)
+    grid : float or tuple of (float, float), optional (default: None)
+        See _partition.
+    """
+    root = str(root)
+    os.makedirs(root, exist_ok=True)
+
+    # infer the types of attribute columns from all rows, so that all partitions
+    # have the same schema even if a column only has missing values within some
+    # partitions
+    schema = pa.Schema.from_pandas(
+        df.drop(columns=["geometry"]), preserve_index=False
+    ).remove_metadata()
+
+    partitions = []
+    for i, (key, indices) in enumerate(
+        _partition(df, bounds, partition_by=partition_by, grid=grid)
+    ):
+        filename = "part-{:05d}.feather".format(i)
+        write(
+            df.iloc[indices].reset_index(drop=True),
+            os.path.join(root, filename),
+            schema,
+        )
+
+        partitions.append(
+            {
+                "path": filename,
+                "key": key,
+                "num_rows": len(indices),
+                "bbox": _total_bounds(bounds[indices]),
+            }
+        )
+
+    manifest = {
+        "crs": _crs_to_json(crs),
+        "partition_by": partition_by,
+        "grid": grid,
+        "partitions": partitions,
+    }
+    with open(os.path.join(root, MANIFEST_FILENAME), "w") as manifestfile:
+        manifestfile.write(json.dumps(manifest))
+
+
+def _manifest_paths(root, bbox=None):
+    """Get the paths of the partitions of a dataset from its manifest.
+
+    Parameters
+    ----------
+    root : str
+        directory containing the dataset
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, partitions whose bounds do not intersect bbox are excluded.
+        The first partition is always included so that its schema can be read.
+
+    Returns
+    -------
+    list of str
+    """
+    with open(os.path.join(root, MANIFEST_FILENAME)) as manifestfile:
+        partitions = json.loads(manifestfile.read())["partitions"]
+
+    paths = [
+        os.path.join(root, partition["path"])
+        for partition in partitions
+        if bbox is None
+        or (
+            partition["bbox"] is not None
+            and _intersects_bbox(partition["bbox"], bbox)[0]
+        )
+    ]
+
+    if not paths and partitions:
+        paths = [os.path.join(root, partitions[0]["path"])]
+
+    return paths
+
+
+def _expand_paths(paths, bbox=None):
+    """Expand a directory, glob pattern, or list of paths to feather files.
+
+    Parameters
+    ----------
+    paths : str or list-like of str
+        directory containing .feather files, glob pattern, or list of paths.  If
+        the directory contains a manifest written by to_geofeather_dataset,
+        only the partitions listed in the manifest are included.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, partitions listed in a manifest are excluded if their
+        bounds do not intersect bbox.
+
+    Returns
+    -------
+    list of str
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = str(paths)
+        if os.path.exists(os.path.join(paths, MANIFEST_FILENAME)):
+            return _manifest_paths(paths, bbox=bbox)
+
+        if os.path.isdir(paths):
+            paths = os.path.join(paths, "*.feather")
+
+        paths = sorted(glob(paths))
+
+    else:
+        paths = [str(path) for path in paths]
+
+    if not paths:
+        raise ValueError("No feather files found")
+
+    return paths
+
+
+def _read_geofeather_dataset(paths, columns=None, bbox=None, workers=None):
+    """Read pyarrow Tables from multiple feather files concurrently and
+    concatenate them.
+
+    Tables are concatenated without copying their data, so that decoding the
+    combined table allocates each column only once.
+
+    Parameters
+    ----------
+    paths : str or list-like of str
+        directory containing .feather files, glob pattern, or list of paths
+    columns : list-like (optional, default: None)
+        Subset of columns to read from each file.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        See _read_geofeather.
+    workers : int, optional (default: None)
+        maximum number of files read at the same time; defaults to the default
+        for concurrent.futures.ThreadPoolExecutor.
+
+    Returns
+    -------
+    tuple of (pyarrow.Table, dict or str)
+    """
+    paths = _expand_paths(paths, bbox=bbox)
+
+    # stats are not recorded by threads, so are recorded for all files below
+    read = lambda path: _read_geofeather(path, columns=columns, bbox=bbox)
+    with phase("read"), ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(read, paths))
+
+    tables = [table for table, _ in results]
+    crs = results[0][1]
+
+    # only some files may include the bbox column; drop it so that all rows are
+    # filtered after decoding
+    has_bbox = [BBOX_COLUMN in table.column_names for table in tables]
+    if any(has_bbox) and not all(has_bbox):
+        tables = [
+            table.drop_columns([BBOX_COLUMN]) if has else table
+            for table, has in zip(tables, has_bbox)
+        ]
+
+    metadata = _get_metadata(tables[0].schema)
+    encoding = metadata.get("encoding", "wkb")
+
+    for path, table, (_, file_crs) in zip(paths, tables, results):
+        if not _crs_equals(file_crs, crs):
+            raise ValueError(
+                "CRS of {} does not match CRS of {}".format(path, paths[0])
+            )
+
+        file_metadata = _get_metadata(table.schema)
+        if file_metadata.get("encoding", "wkb") != encoding:
+            raise ValueError(
+                "Geometry encoding of {} does not match geometry encoding of {}".format(
+                    path, paths[0]
+                )
+            )
+
+        # quantized coordinates are decoded using the metadata of the first file
+        if file_metadata.get("quantize") != metadata.get("quantize"):
+            raise ValueError(
+                "Coordinate precision of {} does not match coordinate precision of {}".format(
+                    path, paths[0]
+                )
+            )
+
+        if not table.schema.equals(tables[0].schema, check_metadata=False):
+            raise ValueError(
+                "Schema of {} does not match schema of {}.\n"
+                "Expected:\n{}\nGot:\n{}".format(
+                    path, paths[0], tables[0].schema, table.schema
+                )
+            )
+
+    table = pa.concat_tables(tables)
+
+    stats = current_stats()
+    if stats is not None:
+        stats.file_size = sum(os.path.getsize(str(path)) for path in paths)
+        stats.arrow_bytes = table.nbytes
+
+    return table, crs
+
+
+def _split_geometry(table, memory_map=False):
+    """Split the encoded geometry column from the other columns of a Table.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    memory_map : bool, optional (default: False)
+        If True, the table is backed by a memory mapped file.  Columns are not
+        consolidated when converting to pandas, so that columns that can be
+        converted without copying remain backed by the memory mapped file.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, pyarrow.ChunkedArray, str, int)
+        DataFrame of all other columns, encoded geometry, geometry encoding, and
+        position of geometry column within the table.
+    """
+    encoding = _get_metadata(table.schema).get("encoding", "wkb")
+
+    if BBOX_COLUMN in table.column_names:
+        table = table.remove_column(table.column_names.index(BBOX_COLUMN))
+
+    index = table.column_names.index("geometry")
+    geometry = table.column(index)
+    with phase("to_pandas"):
+        df = table.remove_column(index).to_pandas(split_blocks=memory_map)
+
+    return df, geometry, encoding, index
+
+
+def _decode_geometry(geometry, decode, threads=None):
+    """Decode an encoded geometry column one chunk at a time.
+
+    Decoded geometries are written into a single preallocated array, so that
+    intermediate objects (e.g., WKB bytes) only exist for one chunk at a time.
+
+    Parameters
+    ----------
+    geometry : pyarrow.ChunkedArray
+        encoded geometry data
+    decode : callable
+        function that decodes a pyarrow.Array into an array of geometries
+    threads : int, optional (default: None)
+        If greater than 1, chunks are split into at most this many slices, which
+        are decoded in a pool of this many threads.  Each thread writes directly
+        into its own part of the preallocated array.
+
+    Returns
+    -------
+    ndarray of geometry objects
+    """
+    out = np.empty(len(geometry), dtype=object)
+
+    # (start, chunk) of each part of the geometry column to decode
+    parts = []
+    size = -(-len(geometry) // threads) if threads and threads > 1 else None
+
+    start = 0
+    for chunk in geometry.chunks:
+        step = size or len(chunk) or 1
+        for offset in range(0, len(chunk), step):
+            parts.append((start + offset, chunk.slice(offset, step)))
+        start += len(chunk)
+
+    def decode_part(part):
+        start, chunk = part
+        out[start : start + len(chunk)] = decode(chunk)
+
+    if size is None or len(parts) < 2:
+        for part in parts:
+            decode_part(part)
+
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            # consume results to raise any errors
+            list(executor.map(decode_part, parts))
+
+    return out
+
+
+def _to_lazy(df, index, geometry, bbox=None, bounds=None):
+    """Add a lazy geometry column to a DataFrame of attributes.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    index : int
+        position of the geometry column
+    geometry : LazyGeometryArray
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, all geometries are decoded and only those that intersect
+        bbox are kept.
+    bounds : callable, optional (default: None)
+        function that calculates the bounds of an ndarray of geometries;
+        required if bbox is provided.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    df.insert(index, "geometry", geometry)
+
+    if bbox is not None:
+        with phase("decode"):
+            values = geometry.decode()
+
+        with phase("filter"):
+            df = df.loc[_intersects_bbox(bounds(values), bbox)].reset_index(drop=True)
+
+    return df
+
+
+def _to_geodataframe(table, crs, memory_map=False, bbox=None, threads=None, lazy=False):
+    """Convert a pyarrow Table with an encoded "geometry" column to a GeoDataFrame.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    crs : dict or str
+    memory_map : bool, optional (default: False)
+        If True, the table is backed by a memory mapped file.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided and table does not include a "bbox" column (and thus has not
+        already been filtered), geometries are filtered after decoding.
+    threads : int, optional (default: None)
+        number of threads used to decode geometries; see _decode_geometry.
+    lazy : bool, optional (default: False)
+        If True, geometries are not decoded; a pandas DataFrame with a
+        LazyGeometryArray "geometry" column is returned instead.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        pandas.DataFrame if lazy is True
+    """
+    filter_bbox = bbox is not None and BBOX_COLUMN not in table.column_names
+    quantize = _get_metadata(table.schema).get("quantize")
+    df, geometry, encoding, index = _split_geometry(table, memory_map=memory_map)
+
+    if encoding == "wkb":
+        decode = lambda chunk: from_wkb(chunk.to_numpy(zero_copy_only=False))
+
+    else:
+        shapely = import_optional_dependency(
+            "shapely",
+            extra="shapely >= 2.0 is required for geoarrow encoding.",
+            min_version="2.0",
+        )
+        decode = lambda chunk: coords.from_arrow(
+            chunk, encoding, shapely, quantize=quantize
+        )
+
+    if lazy:
+        return _to_lazy(
+            df,
+            index,
+            LazyGeometryArray(
+                geometry,
+                lambda encoded: _decode_geometry(encoded, decode, threads=threads),
+                crs=crs,
+            ),
+            bbox=bbox if filter_bbox else None,
+            bounds=lambda values: GeometryArray(values).bounds,
+        )
+
+    with phase("decode"):
+        geometry = _decode_geometry(geometry, decode, threads=threads)
+
+    with phase("crs"):
+        geometry = GeometryArray(geometry, crs=crs)
+
+    df.insert(index, "geometry", geometry)
+
+    if filter_bbox:
+        with phase("filter"):
+            df = df.loc[_intersects_bbox(geometry.bounds, bbox)].reset_index(drop=True)
+
+    return GeoDataFrame(df, geometry="geometry")
+
+
+def _read_attributes(path, columns, memory_map=False, bbox=None, filters=None):
+    """Read attribute columns from a feather file without reading geometries.
 
     Parameters
     ----------
-    df : geopandas.GeoDataFrame
-        Must contain a column "geometry" with WKB-encoded geometry
     path : str
-        path to feather file to write
-    crs : str or dict
-    """
+        path to feather file to read
+    columns : list-like
+        columns to read; must not include "geometry"
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it into memory.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only rows whose stored bounds intersect bbox are read; the
+        file must contain a "bbox" column.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        See from_geofeather.
 
-    # write the crs to an associated file
-    if crs:
-        with open("{}.crs".format(path), "w") as crsfile:
-            # geopandas CRS is now pyproj.CRS object
-            if hasattr(crs, "to_wkt"):
-                crs = {"wkt": crs.to_wkt()}
-            # fallbackfor older versions
-            elif isinstance(crs, str):
-                crs = {"proj4": crs}
-            crsfile.write(json.dumps(crs))
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    table, _ = _read_geofeather(
+        path, columns=columns, memory_map=memory_map, bbox=bbox, filters=filters
+    )
 
-    df.to_feather(path)
+    if BBOX_COLUMN in table.column_names and BBOX_COLUMN not in columns:
+        table = table.drop_columns([BBOX_COLUMN])
 
+    with phase("to_pandas"):
+        return table.to_pandas(split_blocks=memory_map)
 
-def _from_geofeather(path, columns=None):
-    """Deserialize a pandas.DataFrame stored in a feather file.
 
-    If the corresponding .crs file is found, it is used to set the CRS of
-    the GeoDataFrame.
+def _read_lite(
+    path, columns=None, memory_map=False, bbox=None, lite="bounds", filters=None
+):
+    """Read attribute columns and the stored bounds of each geometry from a
+    feather file, without reading geometries.
 
     Parameters
     ----------
     path : str
-        path to feather file to read
+        path to feather file to read; must have been written with bounds=True
     columns : list-like (optional, default: None)
-        Subset of columns to read from the file, must include 'geometry'.  If not provided,
-        all columns are read.
+        Subset of columns to read from the file.  "geometry" is ignored if
+        present.  If not provided, all columns are read.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it into memory.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only rows whose stored bounds intersect bbox are read.
+    lite : str, optional (default: "bounds")
+        If "bounds", the "xmin", "ymin", "xmax", "ymax" columns are added.  If
+        "center", the "x" and "y" columns of the center of the bounds are added.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        See from_geofeather.
 
     Returns
     -------
-    tuple of (pandas.DataFrame, dict or str)
-        DataFrame will contain a "geometry" or "wkb" column with WKB-encoded geometry data.
-        crs will be a dict or str depending on what was serialized.
+    pandas.DataFrame
+        values are NaN for missing or empty geometries
     """
-    crs = None
-    crsfilename = "{}.crs".format(path)
-    if os.path.exists(crsfilename):
-        crs = json.loads(open(crsfilename).read())
-        if "wkt" in crs:
-            crs = crs["wkt"]
-        elif "proj4" in crs:
-            crs = crs["proj4"]
-    else:
-        warnings.warn(
-            "{} coordinate reference system file is missing. No crs will be set for this GeoDataFrame.".format(
-                crsfilename
+    if lite not in LITE_MODES:
+        raise ValueError("lite must be one of {}".format(", ".join(LITE_MODES)))
+
+    metadata = read_geofeather_metadata(path)
+    if not metadata["bounds"]:
+        raise ValueError(
+            "{} does not contain bounds; it must be written with bounds=True".format(
+                path
             )
         )
 
-    # TODO: use geopandas feather I/O instead
+    if columns is None:
+        columns = metadata["columns"]
+
+    table, _ = _read_geofeather(
+        path,
+        columns=[c for c in columns if c != "geometry"] + [BBOX_COLUMN],
+        memory_map=memory_map,
+        bbox=bbox,
+        filters=filters,
+    )
+
+    with phase("to_pandas"):
+        bounds = [
+            pc.struct_field(table.column(BBOX_COLUMN), [i]).to_numpy() for i in range(4)
+        ]
+        df = table.drop_columns([BBOX_COLUMN]).to_pandas(split_blocks=memory_map)
+
+    if lite == "bounds":
+        for name, values in zip(BBOX_FIELDS, bounds):
+            df[name] = values
+
+    else:
+        df["x"] = (bounds[0] + bounds[2]) / 2
+        df["y"] = (bounds[1] + bounds[3]) / 2
+
+    return df
+
+
+def _bounds(df):
+    """Calculate the bounds of each geometry in the "geometry" column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    ndarray of shape (n, 4)
+    """
+    return df.geometry.values.bounds
+
+
+def _check_sort(df, sort, order_column):
+    """Validate the options used to sort rows before writing.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    sort : str or None
+    order_column : str or None
+    """
+    if sort is not None and sort not in SORT_METHODS:
+        raise ValueError("sort must be one of {}".format(", ".join(SORT_METHODS)))
+
+    if order_column is not None:
+        if sort is None:
+            raise ValueError("order_column requires sort")
+
+        if order_column in df.columns:
+            raise ValueError("column '{}' already exists".format(order_column))
+
+
+def _hilbert_order(bounds):
+    """Calculate the order of geometries along a Hilbert curve over the
+    centers of their bounds.
+
+    Missing and empty geometries are ordered last.
+
+    Parameters
+    ----------
+    bounds : ndarray of shape (n, 4)
+
+    Returns
+    -------
+    ndarray of int64
+        position of each geometry in the original order, in sorted order
+    """
+    valid = ~np.isnan(bounds).any(axis=1)
+
+    # one more than any Hilbert distance
+    key = np.full(len(bounds), 1 << 32, dtype="int64")
+    key[valid] = hilbert_distance(bounds[valid])
+
+    return np.argsort(key, kind="stable")
+
+
+def _sort(df, bounds, order_column=None):
+    """Sort the rows of a DataFrame along a Hilbert curve over the centers of
+    the bounds of their geometries.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    bounds : ndarray of shape (n, 4)
+        bounds of each geometry
+    order_column : str, optional (default: None)
+        If provided, the original position of each row is added to the sorted
+        DataFrame in this column.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, ndarray of shape (n, 4))
+        sorted DataFrame, with a new default index, and its bounds
+    """
+    order = _hilbert_order(bounds)
+    df = df.take(order).reset_index(drop=True)
+
+    if order_column is not None:
+        df[order_column] = order
+
+    return df, bounds[order]
+
+
+def _geometry_metadata(df):
+    """Create the metadata describing the geometries in the "geometry" column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    dict
+    """
+    geometry = df.geometry.values
+    geometry_types = set(geometry.geom_type) - {None}
+
+    return _make_geometry_metadata(geometry_types, geometry.total_bounds)
+
+
+def _prepare_write(
+    df,
+    encoding,
+    bounds,
+    precision,
+    sort,
+    order_column,
+    geometry_metadata=_geometry_metadata,
+    get_bounds=_bounds,
+    get_quantize=_quantize,
+    encode_geometry=_encode_geometry,
+):
+    """Validate the options used to write a DataFrame, and sort it and encode
+    its geometries.
+
+    Used by to_geofeather and to_geoparquet of both geofeather and
+    geofeather.pygeos, which provide the functions for their geometries.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        geometry must be contained in "geometry" column
+    encoding : str
+    bounds : bool
+        If True, the bounds of each geometry are returned.
+    precision : float or None
+    sort : str or None
+    order_column : str or None
+        See to_geofeather.
+    geometry_metadata : callable, optional (default: _geometry_metadata)
+    get_bounds : callable, optional (default: _bounds)
+    get_quantize : callable, optional (default: _quantize)
+    encode_geometry : callable, optional (default: _encode_geometry)
+        Functions used to create the geometry metadata, calculate the bounds,
+        create the parameters used to quantize coordinates, and encode the
+        geometries of a DataFrame.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, pyarrow.Array, str, ndarray or None, dict)
+        DataFrame (sorted if sort is provided), encoded geometry, geometry
+        encoding, bounds of each geometry (if bounds is True), and metadata
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError("encoding must be one of {}".format(", ".join(ENCODINGS)))
+
+    _check_precision(encoding, precision)
+    _check_sort(df, sort, order_column)
+
+    with phase("bounds"):
+        metadata = geometry_metadata(df)
+        store_bounds = bounds
+        bounds = get_bounds(df) if store_bounds or sort else None
+
+    if sort is not None:
+        with phase("sort"):
+            df, bounds = _sort(df, bounds, order_column=order_column)
 
-    return read_table(path, columns=columns).to_pandas(), crs
+        metadata["sort"] = sort
+        if not store_bounds:
+            bounds = None
 
+    with phase("encode"):
+        quantize = get_quantize(df, precision) if precision is not None else None
+        geometry, encoding = encode_geometry(df, encoding, quantize=quantize)
 
-def to_geofeather(df, path):
+    if quantize is not None:
+        metadata["quantize"] = quantize
+
+    return df, geometry, encoding, bounds, metadata
+
+
+@instrument
+def to_geofeather(
+    df,
+    path,
+    encoding="wkb",
+    bounds=False,
+    sindex=False,
+    compression=None,
+    compression_level=None,
+    chunksize=None,
+    dictionary_columns=None,
+    precision=None,
+    sort=None,
+    order_column=None,
+):
     """Serializes a geopandas GeoDataFrame to a feather file on disk.
 
     IMPORTANT: feather format does not support a non-default index; call reset_index() before using this function.
 
-    Internally, the geometry data are converted to WKB format.
+    Internally, the geometry data are converted to WKB format, unless geoarrow
+    encoding is used.
 
-    This also creates a .crs file with CRS information for this dataset
+    The CRS, geometry encoding, geometry types, and total bounds are stored in
+    the schema metadata of the file; see read_geofeather_metadata.
 
     Parameters
     ----------
@@ -91,27 +1978,242 @@ def to_geofeather(df, path):
         geometry must be contained in "geometry" column
     path : str
         path to feather file to write
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data.  If "wkb", geometries are stored as WKB.
+        If "geoarrow", geometries are stored as nested lists of coordinates,
+        which requires all geometries to be of the same type (single and multi
+        part geometries of the same type may be mixed; these are all stored as
+        multi part geometries).  "geoarrow" requires shapely >= 2.0.
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in a "bbox" column, and
+        the bounds of each record batch are stored in the metadata of that batch.
+        These are used to skip record batches and rows when reading with a bbox.
+    sindex : bool, optional (default: False)
+        If True, a packed Hilbert R-tree spatial index of the bounds of each
+        geometry is stored in a .sindex file, which is used to select rows when
+        reading with a bbox.  This implies bounds=True.
+    compression : str, optional (default: None)
+        Compression codec: "lz4", "zstd", or "uncompressed".  If not provided,
+        "lz4" is used if available, same as for feather files.
+    compression_level : int, optional (default: None)
+        Compression level of the codec.  If not provided, the default level of
+        the codec is used.
+    chunksize : int, optional (default: None)
+        Maximum number of rows in each record batch.  If not provided, defaults
+        to 64K rows, same as for feather files.
+    dictionary_columns : list-like of str, optional (default: None)
+        Attribute columns to dictionary encode, which reduces the size of
+        columns with many repeated values.  These are read back as
+        pandas.Categorical columns.
+    precision : float, optional (default: None)
+        If provided, coordinates are quantized to a grid with cells of this
+        size (in units of the CRS) and stored as int32 values, which are
+        delta encoded within each ring or line.  This reduces file size at
+        the cost of precision; coordinates are read back rounded to this
+        precision.  The grid is centered on the data, and the coordinates must
+        be within 2**31 cells of its center.  Requires a coordinate encoding,
+        e.g., encoding="geoarrow".
+    sort : str, optional (default: None)
+        If "hilbert", rows are sorted along a Hilbert curve over the centers of
+        the bounds of their geometries before writing, so that nearby
+        geometries are stored in the same record batches.  This makes reading
+        with a bbox much faster when combined with bounds=True or sindex=True.
+        Missing and empty geometries are written last.  If not provided, rows
+        are written in their original order.
+    order_column : str, optional (default: None)
+        If provided, the original position of each row is stored in this
+        column, which can be used to restore the original order after reading,
+        e.g., df.sort_values(order_column).  Requires sort.
     """
 
     crs = df.crs
-    df = DataFrame(df.copy())
 
-    # convert geometry field to WKB
-    df.geometry = df.geometry.apply(lambda g: g.wkb)
+    df, geometry, encoding, bounds, metadata = _prepare_write(
+        df, encoding, bounds or sindex, precision, sort, order_column
+    )
+
+    _to_geofeather(
+        df,
+        path,
+        crs,
+        geometry=geometry,
+        encoding=encoding,
+        bounds=bounds,
+        sindex=sindex,
+        metadata=metadata,
+        compression=compression,
+        compression_level=compression_level,
+        chunksize=chunksize,
+        dictionary_columns=dictionary_columns,
+    )
+
+
+def read_geofeather_metadata(path):
+    """Read the metadata of a feather file written by geofeather.
+
+    Only the footer and schema of the file are read.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file
+
+    Returns
+    -------
+    dict
+        "encoding": geometry encoding ("wkb" or a coordinate encoding)
+        "crs": dict or str
+        "geometry_types": list of geometry type names, or None if not known
+        "bbox": [xmin, ymin, xmax, ymax] of all geometries, or None if not known
+        "columns": list of column names, including "geometry"
+        "bounds": True if the file stores the bounds of each geometry
+        "precision": size of the grid that coordinates are quantized to, or
+        None if coordinates are not quantized
+        "sort": order in which rows were sorted before writing (e.g.,
+        "hilbert"), or None if rows were written in their original order
+    """
+    schema = _read_schema(path)
+    metadata = _get_metadata(schema)
+
+    columns = ["geometry" if c == "wkb" else c for c in schema.names]
 
-    _to_geofeather(df, path, crs)
+    return {
+        "encoding": metadata.get("encoding", "wkb"),
+        "crs": _read_crs(path, metadata),
+        "geometry_types": metadata.get("geometry_types"),
+        "bbox": metadata.get("bbox"),
+        "columns": [c for c in columns if c != BBOX_COLUMN],
+        "bounds": BBOX_COLUMN in columns,
+        "precision": metadata.get("quantize", {}).get("scale"),
+        "sort": metadata.get("sort"),
+    }
 
 
-def from_geofeather(path, columns=None):
+@instrument
+def from_geofeather(
+    path,
+    columns=None,
+    memory_map=False,
+    bbox=None,
+    threads=None,
+    lite=None,
+    filters=None,
+    lazy=False,
+):
     """Deserialize a geopandas.GeoDataFrame stored in a feather file.
 
-    This converts the internal WKB representation back into geometry.
+    This converts the internal WKB or coordinate representation back into geometry.
 
-    If the corresponding .crs file is found, it is used to set the CRS of
-    the GeoDataFrame.
+    The CRS stored in the file (or the corresponding .crs file for files created
+    with geofeather < 0.5) is used to set the CRS of the GeoDataFrame.
 
     Note: no index is set on this after deserialization, that is the responsibility of the caller.
 
+    Parameters
+    ----------
+    path : str
+        path to feather file to read
+    columns : list-like (optional, default: None)
+        Subset of columns to read from the file.  If 'geometry' is not included,
+        geometries are not read and a pandas DataFrame is returned.  If not
+        provided, all columns are read.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it into memory.  Where
+        possible, attribute columns remain backed by the memory mapped file
+        (e.g., numeric columns without missing values), and geometries are decoded
+        directly from it.  This is most effective for uncompressed files.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned.
+        For files written with bounds=True, record batches whose bounds do not
+        intersect bbox are skipped, and rows are filtered using the stored bounds
+        (or the spatial index, for files written with sindex=True) before
+        decoding geometries.  Otherwise, all geometries are decoded and then
+        filtered.
+    threads : int, optional (default: None)
+        If greater than 1, geometries are decoded in parallel using this many
+        threads.  This is only faster if the geometry library releases the GIL
+        while decoding.
+    lite : str, optional (default: None)
+        If "bounds" or "center", geometries are not read.  Instead, the bounds
+        of each geometry stored in the file ("xmin", "ymin", "xmax", "ymax"
+        columns), or the center of these bounds ("x" and "y" columns), are added
+        after the other columns of the returned pandas DataFrame.  This requires
+        a file written with bounds=True.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        If provided, only rows whose attribute values match filters are read,
+        e.g., [("state", "==", "CA"), ("population", ">", 1000)].  Filters are
+        evaluated on the Arrow data before any columns are converted to pandas
+        or geometries are decoded, so geometries are only decoded for matching
+        rows.  Each filter is a tuple of (column, operator, value), where
+        operator is one of "==", "=", "!=", "<", "<=", ">", ">=", "in", or
+        "not in".  A list of tuples is combined with AND; a list of lists of
+        tuples is combined with OR of the AND of each inner list (same as for
+        pyarrow.parquet.read_table).  Columns used in filters do not need to
+        be included in columns.
+    lazy : bool, optional (default: False)
+        If True, geometries are not decoded when reading.  Instead, a pandas
+        DataFrame is returned whose "geometry" column is a
+        geofeather.lazy.LazyGeometryArray backed by the encoded geometries,
+        which decodes geometries only for the rows that are accessed, or in
+        bulk when converted to an array (e.g., by a vectorized shapely
+        function).  Use geofeather.lazy.to_geodataframe to convert it to a
+        GeoDataFrame.  This is much faster when only a few geometries are
+        used, e.g., after filtering rows by their attributes.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        pandas.DataFrame if geometries are not read
+    """
+
+    if lite is not None:
+        return _read_lite(
+            path,
+            columns=columns,
+            memory_map=memory_map,
+            bbox=bbox,
+            lite=lite,
+            filters=filters,
+        )
+
+    if columns is not None and "geometry" not in columns:
+        if bbox is None or read_geofeather_metadata(path)["bounds"]:
+            return _read_attributes(
+                path, columns, memory_map=memory_map, bbox=bbox, filters=filters
+            )
+
+        # geometries are needed to filter by bbox, but are not returned
+        df = from_geofeather(
+            path,
+            columns=list(columns) + ["geometry"],
+            memory_map=memory_map,
+            bbox=bbox,
+            threads=threads,
+            filters=filters,
+        )
+        return DataFrame(df.drop(columns=["geometry"]))
+
+    table, crs = _read_geofeather(
+        path, columns=columns, memory_map=memory_map, bbox=bbox, filters=filters
+    )
+
+    return _to_geodataframe(
+        table, crs, memory_map=memory_map, bbox=bbox, threads=threads, lazy=lazy
+    )
+
+
+def iter_geofeather(
+    path, columns=None, batch_size=None, memory_map=False, bbox=None, threads=None
+):
+    """Deserialize a feather file into geopandas.GeoDataFrames, one record batch
+    at a time.
+
+    This allows processing files that are larger than available memory; only
+    one batch is read and decoded at a time.
+
+    The CRS stored in the file (or the corresponding .crs file for files created
+    with geofeather < 0.5) is used to set the CRS of each GeoDataFrame.
+
     Parameters
     ----------
     path : str
@@ -119,6 +2221,210 @@ def from_geofeather(path, columns=None):
     columns : list-like (optional, default: None)
         Subset of columns to read from the file, must include 'geometry'.  If not provided,
         all columns are read.
+    batch_size : int, optional (default: None)
+        Maximum number of rows in each GeoDataFrame.  Record batches in the file
+        that are larger than this are split.  If not provided, each record batch
+        is returned as stored in the file.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned.
+        For files written with bounds=True, record batches whose bounds do not
+        intersect bbox are skipped, and rows are filtered using the stored bounds
+        (or the spatial index, for files written with sindex=True) before
+        decoding geometries.  Otherwise, all geometries are decoded and then
+        filtered.
+    threads : int, optional (default: None)
+        If greater than 1, geometries are decoded in parallel using this many
+        threads.  This is only faster if the geometry library releases the GIL
+        while decoding.
+
+    Yields
+    ------
+    geopandas.GeoDataFrame
+    """
+
+    if columns is not None and "geometry" not in columns:
+        raise ValueError(
+            "'geometry' must be included in list of columns to read from feather file"
+        )
+
+    crs = None
+
+    for i, table in enumerate(
+        _iter_geofeather(
+            path,
+            columns=columns,
+            batch_size=batch_size,
+            memory_map=memory_map,
+            bbox=bbox,
+        )
+    ):
+        if i == 0:
+            crs = _read_crs(path, _get_metadata(table.schema))
+
+        yield _to_geodataframe(
+            table, crs, memory_map=memory_map, bbox=bbox, threads=threads
+        )
+
+
+@instrument
+def to_geoparquet(
+    df,
+    path,
+    encoding="wkb",
+    bounds=False,
+    compression=None,
+    compression_level=None,
+    row_group_size=None,
+    precision=None,
+    sort=None,
+    order_column=None,
+):
+    """Serializes a geopandas GeoDataFrame to a parquet file on disk.
+
+    A non-default index is written and restored when reading, same as for
+    pandas.DataFrame.to_parquet, unless rows are sorted (see sort), which
+    resets the index.
+
+    Geometries are encoded and the CRS and other metadata are stored in the
+    same way as for to_geofeather.  Files with WKB geometries also store the
+    "geo" metadata used by geopandas, so that they can be read with
+    geopandas.read_parquet.
+
+    Parameters
+    ----------
+    df : geopandas.GeoDataFrame
+        geometry must be contained in "geometry" column
+    path : str
+        path to parquet file to write
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data; see to_geofeather.
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in a "bbox" column.
+        Parquet stores the minimum and maximum of each field of this column for
+        each row group, which are used to skip row groups when reading with a
+        bbox.  Combine with sort="hilbert" so that each row group covers a
+        small area.
+    compression : str, optional (default: None)
+        Parquet compression codec, e.g., "snappy", "zstd", "gzip", "brotli",
+        "lz4", or "none".  If not provided, "snappy" is used.
+    compression_level : int, optional (default: None)
+        Compression level of the codec.  If not provided, the default level of
+        the codec is used.
+    row_group_size : int, optional (default: None)
+        Maximum number of rows in each row group.  If not provided, defaults to
+        64K rows.  Smaller row groups allow more of a file to be skipped when
+        reading with a bbox, at the cost of a larger file.
+    precision : float, optional (default: None)
+        See to_geofeather.
+    sort : str, optional (default: None)
+    order_column : str, optional (default: None)
+        See to_geofeather.
+    """
+
+    crs = df.crs
+
+    df, geometry, encoding, bounds, metadata = _prepare_write(
+        df, encoding, bounds, precision, sort, order_column
+    )
+
+    _to_geoparquet(
+        df,
+        path,
+        crs,
+        geometry=geometry,
+        encoding=encoding,
+        bounds=bounds,
+        metadata=metadata,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+    )
+
+
+@instrument
+def from_geoparquet(path, columns=None, bbox=None, threads=None, filters=None):
+    """Deserialize a geopandas.GeoDataFrame stored in a parquet file written by
+    to_geoparquet.
+
+    Note: no index is set on this after deserialization, that is the responsibility of the caller.
+
+    Parameters
+    ----------
+    path : str
+        path to parquet file to read
+    columns : list-like (optional, default: None)
+        Subset of columns to read from the file, which avoids reading the other
+        columns.  If not provided, all columns are read.  If "geometry" is not
+        included, geometries are not decoded and a pandas.DataFrame is returned.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned.
+        If the file was written with bounds=True, row groups that do not
+        intersect bbox are not read, and rows are filtered before decoding
+        geometries.  Otherwise, all geometries are decoded and then filtered.
+    threads : int, optional (default: None)
+        See from_geofeather.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        See from_geofeather.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        pandas.DataFrame if geometries are not read
+    """
+
+    if columns is not None and "geometry" not in columns:
+        if bbox is not None and not _has_bounds(path):
+            # geometries are needed to filter by bbox, but are not returned
+            df = from_geoparquet(
+                path,
+                columns=list(columns) + ["geometry"],
+                bbox=bbox,
+                threads=threads,
+                filters=filters,
+            )
+            return DataFrame(df.drop(columns=["geometry"]))
+
+        return _read_geoparquet_attributes(path, columns, bbox=bbox, filters=filters)
+
+    table, crs = _read_geoparquet(path, columns=columns, bbox=bbox, filters=filters)
+
+    return _to_geodataframe(table, crs, bbox=bbox, threads=threads)
+
+
+@instrument
+def read_geofeather_dataset(paths, columns=None, bbox=None, workers=None):
+    """Deserialize multiple feather files into a single geopandas.GeoDataFrame.
+
+    For datasets written by to_geofeather_dataset, partitions whose bounds do
+    not intersect bbox are skipped without opening them.
+
+    Files are read concurrently in a pool of threads.  Their data are combined
+    before decoding geometries, so that each column of the GeoDataFrame is
+    allocated only once.
+
+    All files must have the same columns, data types, geometry encoding, and CRS.
+
+    Note: no index is set on this after deserialization, that is the responsibility of the caller.
+
+    Parameters
+    ----------
+    paths : str or list-like of str
+        Directory containing .feather files, glob pattern (e.g., "tiles/*.feather"),
+        or list of paths to feather files.  Files found from a directory or
+        glob pattern are read in sorted order.
+    columns : list-like (optional, default: None)
+        Subset of columns to read from each file, must include 'geometry'.  If not provided,
+        all columns are read.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned;
+        see from_geofeather.
+    workers : int, optional (default: None)
+        Maximum number of threads used to read files.  If not provided, defaults
+        to the default for concurrent.futures.ThreadPoolExecutor.  If provided,
+        geometries are also decoded using this many threads; see the threads
+        option of from_geofeather.
 
     Returns
     -------
@@ -130,17 +2436,278 @@ def from_geofeather(path, columns=None):
             "'geometry' must be included in list of columns to read from feather file"
         )
 
-    # shim to support files created with geofeather 0.1.0
-    if columns is not None and "wkb" not in columns:
-        columns.append("wkb")
+    table, crs = _read_geofeather_dataset(
+        paths, columns=columns, bbox=bbox, workers=workers
+    )
 
-    df, crs = _from_geofeather(path, columns=columns)
+    return _to_geodataframe(table, crs, bbox=bbox, threads=workers)
 
-    # shim to support files created with geofeather 0.1.0
-    df = df.rename(columns={"wkb": "geometry"})
 
-    # decode the WKB geometry back to shapely objects
-    # df.geometry = df.geometry.apply(lambda wkb: loads(wkb))
-    df.geometry = from_wkb(df.geometry, crs=crs)
+def to_geofeather_dataset(
+    df, root, partition_by=None, grid=None, encoding="wkb", bounds=False
+):
+    """Serializes a geopandas GeoDataFrame to a directory of feather files, one
+    per partition.
 
-    return GeoDataFrame(df, geometry="geometry")
+    Rows are partitioned either by the values of one or more columns, or by the
+    tile of a regular grid that contains the center of the bounds of each
+    geometry.  Exactly one of partition_by or grid must be provided.
+
+    Partitions are written to "part-00000.feather", "part-00001.feather", etc.
+    A manifest ("_manifest.json") lists the path, key, number of rows, and
+    bounds of each partition, as well as the CRS of the dataset.
+    read_geofeather_dataset uses the manifest to skip partitions that do not
+    intersect a bbox without opening them.
+
+    Existing files in root are not removed, but only the partitions listed in
+    the manifest are read by read_geofeather_dataset.
+
+    Parameters
+    ----------
+    df : geopandas.GeoDataFrame
+        geometry must be contained in "geometry" column
+    root : str
+        directory to write files; created if it does not exist
+    partition_by : str or list of str, optional (default: None)
+        column(s) used to partition rows; missing values are written to their
+        own partition
+    grid : float or tuple of (float, float), optional (default: None)
+        width and height of the tiles of a grid used to partition rows.  Tiles
+        are aligned to the origin of the coordinate system.  Missing and empty
+        geometries are written to their own partition.
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data; see to_geofeather.
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in each file; see
+        to_geofeather.
+    """
+
+    if encoding not in ENCODINGS:
+        raise ValueError("encoding must be one of {}".format(", ".join(ENCODINGS)))
+
+    if encoding == "geoarrow":
+        # use the same coordinate encoding for all partitions
+        shapely = import_optional_dependency(
+            "shapely",
+            extra="shapely >= 2.0 is required for geoarrow encoding.",
+            min_version="2.0",
+        )
+        encoding = coords.get_encoding(df.geometry.values, shapely)
+
+    def write(part, path, schema):
+        geometry, part_encoding = _encode_geometry(part, encoding)
+        _to_geofeather(
+            part,
+            path,
+            df.crs,
+            geometry=geometry,
+            encoding=part_encoding,
+            bounds=_bounds(part) if bounds else None,
+            metadata=_geometry_metadata(part),
+            schema=schema,
+        )
+
+    _to_geofeather_dataset(
+        df,
+        root,
+        df.crs,
+        write,
+        _bounds(df),
+        partition_by=partition_by,
+        grid=grid,
+    )
+
+
+class GeoFeatherWriter(object):
+    """Serializes geopandas GeoDataFrames to a single feather file on disk,
+    one chunk at a time.
+
+    Each chunk is encoded and appended to the file as one or more record batches,
+    so that the full dataset never needs to be held in memory.  All chunks must
+    have the same columns and data types as the first chunk, and the same CRS
+    as the file, if they have a CRS.
+
+    The CRS and geometry encoding are stored in the schema metadata of the file.
+    Since the schema is written with the first chunk, geometry types and total
+    bounds are not stored.
+
+    The index of each chunk is not written.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file to write
+    crs : str or dict, optional (default: None)
+        If not provided, the CRS of the first chunk is used.
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data; see to_geofeather.  When using "geoarrow",
+        the geometry type is determined from the first chunk, and geometries
+        are stored as multi part geometries (e.g., polygons as multipolygons),
+        so that later chunks may contain single or multi part geometries of
+        that type.
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in a "bbox" column, and
+        the bounds of each record batch are stored in the metadata of that batch.
+    sindex : bool, optional (default: False)
+        If True, a spatial index of the bounds of all geometries is built and
+        stored in a .sindex file when the file is closed.  This implies
+        bounds=True.
+    compression : str, optional (default: None)
+    compression_level : int, optional (default: None)
+    chunksize : int, optional (default: None)
+        See to_geofeather.  Each chunk is split into record batches of at most
+        chunksize rows.  Dictionary encoding is not supported, since each chunk
+        would have a different dictionary.
+    precision : float, optional (default: None)
+        See to_geofeather.  The grid is centered on the first chunk, so
+        coordinates of all chunks must be within 2**31 cells of its center.
+
+    Examples
+    --------
+    >>> with GeoFeatherWriter("test.feather") as writer:
+    ...     for df in chunks:
+    ...         writer.write(df)
+    """
+
+    def __init__(
+        self,
+        path,
+        crs=None,
+        encoding="wkb",
+        bounds=False,
+        sindex=False,
+        compression=None,
+        compression_level=None,
+        chunksize=None,
+        precision=None,
+    ):
+        if encoding not in ENCODINGS:
+            raise ValueError("encoding must be one of {}".format(", ".join(ENCODINGS)))
+
+        _check_precision(encoding, precision)
+
+        self.path = path
+        self.crs = crs
+        self.encoding = encoding
+        self.bounds = bounds or sindex
+        self.sindex = sindex
+        self.chunksize = chunksize
+        self.precision = precision
+        self.quantize = None
+        self.options = _write_options(compression, compression_level)
+        self.schema = None
+        self._writer = None
+
+        # bounds and number of rows of each record batch written so far, used
+        # to build the spatial index
+        self._chunk_bounds = []
+        self._batch_rows = []
+
+    def _encode(self, df):
+        """Encode the geometry of a chunk.
+
+        Parameters
+        ----------
+        df : geopandas.GeoDataFrame
+
+        Returns
+        -------
+        tuple of (pyarrow.Array, str)
+            encoded geometry and its encoding
+        """
+        return _encode_geometry(df, self.encoding, quantize=self.quantize)
+
+    def _quantize(self, df):
+        return _quantize(df, self.precision)
+
+    def _bounds(self, df):
+        return _bounds(df)
+
+    def _get_crs(self, df):
+        return df.crs
+
+    def _get_encoding(self, df):
+        shapely = import_optional_dependency(
+            "shapely",
+            extra="shapely >= 2.0 is required for geoarrow encoding.",
+            min_version="2.0",
+        )
+        return coords.get_encoding(df.geometry.values, shapely)
+
+    def write(self, df):
+        """Encode and append a chunk to the file.
+
+        Parameters
+        ----------
+        df : geopandas.GeoDataFrame
+            geometry must be contained in "geometry" column
+        """
+        crs = self._get_crs(df)
+
+        if self.schema is None:
+            self.crs = self.crs or crs
+
+            if self.precision is not None:
+                self.quantize = self._quantize(df)
+
+            if self.encoding == "geoarrow":
+                encoding = self._get_encoding(df)
+                self.encoding = coords.MULTI_PART_ENCODINGS.get(encoding, encoding)
+
+        if crs and not _crs_equals(crs, self.crs):
+            raise ValueError(
+                "CRS of chunk does not match CRS of file.\n"
+                "Expected:\n{}\nGot:\n{}".format(self.crs, crs)
+            )
+
+        geometry, encoding = self._encode(df)
+        bounds = self._bounds(df) if self.bounds else None
+        table = _to_table(
+            df,
+            geometry=geometry,
+            encoding=encoding,
+            crs=self.crs,
+            bounds=bounds,
+            preserve_index=False,
+            metadata={"quantize": self.quantize} if self.quantize else None,
+        )
+
+        if self.schema is None:
+            # use the specific geometry type for subsequent chunks
+            self.encoding = encoding
+            self.schema = table.schema
+            self._writer = pa.ipc.new_file(
+                str(self.path), self.schema, options=self.options
+            )
+            remove_sindex(self.path)
+
+        elif not table.schema.equals(self.schema, check_metadata=False):
+            raise ValueError(
+                "Schema of chunk does not match schema of previous chunks.\n"
+                "Expected:\n{}\nGot:\n{}".format(self.schema, table.schema)
+            )
+
+        self._batch_rows.extend(
+            _write_table(self._writer, table, chunksize=self.chunksize)
+        )
+
+        if self.sindex:
+            self._chunk_bounds.append(bounds)
+
+    def close(self):
+        """Close the file.  If no chunks were written, no file is created."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+            if self.sindex:
+                _write_sindex(
+                    self.path, np.concatenate(self._chunk_bounds), self._batch_rows
+                )
+                self._chunk_bounds = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,328 @@
+"""Geometry column that is decoded on first access.
+
+from_geofeather(path, lazy=True) returns a pandas DataFrame whose "geometry"
+column is a LazyGeometryArray, which holds the encoded geometries as read from
+the file (e.g., WKB) instead of geometry objects.  Geometries are decoded only
+when they are accessed:
+
+- accessing individual rows (e.g., df.geometry.iloc[0]) decodes only those
+  rows
+- filtering, slicing, or reordering rows does not decode geometries
+- converting to a numpy array (e.g., np.asarray(df.geometry), or passing the
+  column to a vectorized shapely or pygeos function), or to_geodataframe(),
+  decodes all geometries that have not been decoded yet, in bulk
+
+Decoded geometries are cached by the array, and shared with arrays created by
+slicing or copying it, so that each geometry is decoded at most once.  Setting
+geometries (e.g., df.loc[0, "geometry"] = point) stores them as decoded
+geometries; shared geometries are copied first, so this does not modify other
+arrays.
+
+>>> df = from_geofeather("test.feather", lazy=True)
+>>> df = df.loc[df.state == "CA"]
+>>> gdf = to_geodataframe(df)
+"""
+
+from geopandas import GeoDataFrame
+from geopandas.array import GeometryArray
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame, Index, Series, isna
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+)
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_list_like
+
+
+@register_extension_dtype
+class LazyGeometryDtype(ExtensionDtype):
+    """Data type of geometries that are decoded on first access."""
+
+    name = "lazy_geometry"
+    type = object
+    kind = "O"
+    na_value = None
+
+    @classmethod
+    def construct_array_type(cls):
+        return LazyGeometryArray
+
+
+class LazyGeometryArray(ExtensionArray):
+    """Array of encoded geometries that are decoded on first access.
+
+    Parameters
+    ----------
+    encoded : pyarrow.ChunkedArray or pyarrow.Array
+        encoded geometry data
+    decode : callable
+        function that decodes a pyarrow.ChunkedArray of encoded geometry data
+        into an ndarray of geometry objects
+    crs : str or dict, optional (default: None)
+
+    Attributes
+    ----------
+    crs : str or dict
+    """
+
+    def __init__(self, encoded, decode, crs=None, _values=None, _decoded=None):
+        if isinstance(encoded, pa.Array):
+            encoded = pa.chunked_array([encoded])
+
+        self._encoded = encoded
+        self._decode = decode
+        self.crs = crs
+
+        # decoded geometries, valid where _decoded is True
+        self._values = (
+            _values if _values is not None else np.empty(len(encoded), dtype=object)
+        )
+        self._decoded = (
+            _decoded if _decoded is not None else np.zeros(len(encoded), dtype=bool)
+        )
+        # True if _values and _decoded are shared with other arrays
+        self._shared = False
+
+    def _derive(self, encoded, values, decoded):
+        return LazyGeometryArray(
+            encoded, self._decode, crs=self.crs, _values=values, _decoded=decoded
+        )
+
+    def _view(self, encoded, values, decoded):
+        """Create an array that shares the decoded geometries of this array.
+
+        Both arrays copy the decoded geometries before setting geometries.
+        """
+        array = self._derive(encoded, values, decoded)
+        array._shared = self._shared = True
+        return array
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        values = np.empty(len(scalars), dtype=object)
+        values[:] = list(scalars)
+
+        return cls(
+            pa.nulls(len(values), pa.binary()),
+            None,
+            _values=values,
+            _decoded=np.ones(len(values), dtype=bool),
+        )
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls._from_sequence(values)
+
+    @property
+    def dtype(self):
+        return LazyGeometryDtype()
+
+    @property
+    def nbytes(self):
+        """Size of the encoded geometries and of the references to decoded
+        geometries, excluding the decoded geometries themselves."""
+        return self._encoded.nbytes + self._values.nbytes + self._decoded.nbytes
+
+    @property
+    def num_decoded(self):
+        """Number of geometries that have been decoded."""
+        return int(self._decoded.sum())
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+
+            if not self._decoded[key]:
+                self._values[key] = self._decode(self._encoded.slice(key, 1))[0]
+                self._decoded[key] = True
+
+            return self._values[key]
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                # views of the cache, so that geometries decoded by the slice
+                # are also decoded for this array
+                return self._view(
+                    self._encoded.slice(start, max(stop - start, 0)),
+                    self._values[start:stop],
+                    self._decoded[start:stop],
+                )
+
+            key = np.arange(start, stop, step)
+
+        key = np.asarray(key)
+        if key.dtype == bool:
+            key = np.flatnonzero(key)
+
+        return self.take(key)
+
+    def __setitem__(self, key, value):
+        key = check_array_indexer(self, key)
+
+        if (
+            isinstance(value, LazyGeometryArray)
+            and isinstance(key, slice)
+            and key.indices(len(self)) == (0, len(self), 1)
+        ):
+            # replace all geometries (e.g., pandas does this when setting a
+            # value in a DataFrame) without decoding them
+            self._encoded = value._encoded
+            self._decode = value._decode or self._decode
+            self._values = value._values
+            self._decoded = value._decoded
+            self._shared = value._shared = True
+            return
+
+        if is_list_like(value):
+            values = np.empty(len(value), dtype=object)
+            values[:] = value if hasattr(value, "__array__") else list(value)
+            value = values
+
+        if self._shared:
+            self._values = self._values.copy()
+            self._decoded = self._decoded.copy()
+            self._shared = False
+
+        self._values[key] = value
+        self._decoded[key] = True
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        """Take elements from the array without decoding them.
+
+        Parameters
+        ----------
+        indices : sequence of int
+        allow_fill : bool, optional (default: False)
+            If True, -1 in indices indicates a missing value.
+        fill_value : None
+            Only missing values (e.g., None or NaN) are supported.
+
+        Returns
+        -------
+        LazyGeometryArray
+        """
+        indices = np.asarray(indices, dtype="int64")
+
+        if allow_fill:
+            if not isna(fill_value):
+                raise ValueError("fill_value must be a missing value")
+
+            missing = indices < 0
+            if (indices < -1).any():
+                raise ValueError("indices must be >= -1 when allow_fill is True")
+
+            encoded = self._encoded.take(pa.array(indices, mask=missing))
+            positions = np.where(missing, 0, indices)
+
+        else:
+            missing = None
+            indices = np.where(indices < 0, indices + len(self), indices)
+            encoded = self._encoded.take(pa.array(indices))
+            positions = indices
+
+        values = self._values[positions] if len(self) else np.empty(0, dtype=object)
+        decoded = self._decoded[positions] if len(self) else np.zeros(0, dtype=bool)
+
+        if missing is not None and missing.any():
+            values[missing] = None
+            decoded[missing] = True
+
+        return self._derive(encoded, values, decoded)
+
+    def copy(self):
+        return self._view(self._encoded, self._values, self._decoded)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        decode = next((a._decode for a in to_concat if a._decode is not None), None)
+
+        return cls(
+            pa.chunked_array(
+                [chunk for a in to_concat for chunk in a._encoded.chunks],
+                type=to_concat[0]._encoded.type,
+            ),
+            decode,
+            crs=to_concat[0].crs,
+            _values=np.concatenate([a._values for a in to_concat]),
+            _decoded=np.concatenate([a._decoded for a in to_concat]),
+        )
+
+    def isna(self):
+        missing = np.array(self._encoded.is_null(), dtype=bool)
+        missing[self._decoded] = isna(self._values[self._decoded])
+        return missing
+
+    def decode(self):
+        """Decode all geometries that have not been decoded yet, in bulk.
+
+        Returns
+        -------
+        ndarray of geometry objects
+            the cached geometries; do not modify
+        """
+        remaining = np.flatnonzero(~self._decoded)
+        if len(remaining) == len(self):
+            self._values[:] = self._decode(self._encoded)
+
+        elif len(remaining):
+            self._values[remaining] = self._decode(
+                self._encoded.take(pa.array(remaining))
+            )
+
+        self._decoded[:] = True
+
+        return self._values
+
+    def to_numpy(self, dtype=None, copy=False, na_value=None):
+        return self.decode().copy()
+
+    def __array__(self, dtype=None):
+        return self.decode()
+
+    def __eq__(self, other):
+        if isinstance(other, (DataFrame, Series, Index)):
+            return NotImplemented
+
+        return self.decode() == np.asarray(other, dtype=object)
+
+    def to_geometry(self):
+        """Decode all geometries into a geopandas GeometryArray.
+
+        Only supported for shapely geometries.
+
+        Returns
+        -------
+        geopandas.array.GeometryArray
+        """
+        return GeometryArray(self.decode().copy(), crs=self.crs)
+
+
+def to_geodataframe(df):
+    """Convert a DataFrame with a lazy "geometry" column of shapely geometries,
+    as returned by from_geofeather(..., lazy=True), into a GeoDataFrame.
+
+    Geometries that have not been decoded yet are decoded in bulk.  df is not
+    modified.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+    """
+    geometry = df["geometry"].array
+    df = df.copy(deep=False)
+    df["geometry"] = geometry.to_geometry()
+
+    return GeoDataFrame(df, geometry="geometry")
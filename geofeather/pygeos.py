@@ -1,19 +1,223 @@
 import numpy as np
+import pyarrow as pa
 from pandas import DataFrame
 from pandas.compat._optional import import_optional_dependency
-from shapely.wkb import loads
 
-from geofeather.core import _from_geofeather, _to_geofeather
+from geofeather import coords
+from geofeather.lazy import LazyGeometryArray
+from geofeather.shared import _attach_path
+from geofeather.stats import instrument, phase
+from geofeather.core import (
+    BBOX_COLUMN,
+    ENCODINGS,
+    GEOMETRY_TYPES,
+    GeoFeatherWriter as _GeoFeatherWriter,
+    _decode_geometry,
+    _has_bounds,
+    _get_metadata,
+    _intersects_bbox,
+    _iter_geofeather,
+    _make_geometry_metadata,
+    _prepare_write,
+    _read_attributes,
+    _read_crs,
+    _read_geofeather,
+    _read_geofeather_dataset,
+    _read_geoparquet,
+    _read_geoparquet_attributes,
+    _read_lite,
+    _split_geometry,
+    _to_geofeather,
+    _to_geofeather_dataset,
+    _to_geoparquet,
+    _to_lazy,
+    read_geofeather_metadata,
+)
 
 
-def to_geofeather(df, path, crs=None):
+def _quantize(df, precision):
+    """Create the parameters used to quantize the coordinates of the pygeos
+    geometries in the "geometry" column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    precision : float
+        size of grid cells
+
+    Returns
+    -------
+    dict
+        "scale" and "offset"; see geofeather.coords.to_arrow
+    """
+    import pygeos
+
+    return {
+        "scale": float(precision),
+        "offset": coords.quantize_offset(df.geometry.values, pygeos, precision),
+    }
+
+
+def _encode_geometry(df, encoding="wkb", quantize=None):
+    """Encode the "geometry" column of a DataFrame containing pygeos geometries.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    encoding : str, optional (default: "wkb")
+        "wkb", "geoarrow", or one of the coordinate encodings in
+        geofeather.coords.ENCODINGS
+    quantize : dict, optional (default: None)
+        parameters used to quantize coordinates; see _quantize.  Not supported
+        for "wkb".
+
+    Returns
+    -------
+    tuple of (pyarrow.Array, str)
+        encoded geometry and its encoding
+    """
+    import pygeos
+
+    if encoding == "wkb":
+        return pa.array(pygeos.to_wkb(df.geometry.values), type=pa.binary()), encoding
+
+    return coords.to_arrow(
+        df.geometry.values,
+        pygeos,
+        encoding=None if encoding == "geoarrow" else encoding,
+        quantize=quantize,
+    )
+
+
+def _bounds(df):
+    """Calculate the bounds of each pygeos geometry in the "geometry" column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    ndarray of shape (n, 4)
+    """
+    import pygeos
+
+    return pygeos.bounds(df.geometry.values)
+
+
+def _geometry_metadata(df):
+    """Create the metadata describing the pygeos geometries in the "geometry"
+    column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    dict
+    """
+    import pygeos
+
+    type_ids = np.unique(pygeos.get_type_id(df.geometry.values))
+
+    return _make_geometry_metadata(
+        [GEOMETRY_TYPES[i] for i in type_ids if i >= 0],
+        pygeos.total_bounds(df.geometry.values),
+    )
+
+
+def _to_dataframe(table, crs, memory_map=False, bbox=None, threads=None, lazy=False):
+    """Convert a pyarrow Table with an encoded "geometry" column to a pandas
+    DataFrame containing pygeos geometries.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    crs : dict or str
+    memory_map : bool, optional (default: False)
+        If True, the table is backed by a memory mapped file.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided and table does not include a "bbox" column (and thus has not
+        already been filtered), geometries are filtered after decoding.
+    lazy : bool, optional (default: False)
+        If True, geometries are not decoded; the "geometry" column is a
+        LazyGeometryArray.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    import pygeos
+
+    filter_bbox = bbox is not None and BBOX_COLUMN not in table.column_names
+    quantize = _get_metadata(table.schema).get("quantize")
+    df, geometry, encoding, index = _split_geometry(table, memory_map=memory_map)
+
+    if encoding == "wkb":
+        decode = lambda chunk: pygeos.from_wkb(chunk.to_numpy(zero_copy_only=False))
+    else:
+        decode = lambda chunk: coords.from_arrow(
+            chunk, encoding, pygeos, quantize=quantize
+        )
+
+    if lazy:
+        df = _to_lazy(
+            df,
+            index,
+            LazyGeometryArray(
+                geometry,
+                lambda encoded: _decode_geometry(encoded, decode, threads=threads),
+                crs=crs,
+            ),
+            bbox=bbox if filter_bbox else None,
+            bounds=pygeos.bounds,
+        )
+        df.crs = crs
+        return df
+
+    with phase("decode"):
+        geometry = _decode_geometry(geometry, decode, threads=threads)
+
+    df.insert(index, "geometry", geometry)
+
+    if filter_bbox:
+        with phase("filter"):
+            df = df.loc[_intersects_bbox(pygeos.bounds(geometry), bbox)].reset_index(
+                drop=True
+            )
+
+    # add crs attribute to data frame
+    df.crs = crs
+
+    return df
+
+
+@instrument
+def to_geofeather(
+    df,
+    path,
+    crs=None,
+    encoding="wkb",
+    bounds=False,
+    sindex=False,
+    compression=None,
+    compression_level=None,
+    chunksize=None,
+    dictionary_columns=None,
+    precision=None,
+    sort=None,
+    order_column=None,
+):
     """Serializes a pandas DataFrame containing pygeos geometries to a feather file on disk.
 
     IMPORTANT: feather format does not support a non-default index; call reset_index() before using this function.
 
-    Internally, the geometry data are converted to WKB format.
+    Internally, the geometry data are converted to WKB format, unless geoarrow
+    encoding is used.
 
-    This also creates a .crs file with CRS information for this dataset
+    The CRS, geometry encoding, geometry types, and total bounds are stored in
+    the schema metadata of the file; see read_geofeather_metadata.
 
     Parameters
     ----------
@@ -22,30 +226,193 @@ def to_geofeather(df, path, crs=None):
         path to feather file to write
     crs : str or dict, optional (default: None)
         GeoPandas CRS object
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data.  If "wkb", geometries are stored as WKB.
+        If "geoarrow", geometries are stored as nested lists of coordinates,
+        which requires all geometries to be of the same type (single and multi
+        part geometries of the same type may be mixed; these are all stored as
+        multi part geometries).
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in a "bbox" column, and
+        the bounds of each record batch are stored in the metadata of that batch.
+        These are used to skip record batches and rows when reading with a bbox.
+    sindex : bool, optional (default: False)
+        If True, a packed Hilbert R-tree spatial index of the bounds of each
+        geometry is stored in a .sindex file, which is used to select rows when
+        reading with a bbox.  This implies bounds=True.
+    compression : str, optional (default: None)
+        Compression codec: "lz4", "zstd", or "uncompressed".  If not provided,
+        "lz4" is used if available, same as for feather files.
+    compression_level : int, optional (default: None)
+        Compression level of the codec.  If not provided, the default level of
+        the codec is used.
+    chunksize : int, optional (default: None)
+        Maximum number of rows in each record batch.  If not provided, defaults
+        to 64K rows, same as for feather files.
+    dictionary_columns : list-like of str, optional (default: None)
+        Attribute columns to dictionary encode, which reduces the size of
+        columns with many repeated values.  These are read back as
+        pandas.Categorical columns.
+    precision : float, optional (default: None)
+        If provided, coordinates are quantized to a grid with cells of this
+        size (in units of the CRS) and stored as int32 values, which are
+        delta encoded within each ring or line.  This reduces file size at
+        the cost of precision; coordinates are read back rounded to this
+        precision.  The grid is centered on the data, and the coordinates must
+        be within 2**31 cells of its center.  Requires a coordinate encoding,
+        e.g., encoding="geoarrow".
+    sort : str, optional (default: None)
+        If "hilbert", rows are sorted along a Hilbert curve over the centers of
+        the bounds of their geometries before writing; see
+        geofeather.to_geofeather.
+    order_column : str, optional (default: None)
+        If provided, the original position of each row is stored in this
+        column.  Requires sort.
     """
 
     import_optional_dependency("pygeos", extra="pygeos is required for pygeos support.")
-    from pygeos import to_wkb
 
     # fetch attribute from Pandas DataFrame if we previously added it there
     crs = crs or getattr(df, "crs", None)
 
-    df = DataFrame(df.copy())
-    df["geometry"] = to_wkb(df.geometry)
+    df, geometry, encoding, bounds, metadata = _prepare_write(
+        df,
+        encoding,
+        bounds or sindex,
+        precision,
+        sort,
+        order_column,
+        geometry_metadata=_geometry_metadata,
+        get_bounds=_bounds,
+        get_quantize=_quantize,
+        encode_geometry=_encode_geometry,
+    )
 
-    _to_geofeather(df, path, crs=crs)
+    _to_geofeather(
+        df,
+        path,
+        crs=crs,
+        geometry=geometry,
+        encoding=encoding,
+        bounds=bounds,
+        sindex=sindex,
+        metadata=metadata,
+        compression=compression,
+        compression_level=compression_level,
+        chunksize=chunksize,
+        dictionary_columns=dictionary_columns,
+    )
 
 
-def from_geofeather(path, columns=None):
+@instrument
+def from_geofeather(
+    path,
+    columns=None,
+    memory_map=False,
+    bbox=None,
+    threads=None,
+    lite=None,
+    filters=None,
+    lazy=False,
+):
     """Deserialize a geopandas.GeoDataFrame stored in a feather file.
 
-    This converts the internal WKB representation back into geometry.
+    This converts the internal WKB or coordinate representation back into geometry.
 
-    If the corresponding .crs file is found, it is used to set the CRS of
-    the GeoDataFrame.
+    The CRS stored in the file (or the corresponding .crs file for files created
+    with geofeather < 0.5) is used to set the CRS of the GeoDataFrame.
 
     Note: no index is set on this after deserialization, that is the responsibility of the caller.
 
+    Parameters
+    ----------
+    path : str
+        path to feather file to read
+    columns : list-like (optional, default: None)
+        Subset of columns to read from the file.  If 'geometry' is not included,
+        geometries are not read.  If not provided, all columns are read.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it into memory.  Where
+        possible, attribute columns remain backed by the memory mapped file
+        (e.g., numeric columns without missing values), and geometries are decoded
+        directly from it.  This is most effective for uncompressed files.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned.
+        For files written with bounds=True, record batches whose bounds do not
+        intersect bbox are skipped, and rows are filtered using the stored bounds
+        (or the spatial index, for files written with sindex=True) before
+        decoding geometries.  Otherwise, all geometries are decoded and then
+        filtered.
+    threads : int, optional (default: None)
+        If greater than 1, geometries are decoded in parallel using this many
+        threads.  This is only faster if the geometry library releases the GIL
+        while decoding.
+    lite : str, optional (default: None)
+        If "bounds" or "center", geometries are not read.  Instead, the bounds
+        of each geometry stored in the file ("xmin", "ymin", "xmax", "ymax"
+        columns), or the center of these bounds ("x" and "y" columns), are added
+        after the other columns of the returned pandas DataFrame.  This requires
+        a file written with bounds=True.
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        If provided, only rows whose attribute values match filters are read
+        and decoded; see geofeather.from_geofeather.
+    lazy : bool, optional (default: False)
+        If True, geometries are not decoded until they are accessed; see
+        geofeather.from_geofeather.  Use np.asarray(df.geometry) to decode all
+        geometries.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+    """
+
+    import_optional_dependency("pygeos", extra="pygeos is required for pygeos support.")
+
+    if lite is not None:
+        return _read_lite(
+            path,
+            columns=columns,
+            memory_map=memory_map,
+            bbox=bbox,
+            lite=lite,
+            filters=filters,
+        )
+
+    if columns is not None and "geometry" not in columns:
+        if bbox is None or read_geofeather_metadata(path)["bounds"]:
+            return _read_attributes(
+                path, columns, memory_map=memory_map, bbox=bbox, filters=filters
+            )
+
+        # geometries are needed to filter by bbox, but are not returned
+        df = from_geofeather(
+            path,
+            columns=list(columns) + ["geometry"],
+            memory_map=memory_map,
+            bbox=bbox,
+            threads=threads,
+            filters=filters,
+        )
+        return DataFrame(df.drop(columns=["geometry"]))
+
+    table, crs = _read_geofeather(
+        path, columns=columns, memory_map=memory_map, bbox=bbox, filters=filters
+    )
+
+    return _to_dataframe(
+        table, crs, memory_map=memory_map, bbox=bbox, threads=threads, lazy=lazy
+    )
+
+
+def iter_geofeather(
+    path, columns=None, batch_size=None, memory_map=False, bbox=None, threads=None
+):
+    """Deserialize a feather file into pandas DataFrames containing pygeos
+    geometries, one record batch at a time.
+
+    This allows processing files that are larger than available memory; only
+    one batch is read and decoded at a time.
+
     Parameters
     ----------
     path : str
@@ -53,32 +420,401 @@ def from_geofeather(path, columns=None):
     columns : list-like (optional, default: None)
         Subset of columns to read from the file, must include 'geometry'.  If not provided,
         all columns are read.
+    batch_size : int, optional (default: None)
+        Maximum number of rows in each DataFrame.  Record batches in the file
+        that are larger than this are split.  If not provided, each record batch
+        is returned as stored in the file.
+    memory_map : bool, optional (default: False)
+        If True, memory map the file instead of reading it.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned.
+        For files written with bounds=True, record batches whose bounds do not
+        intersect bbox are skipped, and rows are filtered using the stored bounds
+        (or the spatial index, for files written with sindex=True) before
+        decoding geometries.  Otherwise, all geometries are decoded and then
+        filtered.
+    threads : int, optional (default: None)
+        If greater than 1, geometries are decoded in parallel using this many
+        threads.  This is only faster if the geometry library releases the GIL
+        while decoding.
+
+    Yields
+    ------
+    pandas.DataFrame
+    """
+
+    import_optional_dependency("pygeos", extra="pygeos is required for pygeos support.")
+
+    if columns is not None and "geometry" not in columns:
+        raise ValueError(
+            "'geometry' must be included in list of columns to read from feather file"
+        )
+
+    crs = None
+
+    for i, table in enumerate(
+        _iter_geofeather(
+            path,
+            columns=columns,
+            batch_size=batch_size,
+            memory_map=memory_map,
+            bbox=bbox,
+        )
+    ):
+        if i == 0:
+            crs = _read_crs(path, _get_metadata(table.schema))
+
+        yield _to_dataframe(
+            table, crs, memory_map=memory_map, bbox=bbox, threads=threads
+        )
+
+
+@instrument
+def to_geoparquet(
+    df,
+    path,
+    crs=None,
+    encoding="wkb",
+    bounds=False,
+    compression=None,
+    compression_level=None,
+    row_group_size=None,
+    precision=None,
+    sort=None,
+    order_column=None,
+):
+    """Serializes a pandas DataFrame containing pygeos geometries to a parquet file on disk.
+
+    A non-default index is written and restored when reading, same as for
+    pandas.DataFrame.to_parquet, unless rows are sorted (see sort), which
+    resets the index.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    path : str
+        path to parquet file to write
+    crs : str or dict, optional (default: None)
+        GeoPandas CRS object
+    encoding : str, optional (default: "wkb")
+    bounds : bool, optional (default: False)
+    compression : str, optional (default: None)
+    compression_level : int, optional (default: None)
+    row_group_size : int, optional (default: None)
+    precision : float, optional (default: None)
+    sort : str, optional (default: None)
+    order_column : str, optional (default: None)
+        See geofeather.to_geoparquet.
+    """
+
+    import_optional_dependency("pygeos", extra="pygeos is required for pygeos support.")
+
+    # fetch attribute from Pandas DataFrame if we previously added it there
+    crs = crs or getattr(df, "crs", None)
+
+    df, geometry, encoding, bounds, metadata = _prepare_write(
+        df,
+        encoding,
+        bounds,
+        precision,
+        sort,
+        order_column,
+        geometry_metadata=_geometry_metadata,
+        get_bounds=_bounds,
+        get_quantize=_quantize,
+        encode_geometry=_encode_geometry,
+    )
+
+    _to_geoparquet(
+        df,
+        path,
+        crs=crs,
+        geometry=geometry,
+        encoding=encoding,
+        bounds=bounds,
+        metadata=metadata,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+    )
+
+
+@instrument
+def from_geoparquet(path, columns=None, bbox=None, threads=None, filters=None):
+    """Deserialize a pandas DataFrame containing pygeos geometries stored in a
+    parquet file written by to_geoparquet.
+
+    Parameters
+    ----------
+    path : str
+        path to parquet file to read
+    columns : list-like (optional, default: None)
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+    threads : int, optional (default: None)
+    filters : list of tuples or list of lists of tuples, optional (default: None)
+        See geofeather.from_geoparquet.
 
     Returns
     -------
-    geopandas.GeoDataFrame
+    pandas.DataFrame
+    """
+
+    import_optional_dependency("pygeos", extra="pygeos is required for pygeos support.")
+
+    if columns is not None and "geometry" not in columns:
+        if bbox is not None and not _has_bounds(path):
+            # geometries are needed to filter by bbox, but are not returned
+            df = from_geoparquet(
+                path,
+                columns=list(columns) + ["geometry"],
+                bbox=bbox,
+                threads=threads,
+                filters=filters,
+            )
+            return DataFrame(df.drop(columns=["geometry"]))
+
+        return _read_geoparquet_attributes(path, columns, bbox=bbox, filters=filters)
+
+    table, crs = _read_geoparquet(path, columns=columns, bbox=bbox, filters=filters)
+
+    return _to_dataframe(table, crs, bbox=bbox, threads=threads)
+
+
+@instrument
+def read_geofeather_dataset(paths, columns=None, bbox=None, workers=None):
+    """Deserialize multiple feather files into a single pandas DataFrame
+    containing pygeos geometries.
+
+    For datasets written by to_geofeather_dataset, partitions whose bounds do
+    not intersect bbox are skipped without opening them.
+
+    Files are read concurrently in a pool of threads.  Their data are combined
+    before decoding geometries, so that each column of the DataFrame is
+    allocated only once.
+
+    All files must have the same columns, data types, geometry encoding, and CRS.
+
+    Parameters
+    ----------
+    paths : str or list-like of str
+        Directory containing .feather files, glob pattern (e.g., "tiles/*.feather"),
+        or list of paths to feather files.  Files found from a directory or
+        glob pattern are read in sorted order.
+    columns : list-like (optional, default: None)
+        Subset of columns to read from each file, must include 'geometry'.  If not provided,
+        all columns are read.
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        If provided, only geometries whose bounds intersect bbox are returned;
+        see from_geofeather.
+    workers : int, optional (default: None)
+        Maximum number of threads used to read files.  If not provided, defaults
+        to the default for concurrent.futures.ThreadPoolExecutor.  If provided,
+        geometries are also decoded using this many threads; see the threads
+        option of from_geofeather.
+
+    Returns
+    -------
+    pandas.DataFrame
     """
 
     import_optional_dependency("pygeos", extra="pygeos is required for pygeos support.")
-    from pygeos import from_wkb
 
     if columns is not None and "geometry" not in columns:
         raise ValueError(
             "'geometry' must be included in list of columns to read from feather file"
         )
 
-    # shim to support files created with geofeather 0.1.0
-    if columns is not None and "wkb" not in columns:
-        columns.append("wkb")
+    table, crs = _read_geofeather_dataset(
+        paths, columns=columns, bbox=bbox, workers=workers
+    )
 
-    df, crs = _from_geofeather(path, columns=columns)
+    return _to_dataframe(table, crs, bbox=bbox, threads=workers)
 
-    # shim to support files created with geofeather 0.1.0
-    df = df.rename(columns={"wkb": "geometry"})
 
-    df["geometry"] = from_wkb(df.geometry)
+def to_geofeather_dataset(
+    df, root, crs=None, partition_by=None, grid=None, encoding="wkb", bounds=False
+):
+    """Serializes a pandas DataFrame containing pygeos geometries to a directory
+    of feather files, one per partition.
 
-    # add crs attribute to data frame
-    df.crs = crs
+    Rows are partitioned either by the values of one or more columns, or by the
+    tile of a regular grid that contains the center of the bounds of each
+    geometry.  Exactly one of partition_by or grid must be provided.
 
-    return df
+    Partitions are written to "part-00000.feather", "part-00001.feather", etc.
+    A manifest ("_manifest.json") lists the path, key, number of rows, and
+    bounds of each partition, as well as the CRS of the dataset.
+    read_geofeather_dataset uses the manifest to skip partitions that do not
+    intersect a bbox without opening them.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    root : str
+        directory to write files; created if it does not exist
+    crs : str or dict, optional (default: None)
+        GeoPandas CRS object
+    partition_by : str or list of str, optional (default: None)
+        column(s) used to partition rows; missing values are written to their
+        own partition
+    grid : float or tuple of (float, float), optional (default: None)
+        width and height of the tiles of a grid used to partition rows.  Tiles
+        are aligned to the origin of the coordinate system.  Missing and empty
+        geometries are written to their own partition.
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data; see to_geofeather.
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in each file; see
+        to_geofeather.
+    """
+
+    pygeos = import_optional_dependency(
+        "pygeos", extra="pygeos is required for pygeos support."
+    )
+
+    if encoding not in ENCODINGS:
+        raise ValueError("encoding must be one of {}".format(", ".join(ENCODINGS)))
+
+    crs = crs or getattr(df, "crs", None)
+
+    if encoding == "geoarrow":
+        # use the same coordinate encoding for all partitions
+        encoding = coords.get_encoding(df.geometry.values, pygeos)
+
+    def write(part, path, schema):
+        geometry, part_encoding = _encode_geometry(part, encoding)
+        _to_geofeather(
+            part,
+            path,
+            crs=crs,
+            geometry=geometry,
+            encoding=part_encoding,
+            bounds=_bounds(part) if bounds else None,
+            metadata=_geometry_metadata(part),
+            schema=schema,
+        )
+
+    _to_geofeather_dataset(
+        df,
+        root,
+        crs,
+        write,
+        _bounds(df),
+        partition_by=partition_by,
+        grid=grid,
+    )
+
+
+class GeoFeatherWriter(_GeoFeatherWriter):
+    """Serializes pandas DataFrames containing pygeos geometries to a single
+    feather file on disk, one chunk at a time.
+
+    Each chunk is encoded and appended to the file as one or more record batches,
+    so that the full dataset never needs to be held in memory.  All chunks must
+    have the same columns and data types as the first chunk, and the same CRS
+    as the file, if they have a crs attribute.
+
+    The CRS and geometry encoding are stored in the schema metadata of the file.
+    Since the schema is written with the first chunk, geometry types and total
+    bounds are not stored.
+
+    The index of each chunk is not written.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file to write
+    crs : str or dict, optional (default: None)
+        If not provided, the crs attribute of the first chunk is used, if present.
+    encoding : str, optional (default: "wkb")
+        Encoding of the geometry data; see to_geofeather.  When using "geoarrow",
+        the geometry type is determined from the first chunk, and geometries
+        are stored as multi part geometries (e.g., polygons as multipolygons),
+        so that later chunks may contain single or multi part geometries of
+        that type.
+    bounds : bool, optional (default: False)
+        If True, the bounds of each geometry are stored in a "bbox" column, and
+        the bounds of each record batch are stored in the metadata of that batch.
+    sindex : bool, optional (default: False)
+        If True, a spatial index of the bounds of all geometries is built and
+        stored in a .sindex file when the file is closed.  This implies
+        bounds=True.
+    compression : str, optional (default: None)
+    compression_level : int, optional (default: None)
+    chunksize : int, optional (default: None)
+        See to_geofeather.  Each chunk is split into record batches of at most
+        chunksize rows.  Dictionary encoding is not supported, since each chunk
+        would have a different dictionary.
+    precision : float, optional (default: None)
+        See to_geofeather.  The grid is centered on the first chunk, so
+        coordinates of all chunks must be within 2**31 cells of its center.
+    """
+
+    def __init__(
+        self,
+        path,
+        crs=None,
+        encoding="wkb",
+        bounds=False,
+        sindex=False,
+        compression=None,
+        compression_level=None,
+        chunksize=None,
+        precision=None,
+    ):
+        import_optional_dependency(
+            "pygeos", extra="pygeos is required for pygeos support."
+        )
+        super(GeoFeatherWriter, self).__init__(
+            path,
+            crs=crs,
+            encoding=encoding,
+            bounds=bounds,
+            sindex=sindex,
+            compression=compression,
+            compression_level=compression_level,
+            chunksize=chunksize,
+            precision=precision,
+        )
+
+    def _encode(self, df):
+        return _encode_geometry(df, self.encoding, quantize=self.quantize)
+
+    def _quantize(self, df):
+        return _quantize(df, self.precision)
+
+    def _bounds(self, df):
+        return _bounds(df)
+
+    def _get_crs(self, df):
+        return getattr(df, "crs", None)
+
+    def _get_encoding(self, df):
+        import pygeos
+
+        return coords.get_encoding(df.geometry.values, pygeos)
+
+
+def attach_geofeather(name, columns=None, bbox=None, threads=None):
+    """Read data published in shared memory by
+    geofeather.shared.publish_geofeather into a pandas DataFrame containing
+    pygeos geometries.
+
+    The shared file is memory mapped, so it is not read or decompressed again.
+
+    Parameters
+    ----------
+    name : str
+        name of the published data; see SharedGeoFeather.name
+    columns : list-like (optional, default: None)
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+    threads : int, optional (default: None)
+        See from_geofeather.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    return from_geofeather(
+        _attach_path(name), columns=columns, memory_map=True, bbox=bbox, threads=threads
+    )
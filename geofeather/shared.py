@@ -0,0 +1,193 @@
+"""Publish feather files in shared memory for use by multiple processes.
+
+A published file is read (and decompressed) once and stored as an uncompressed
+Arrow IPC file in shared memory ("/dev/shm" where available).  Processes
+attach to it by name, which memory maps it: attribute columns that can be
+converted without copying remain backed by the shared memory, and encoded
+geometries are decoded directly from it without reading or decompressing the
+file again.
+
+Geometry objects themselves cannot be shared between processes, so each
+process still decodes geometries.  Decoding coordinates is much faster than
+decoding WKB, so files can be converted to geoarrow encoding when published.
+"""
+
+import json
+import os
+import tempfile
+from uuid import uuid4
+
+import pyarrow as pa
+from pandas.compat._optional import import_optional_dependency
+
+from geofeather import coords
+from geofeather.core import (
+    METADATA_KEY,
+    _crs_to_json,
+    _get_metadata,
+    _read_geofeather,
+    _write_options,
+    _write_table,
+    from_geofeather,
+)
+
+# RAM-backed file system on Linux; elsewhere, fall back to temporary files,
+# which are still shared through the page cache of the operating system
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def _shared_path(name):
+    if not name or os.path.basename(name) != name:
+        raise ValueError("invalid name of shared file: {!r}".format(name))
+
+    return os.path.join(SHARED_DIR, "geofeather-{}.feather".format(name))
+
+
+def _attach_path(name):
+    """Get the path of data published with name, which must exist."""
+    path = _shared_path(name)
+    if not os.path.exists(path):
+        raise ValueError("no data published with name {!r}".format(name))
+
+    return path
+
+
+def _to_geoarrow(table):
+    """Convert WKB geometries of a Table to geoarrow encoding."""
+    shapely = import_optional_dependency(
+        "shapely",
+        extra="shapely >= 2.0 is required for geoarrow encoding.",
+        min_version="2.0",
+    )
+
+    index = table.column_names.index("geometry")
+    geometry = shapely.from_wkb(table.column(index).to_numpy(zero_copy_only=False))
+    geometry, encoding = coords.to_arrow(geometry, shapely)
+
+    metadata = _get_metadata(table.schema)
+    metadata["encoding"] = encoding
+    table = table.set_column(index, "geometry", geometry)
+
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[METADATA_KEY] = json.dumps(metadata).encode("UTF-8")
+    return table.replace_schema_metadata(schema_metadata)
+
+
+class SharedGeoFeather(object):
+    """A feather file published in shared memory by publish_geofeather.
+
+    The shared file is removed by unlink(), or when used as a context manager,
+    on exit.  Otherwise, it remains until the system is restarted.
+
+    Attributes
+    ----------
+    name : str
+        name used to attach to the shared file
+    path : str
+        path of the shared file
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.path = _shared_path(name)
+
+    def unlink(self):
+        """Remove the shared file.  Processes that have already attached to it
+        can continue to use it."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.unlink()
+
+    def __repr__(self):
+        return "SharedGeoFeather({!r})".format(self.name)
+
+
+def publish_geofeather(path, columns=None, encoding=None, name=None):
+    """Read a feather file once and publish it in shared memory.
+
+    Use attach_geofeather in other processes to read the published data.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file to read
+    columns : list-like (optional, default: None)
+        Subset of columns to publish, must include 'geometry'.  If not
+        provided, all columns are published.
+    encoding : str, optional (default: None)
+        If "geoarrow" and geometries are stored as WKB, these are converted to
+        coordinates, which are faster for each process to decode.  This
+        requires all geometries to be of the same type and shapely >= 2.0.  If
+        not provided, geometries are published with the encoding of the file.
+    name : str, optional (default: None)
+        Name used to attach to the published data.  If not provided, a unique
+        name is generated.
+
+    Returns
+    -------
+    SharedGeoFeather
+    """
+    if encoding not in (None, "geoarrow"):
+        raise ValueError("encoding must be None or 'geoarrow'")
+
+    if columns is not None and "geometry" not in columns:
+        raise ValueError("'geometry' must be included in list of columns to publish")
+
+    shared = SharedGeoFeather(name or uuid4().hex)
+
+    table, crs = _read_geofeather(path, columns=columns)
+
+    if (
+        encoding == "geoarrow"
+        and _get_metadata(table.schema).get("encoding", "wkb") == "wkb"
+    ):
+        table = _to_geoarrow(table)
+
+    metadata = _get_metadata(table.schema)
+
+    # store the CRS in the schema metadata, including for older files that
+    # stored it in a .crs file
+    metadata["crs"] = _crs_to_json(crs)
+    metadata.setdefault("encoding", "wkb")
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[METADATA_KEY] = json.dumps(metadata).encode("UTF-8")
+    table = table.replace_schema_metadata(schema_metadata)
+
+    # write to a temporary file first, so that processes never attach to a
+    # partially written file
+    tmp_path = "{}.{}.tmp".format(shared.path, os.getpid())
+    options = _write_options("uncompressed")
+    with pa.ipc.new_file(tmp_path, table.schema, options=options) as writer:
+        _write_table(writer, table)
+    os.replace(tmp_path, shared.path)
+
+    return shared
+
+
+def attach_geofeather(name, columns=None, bbox=None, threads=None):
+    """Read data published in shared memory by publish_geofeather into a
+    geopandas GeoDataFrame.
+
+    The shared file is memory mapped, so it is not read or decompressed again.
+
+    Parameters
+    ----------
+    name : str
+        name of the published data; see SharedGeoFeather.name
+    columns : list-like (optional, default: None)
+    bbox : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+    threads : int, optional (default: None)
+        See from_geofeather.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+    """
+    return from_geofeather(
+        _attach_path(name), columns=columns, memory_map=True, bbox=bbox, threads=threads
+    )
@@ -0,0 +1,335 @@
+"""Packed Hilbert R-tree spatial index over the bounds of geometries.
+
+The tree is stored in a sidecar file next to the feather file ("<path>.sindex"),
+as an uncompressed Arrow IPC file so that it can be memory mapped and loaded
+without rebuilding it.
+
+Items are sorted by the Hilbert distance of the center of their bounds and packed
+into nodes of ``node_size`` items; each level of the tree is stored after the
+level below it, with the root node last.  This follows the layout used by
+flatbush.
+"""
+
+import json
+import os
+
+import numpy as np
+import pyarrow as pa
+
+NODE_SIZE = 16
+
+# bits per dimension of the grid used to calculate Hilbert distances
+HILBERT_LEVEL = 16
+
+BOUNDS_FIELDS = ("xmin", "ymin", "xmax", "ymax")
+
+# key in the schema metadata of the sidecar file used to store tree metadata
+METADATA_KEY = b"geofeather.sindex"
+
+
+def _sindex_path(path):
+    return "{}.sindex".format(path)
+
+
+def hilbert_distance(bounds, total_bounds=None):
+    """Calculate the Hilbert distance of the center of each set of bounds.
+
+    Centers are scaled to a grid of 2**16 x 2**16 cells over total_bounds.
+
+    Parameters
+    ----------
+    bounds : ndarray of shape (n, 4)
+        xmin, ymin, xmax, ymax of each geometry; must not contain NaN
+    total_bounds : tuple of (xmin, ymin, xmax, ymax), optional (default: None)
+        bounds of the grid; if not provided, the total bounds of all bounds are used
+
+    Returns
+    -------
+    ndarray of uint32
+    """
+    bounds = np.asarray(bounds, dtype="float64").reshape(-1, 4)
+
+    if total_bounds is None:
+        if len(bounds) == 0:
+            return np.array([], dtype="uint32")
+
+        total_bounds = (
+            bounds[:, 0].min(),
+            bounds[:, 1].min(),
+            bounds[:, 2].max(),
+            bounds[:, 3].max(),
+        )
+
+    xmin, ymin, xmax, ymax = total_bounds
+    n = (1 << HILBERT_LEVEL) - 1
+    width = (xmax - xmin) or 1
+    height = (ymax - ymin) or 1
+
+    x = np.floor(n * ((bounds[:, 0] + bounds[:, 2]) / 2 - xmin) / width)
+    y = np.floor(n * ((bounds[:, 1] + bounds[:, 3]) / 2 - ymin) / height)
+
+    return _hilbert(
+        np.clip(x, 0, n).astype("uint32"), np.clip(y, 0, n).astype("uint32")
+    )
+
+
+def _hilbert(x, y):
+    """Vectorized Hilbert distance of 16 bit integer coordinates.
+
+    Adapted from https://github.com/rawrunprotected/hilbert_curves (public domain),
+    as used by flatbush.
+
+    The reference updates C and D with ``^=`` on scalars; here they are
+    rebound instead, because ``C ^=`` would modify the array that ``c`` refers
+    to before it is used to update D.
+    """
+    a = x ^ y
+    b = 0xFFFF ^ a
+    c = 0xFFFF ^ (x | y)
+    d = x & (y ^ 0xFFFF)
+
+    A = a | (b >> 1)
+    B = (a >> 1) ^ a
+    C = ((c >> 1) ^ (b & (d >> 1))) ^ c
+    D = ((a & (c >> 1)) ^ (d >> 1)) ^ d
+
+    a, b, c, d = A, B, C, D
+    A = (a & (a >> 2)) ^ (b & (b >> 2))
+    B = (a & (b >> 2)) ^ (b & ((a ^ b) >> 2))
+    C = C ^ ((a & (c >> 2)) ^ (b & (d >> 2)))
+    D = D ^ ((b & (c >> 2)) ^ ((a ^ b) & (d >> 2)))
+
+    a, b, c, d = A, B, C, D
+    A = (a & (a >> 4)) ^ (b & (b >> 4))
+    B = (a & (b >> 4)) ^ (b & ((a ^ b) >> 4))
+    C = C ^ ((a & (c >> 4)) ^ (b & (d >> 4)))
+    D = D ^ ((b & (c >> 4)) ^ ((a ^ b) & (d >> 4)))
+
+    a, b, c, d = A, B, C, D
+    C = C ^ ((a & (c >> 8)) ^ (b & (d >> 8)))
+    D = D ^ ((b & (c >> 8)) ^ ((a ^ b) & (d >> 8)))
+
+    a = C ^ (C >> 1)
+    b = D ^ (D >> 1)
+
+    i0 = x ^ y
+    i1 = b | (0xFFFF ^ (i0 | a))
+
+    def interleave(i):
+        i = (i | (i << 8)) & 0x00FF00FF
+        i = (i | (i << 4)) & 0x0F0F0F0F
+        i = (i | (i << 2)) & 0x33333333
+        i = (i | (i << 1)) & 0x55555555
+        return i
+
+    return ((interleave(i1) << 1) | interleave(i0)).astype("uint32")
+
+
+def _level_offsets(num_items, node_size):
+    """Calculate the position of the first node of each level of the tree.
+
+    Returns
+    -------
+    list of int
+        last entry is the total number of nodes
+    """
+    offsets = [0]
+    count = num_items
+    while True:
+        offsets.append(offsets[-1] + count)
+        if count <= 1:
+            break
+        count = -(-count // node_size)
+
+    return offsets
+
+
+class PackedRTree(object):
+    """Static packed Hilbert R-tree over the bounds of geometries.
+
+    Use PackedRTree.build() to create a tree from bounds, or read_sindex() to
+    load a tree stored alongside a feather file.
+
+    Parameters
+    ----------
+    boxes : ndarray of shape (num_nodes, 4)
+        bounds of every node in the tree, leaves first
+    ids : ndarray of int64
+        index of the item in each leaf node
+    node_size : int
+    batch_offsets : list of int, optional (default: None)
+        row offsets of each record batch in the associated feather file
+    """
+
+    def __init__(self, boxes, ids, node_size=NODE_SIZE, batch_offsets=None):
+        self.boxes = boxes
+        self.ids = ids
+        self.node_size = node_size
+        self.batch_offsets = batch_offsets
+        self._level_offsets = _level_offsets(len(ids), node_size)
+
+    @classmethod
+    def build(cls, bounds, node_size=NODE_SIZE, batch_offsets=None):
+        """Build a tree from the bounds of geometries.
+
+        Missing and empty geometries (bounds are NaN) are not indexed.
+
+        Parameters
+        ----------
+        bounds : ndarray of shape (n, 4)
+        node_size : int, optional (default: 16)
+        batch_offsets : list of int, optional (default: None)
+            row offsets of each record batch in the associated feather file
+
+        Returns
+        -------
+        PackedRTree
+        """
+        bounds = np.asarray(bounds, dtype="float64").reshape(-1, 4)
+
+        ids = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        ids = ids[np.argsort(hilbert_distance(bounds[ids]), kind="stable")]
+
+        levels = [bounds[ids]]
+        while len(levels[-1]) > 1:
+            children = levels[-1]
+            starts = np.arange(0, len(children), node_size)
+            levels.append(
+                np.column_stack(
+                    [
+                        np.minimum.reduceat(children[:, 0], starts),
+                        np.minimum.reduceat(children[:, 1], starts),
+                        np.maximum.reduceat(children[:, 2], starts),
+                        np.maximum.reduceat(children[:, 3], starts),
+                    ]
+                )
+            )
+
+        return cls(
+            np.concatenate(levels),
+            ids.astype("int64"),
+            node_size=node_size,
+            batch_offsets=batch_offsets,
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def query(self, bbox):
+        """Find the items whose bounds intersect a bounding box.
+
+        Parameters
+        ----------
+        bbox : tuple of (xmin, ymin, xmax, ymax)
+
+        Returns
+        -------
+        ndarray of int64
+            sorted indexes of the items
+        """
+        if len(self.ids) == 0:
+            return np.array([], dtype="int64")
+
+        offsets = self._level_offsets
+        top = len(offsets) - 2
+
+        nodes = np.arange(offsets[top], offsets[top + 1])
+        nodes = nodes[self._intersects(nodes, bbox)]
+
+        for level in range(top, 0, -1):
+            first = offsets[level - 1] + (nodes - offsets[level]) * self.node_size
+            children = (first[:, np.newaxis] + np.arange(self.node_size)).ravel()
+            children = children[children < offsets[level]]
+            nodes = children[self._intersects(children, bbox)]
+
+        return np.sort(self.ids[nodes])
+
+    def _intersects(self, nodes, bbox):
+        boxes = self.boxes[nodes]
+        return (
+            (boxes[:, 0] <= bbox[2])
+            & (boxes[:, 2] >= bbox[0])
+            & (boxes[:, 1] <= bbox[3])
+            & (boxes[:, 3] >= bbox[1])
+        )
+
+
+def write_sindex(tree, path):
+    """Write a tree to the sidecar file associated with a feather file.
+
+    Parameters
+    ----------
+    tree : PackedRTree
+    path : str
+        path to feather file
+    """
+    # leaf nodes store the index of their item; other nodes store -1
+    ids = np.full(len(tree.boxes), -1, dtype="int64")
+    ids[: len(tree.ids)] = tree.ids
+
+    table = pa.Table.from_arrays(
+        [pa.array(tree.boxes[:, i]) for i in range(4)] + [pa.array(ids)],
+        names=list(BOUNDS_FIELDS) + ["id"],
+    )
+    table = table.replace_schema_metadata(
+        {
+            METADATA_KEY: json.dumps(
+                {
+                    "node_size": tree.node_size,
+                    "num_items": len(tree.ids),
+                    "batch_offsets": tree.batch_offsets,
+                }
+            ).encode("UTF-8")
+        }
+    )
+
+    # not compressed, so that it can be memory mapped without copying
+    with pa.ipc.new_file(_sindex_path(path), table.schema) as writer:
+        writer.write_table(table)
+
+
+def read_sindex(path):
+    """Read the tree stored alongside a feather file.
+
+    The tree is memory mapped, so loading it only requires copying its arrays.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file
+
+    Returns
+    -------
+    PackedRTree or None
+        None if the feather file does not have a spatial index
+    """
+    filename = _sindex_path(path)
+    if not os.path.exists(filename):
+        return None
+
+    with pa.memory_map(filename) as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    metadata = json.loads(table.schema.metadata[METADATA_KEY])
+    boxes = np.column_stack([table.column(name).to_numpy() for name in BOUNDS_FIELDS])
+    ids = table.column("id").to_numpy()[: metadata["num_items"]]
+
+    return PackedRTree(
+        boxes,
+        ids,
+        node_size=metadata["node_size"],
+        batch_offsets=metadata["batch_offsets"],
+    )
+
+
+def remove_sindex(path):
+    """Remove the tree stored alongside a feather file, if it exists.
+
+    Parameters
+    ----------
+    path : str
+        path to feather file
+    """
+    filename = _sindex_path(path)
+    if os.path.exists(filename):
+        os.remove(filename)
@@ -0,0 +1,207 @@
+"""Timings and sizes of the phases of reading and writing feather files.
+
+Use record_stats() to record a GeoFeatherStats object for each call to
+to_geofeather, from_geofeather, read_geofeather_dataset, to_geoparquet, and
+from_geoparquet (in geofeather and geofeather.pygeos) made within its context:
+
+>>> with record_stats() as stats:
+...     df = from_geofeather("test.feather")
+>>> stats[0].durations
+{'read': 0.01, 'crs': 0.001, 'to_pandas': 0.002, 'decode': 0.05}
+
+Phases of reading:
+- "read": reading (and decompressing) the file into Arrow
+- "crs": reading and parsing the CRS
+- "to_pandas": converting attribute columns to pandas
+- "decode": decoding geometries
+- "filter": selecting rows that match filters, and filtering decoded
+  geometries by bbox, for files without bounds
+
+Phases of writing:
+- "bounds": calculating bounds and geometry types
+- "sort": sorting rows, if sort is used
+- "encode": encoding geometries
+- "to_arrow": converting the DataFrame to Arrow
+- "write": writing (and compressing) the file
+- "sindex": building and writing the spatial index
+
+Stats are only recorded for the outermost call, and calls made in other
+threads (e.g., from threads created by read_geofeather_dataset) are not
+recorded separately.  When not recording, the overhead of each phase is a
+single context variable lookup.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import inspect
+import time
+
+# callback that receives the stats of each call; set by record_stats
+_recorder = ContextVar("geofeather_recorder", default=None)
+
+# stats of the call in progress
+_active = ContextVar("geofeather_stats", default=None)
+
+
+class GeoFeatherStats(object):
+    """Durations and sizes of the phases of a single read or write call.
+
+    Attributes
+    ----------
+    operation : str
+        name of the function called, e.g., "from_geofeather"
+    path : str
+        path (or paths) passed to the function
+    durations : dict
+        duration of each phase in seconds; see geofeather.stats
+    duration : float
+        total duration of the call in seconds
+    rows : int
+        number of rows read or written
+    file_size : int
+        size of files read or written in bytes
+    arrow_bytes : int
+        size of the (uncompressed) Arrow data read or written in bytes
+    dataframe_bytes : int
+        memory used by the DataFrame returned or written in bytes, excluding
+        the contents of object columns (e.g., geometries)
+    """
+
+    def __init__(self, operation, path):
+        self.operation = operation
+        self.path = path
+        self.durations = {}
+        self.duration = None
+        self.rows = None
+        self.file_size = None
+        self.arrow_bytes = None
+        self.dataframe_bytes = None
+
+    def to_dict(self):
+        """Convert to a dict, e.g., for logging as JSON.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "operation": self.operation,
+            "path": self.path,
+            "durations": dict(self.durations),
+            "duration": self.duration,
+            "rows": self.rows,
+            "file_size": self.file_size,
+            "arrow_bytes": self.arrow_bytes,
+            "dataframe_bytes": self.dataframe_bytes,
+        }
+
+    def __repr__(self):
+        return "GeoFeatherStats({})".format(
+            ", ".join("{}={!r}".format(k, v) for k, v in self.to_dict().items())
+        )
+
+
+@contextmanager
+def record_stats(callback=None):
+    """Record the stats of each read or write call made within this context.
+
+    Parameters
+    ----------
+    callback : callable, optional (default: None)
+        If provided, called with the GeoFeatherStats of each call when the call
+        completes.
+
+    Yields
+    ------
+    list of GeoFeatherStats
+        stats of each call, in the order in which calls completed
+    """
+    records = []
+
+    def record(stats):
+        records.append(stats)
+        if callback is not None:
+            callback(stats)
+
+    token = _recorder.set(record)
+    try:
+        yield records
+    finally:
+        _recorder.reset(token)
+
+
+def current_stats():
+    """Get the stats of the call in progress.
+
+    Returns
+    -------
+    GeoFeatherStats or None
+        None if stats are not being recorded
+    """
+    return _active.get()
+
+
+@contextmanager
+def phase(name):
+    """Add the duration of the enclosed block to a phase of the call in progress.
+
+    Parameters
+    ----------
+    name : str
+    """
+    stats = _active.get()
+    if stats is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.durations[name] = (
+            stats.durations.get(name, 0) + time.perf_counter() - start
+        )
+
+
+def _dataframe_bytes(df):
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+def instrument(func):
+    """Record the stats of calls to a read or write function.
+
+    The function must have a "path" or "paths" parameter.  If it has a "df"
+    parameter, it writes df; otherwise, it returns a DataFrame.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        record = _recorder.get()
+        if record is None or _active.get() is not None:
+            return func(*args, **kwargs)
+
+        arguments = signature.bind(*args, **kwargs).arguments
+        path = arguments.get("path", arguments.get("paths"))
+        stats = GeoFeatherStats(
+            func.__name__, path if isinstance(path, (list, tuple)) else str(path)
+        )
+
+        token = _active.set(stats)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            stats.duration = time.perf_counter() - start
+            _active.reset(token)
+
+        df = arguments["df"] if "df" in arguments else result
+        stats.rows = len(df)
+        stats.dataframe_bytes = _dataframe_bytes(df)
+
+        record(stats)
+
+        return result
+
+    return wrapper
@@ -12,7 +12,8 @@ setup(
     description="Fast file-based format for geometries with Geopandas",
     long_description_content_type="text/markdown",
     long_description=open("README.md").read(),
-    install_requires=["pyarrow>=0.17", "geopandas>=0.8"],
+    python_requires=">=3.8",
+    install_requires=["pyarrow>=14", "geopandas>=0.8"],
     tests_require=["pygeos", "pytest", "pytest-cov", "pytest-benchmark"],
     include_package_data=True,
 )
@@ -1,4 +1,8 @@
+import os
+import tracemalloc
+
 import geopandas as gp
+import numpy as np
 import pytest
 
 from geofeather import to_geofeather, from_geofeather
@@ -54,6 +58,16 @@ def test_polygons_read_benchmark(tmpdir, polygons_wgs84, benchmark):
     benchmark(from_geofeather, filename)
 
 
+@pytest.mark.benchmark(group="read-polygons")
+def test_polygons_read_threads_benchmark(tmpdir, polygons_wgs84, benchmark):
+    """Test performance of reading feather files using multiple threads"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    benchmark(from_geofeather, filename, threads=4)
+
+
 @pytest.mark.benchmark(group="read-polygons")
 def test_polygons_gp_read_file_benchmark(tmpdir, polygons_wgs84, benchmark):
     """Test performance of Geopandas to_file function for shapefiles"""
@@ -64,6 +78,16 @@ def test_polygons_gp_read_file_benchmark(tmpdir, polygons_wgs84, benchmark):
     benchmark(gp.read_file, filename)
 
 
+@pytest.mark.benchmark(group="read-points")
+def test_points_geoarrow_read_benchmark(tmpdir, points_wgs84, benchmark):
+    """Test performance of reading feather files with geoarrow encoding"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(points_wgs84, filename, encoding="geoarrow")
+
+    benchmark(from_geofeather, filename)
+
+
 @pytest.mark.benchmark(group="write-points")
 def test_points_write_benchmark(tmpdir, points_wgs84, benchmark):
     """Test performance of writing geofeather files"""
@@ -72,6 +96,18 @@ def test_points_write_benchmark(tmpdir, points_wgs84, benchmark):
     benchmark(to_geofeather, points_wgs84, filename)
 
 
+@pytest.mark.benchmark(group="write-points")
+def test_points_write_per_row_wkb_benchmark(
+    tmpdir, points_wgs84, benchmark, monkeypatch
+):
+    """Test performance of writing geofeather files using per-row WKB encoding"""
+
+    monkeypatch.setattr("geofeather.core.to_wkb", None)
+
+    filename = tmpdir / "points_wgs84.feather"
+    benchmark(to_geofeather, points_wgs84, filename)
+
+
 @pytest.mark.benchmark(group="write-points")
 def test_points_gp_to_file_benchmark(tmpdir, points_wgs84, benchmark):
     """Test performance of Geopandas to_file function for shapefiles"""
@@ -80,6 +116,16 @@ def test_points_gp_to_file_benchmark(tmpdir, points_wgs84, benchmark):
     benchmark(points_wgs84.to_file, filename)
 
 
+@pytest.mark.benchmark(group="read-lines")
+def test_lines_geoarrow_read_benchmark(tmpdir, lines_wgs84, benchmark):
+    """Test performance of reading feather files with geoarrow encoding"""
+
+    filename = tmpdir / "lines_wgs84.feather"
+    to_geofeather(lines_wgs84, filename, encoding="geoarrow")
+
+    benchmark(from_geofeather, filename)
+
+
 @pytest.mark.benchmark(group="write-lines")
 def test_lines_write_benchmark(tmpdir, lines_wgs84, benchmark):
     """Test performance of writing geofeather files"""
@@ -88,6 +134,16 @@ def test_lines_write_benchmark(tmpdir, lines_wgs84, benchmark):
     benchmark(to_geofeather, lines_wgs84, filename)
 
 
+@pytest.mark.benchmark(group="write-lines")
+def test_lines_write_per_row_wkb_benchmark(tmpdir, lines_wgs84, benchmark, monkeypatch):
+    """Test performance of writing geofeather files using per-row WKB encoding"""
+
+    monkeypatch.setattr("geofeather.core.to_wkb", None)
+
+    filename = tmpdir / "lines_wgs84.feather"
+    benchmark(to_geofeather, lines_wgs84, filename)
+
+
 @pytest.mark.benchmark(group="write-lines")
 def test_lines_gp_to_file_benchmark(tmpdir, lines_wgs84, benchmark):
     """Test performance of Geopandas to_file function for shapefiles"""
@@ -96,6 +152,16 @@ def test_lines_gp_to_file_benchmark(tmpdir, lines_wgs84, benchmark):
     benchmark(lines_wgs84.to_file, filename)
 
 
+@pytest.mark.benchmark(group="read-polygons")
+def test_polygons_geoarrow_read_benchmark(tmpdir, polygons_wgs84, benchmark):
+    """Test performance of reading feather files with geoarrow encoding"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, encoding="geoarrow")
+
+    benchmark(from_geofeather, filename)
+
+
 @pytest.mark.benchmark(group="write-polygons")
 def test_polygons_write_benchmark(tmpdir, polygons_wgs84, benchmark):
     """Test performance of writing geofeather files"""
@@ -104,6 +170,18 @@ def test_polygons_write_benchmark(tmpdir, polygons_wgs84, benchmark):
     benchmark(to_geofeather, polygons_wgs84, filename)
 
 
+@pytest.mark.benchmark(group="write-polygons")
+def test_polygons_write_per_row_wkb_benchmark(
+    tmpdir, polygons_wgs84, benchmark, monkeypatch
+):
+    """Test performance of writing geofeather files using per-row WKB encoding"""
+
+    monkeypatch.setattr("geofeather.core.to_wkb", None)
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    benchmark(to_geofeather, polygons_wgs84, filename)
+
+
 @pytest.mark.benchmark(group="write-polygons")
 def test_polygons_gp_to_file_benchmark(tmpdir, polygons_wgs84, benchmark):
     """Test performance of Geopandas to_file function for shapefiles"""
@@ -111,3 +189,60 @@ def test_polygons_gp_to_file_benchmark(tmpdir, polygons_wgs84, benchmark):
     filename = str(tmpdir / "polygons_wgs84.shp")
     benchmark(polygons_wgs84.to_file, filename)
 
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+@pytest.mark.parametrize("fixture", ["points_wgs84", "lines_wgs84", "polygons_wgs84"])
+def test_compression_write_benchmark(tmpdir, fixture, compression, request, benchmark):
+    """Test performance of writing feather files with each compression codec"""
+
+    df = request.getfixturevalue(fixture)
+    benchmark.group = "write-compression-{}".format(fixture.split("_")[0])
+
+    filename = tmpdir / "{}.feather".format(fixture)
+    benchmark(to_geofeather, df, filename, compression=compression)
+
+    benchmark.extra_info["size"] = os.path.getsize(filename)
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+@pytest.mark.parametrize("fixture", ["points_wgs84", "lines_wgs84", "polygons_wgs84"])
+def test_compression_read_benchmark(tmpdir, fixture, compression, request, benchmark):
+    """Test performance of reading feather files with each compression codec"""
+
+    df = request.getfixturevalue(fixture)
+    benchmark.group = "read-compression-{}".format(fixture.split("_")[0])
+
+    filename = tmpdir / "{}.feather".format(fixture)
+    to_geofeather(df, filename, compression=compression)
+    benchmark.extra_info["size"] = os.path.getsize(filename)
+
+    benchmark(from_geofeather, filename)
+
+
+@pytest.mark.benchmark(group="write-memory")
+def test_write_peak_memory_benchmark(tmpdir, benchmark):
+    """Test peak memory allocated while writing a GeoDataFrame with many
+    numeric attribute columns, which must not be copied"""
+
+    size = 100000
+    df = gp.GeoDataFrame(
+        {"a{}".format(i): np.random.random(size) for i in range(10)},
+        geometry=gp.points_from_xy(np.random.random(size), np.random.random(size)),
+        crs="EPSG:4326",
+    )
+    attribute_size = df.drop(columns=["geometry"]).memory_usage(index=False).sum()
+
+    filename = tmpdir / "points.feather"
+
+    tracemalloc.start()
+    try:
+        to_geofeather(df, filename)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info["peak_memory"] = peak
+    benchmark.extra_info["attribute_size"] = int(attribute_size)
+    assert peak < attribute_size
+
+    benchmark(to_geofeather, df, filename)
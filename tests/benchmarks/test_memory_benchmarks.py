@@ -0,0 +1,223 @@
+"""Benchmarks of memory usage and throughput of reading and writing feather files.
+
+Each benchmark records the following in extra_info, which is included in the
+JSON output of pytest-benchmark (use --benchmark-json=<filename>):
+
+- rows: number of rows read or written
+- file_size: size of the feather file in bytes
+- peak_tracemalloc: peak memory allocated by Python and numpy during the operation
+- peak_rss: increase in the peak resident set size of the process during the
+  operation, which includes memory allocated by pyarrow and GEOS
+- rows_per_second, mb_per_second: throughput based on the fastest round
+
+Memory is measured in a forked process, so that each operation starts from the
+same baseline.
+
+By default, data frames of 100,000 rows are used.  Set
+GEOFEATHER_BENCHMARK_SIZES to a comma-separated list of sizes to benchmark
+larger data frames, e.g.:
+
+GEOFEATHER_BENCHMARK_SIZES=100000,1000000,10000000 pytest tests/benchmarks/test_memory_benchmarks.py --benchmark-json=memory.json
+"""
+
+from functools import lru_cache
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+import geopandas as gp
+import numpy as np
+from pandas import DataFrame
+import pygeos as pg
+import pytest
+import shapely
+
+import geofeather
+import geofeather.pygeos
+
+SIZES = [
+    int(size)
+    for size in os.environ.get("GEOFEATHER_BENCHMARK_SIZES", "100000").split(",")
+]
+
+# number of vertices of each line and of the ring of each polygon
+NUM_VERTICES = 16
+
+ROUNDS = 3
+
+
+def generate_geometries(lib, geometry_type, size):
+    """Generate an array of geometries in geographic coordinates.
+
+    Parameters
+    ----------
+    lib : module
+        shapely or pygeos
+    geometry_type : str
+        "points", "lines", or "polygons"
+    size : int
+
+    Returns
+    -------
+    ndarray of geometry objects
+    """
+    rng = np.random.RandomState(0)
+    x = rng.uniform(-180, 180, size)
+    y = rng.uniform(-90, 90, size)
+
+    if geometry_type == "points":
+        return lib.points(x, y)
+
+    indices = np.repeat(np.arange(size), NUM_VERTICES)
+
+    if geometry_type == "lines":
+        steps = rng.uniform(-0.01, 0.01, (size, NUM_VERTICES, 2)).cumsum(axis=1)
+        coords = (steps + np.column_stack([x, y])[:, np.newaxis]).reshape(-1, 2)
+        return lib.linestrings(coords, indices=indices)
+
+    # regular polygons, closed by linearrings
+    angles = np.linspace(0, 2 * np.pi, NUM_VERTICES, endpoint=False)
+    ring = np.column_stack([np.cos(angles), np.sin(angles)]) * 0.01
+    coords = (ring + np.column_stack([x, y])[:, np.newaxis]).reshape(-1, 2)
+    return lib.polygons(lib.linearrings(coords, indices=indices))
+
+
+@lru_cache(maxsize=1)
+def generate_frame(mode, geometry_type, size):
+    """Generate a data frame with attributes and geometries.
+
+    Parameters
+    ----------
+    mode : str
+        "core" for a GeoDataFrame of shapely geometries, or "pygeos" for a
+        DataFrame of pygeos geometries
+    geometry_type : str
+        "points", "lines", or "polygons"
+    size : int
+
+    Returns
+    -------
+    geopandas.GeoDataFrame or pandas.DataFrame
+    """
+    rng = np.random.RandomState(0)
+    df = DataFrame(
+        {
+            "i": rng.randint(-32767, 32767, size=size),
+            "value": rng.random_sample(size),
+            "category": np.array(["a", "b", "c", "d"])[rng.randint(0, 4, size=size)],
+        }
+    )
+
+    if mode == "core":
+        geometry = generate_geometries(shapely, geometry_type, size)
+        return gp.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
+
+    df["geometry"] = generate_geometries(pg, geometry_type, size)
+    return df
+
+
+def _max_rss():
+    """Peak resident set size of the current process in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _measure(conn, func, args, kwargs):
+    rss = _max_rss()
+    tracemalloc.start()
+    func(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    conn.send({"peak_tracemalloc": peak, "peak_rss": _max_rss() - rss})
+    conn.close()
+
+
+def measure_memory(func, *args, **kwargs):
+    """Measure the peak memory used by calling func in a forked process.
+
+    Returns
+    -------
+    dict
+        "peak_tracemalloc" and "peak_rss" in bytes
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("measuring memory requires forking processes")
+
+    context = multiprocessing.get_context("fork")
+    parent, child = context.Pipe(duplex=False)
+    process = context.Process(target=_measure, args=(child, func, args, kwargs))
+    process.start()
+    result = parent.recv()
+    process.join()
+
+    return result
+
+
+def run_benchmark(benchmark, func, args, kwargs, size, filename):
+    """Benchmark the time and memory used by func, and record them in the
+    extra_info of the benchmark."""
+
+    timings = []
+
+    def timed():
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+
+    benchmark.pedantic(timed, rounds=ROUNDS, iterations=1)
+
+    seconds = min(timings)
+    file_size = os.path.getsize(filename)
+
+    benchmark.extra_info["rows"] = size
+    benchmark.extra_info["file_size"] = file_size
+    benchmark.extra_info["rows_per_second"] = size / seconds
+    benchmark.extra_info["mb_per_second"] = file_size / seconds / 1e6
+    benchmark.extra_info.update(measure_memory(func, *args, **kwargs))
+
+
+def write(mode, df, filename):
+    if mode == "core":
+        geofeather.to_geofeather(df, filename)
+    else:
+        geofeather.pygeos.to_geofeather(df, filename, crs="EPSG:4326")
+
+
+def read(mode, filename):
+    if mode == "core":
+        geofeather.from_geofeather(filename)
+    else:
+        geofeather.pygeos.from_geofeather(filename)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("geometry_type", ["points", "lines", "polygons"])
+@pytest.mark.parametrize("mode", ["core", "pygeos"])
+def test_write_memory_benchmark(tmpdir, mode, geometry_type, size, benchmark):
+    """Test memory usage and throughput of writing feather files"""
+
+    benchmark.group = "memory-write-{}-{}".format(geometry_type, size)
+
+    df = generate_frame(mode, geometry_type, size)
+    filename = str(tmpdir / "{}.feather".format(geometry_type))
+
+    run_benchmark(benchmark, write, (mode, df, filename), {}, size, filename)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("geometry_type", ["points", "lines", "polygons"])
+@pytest.mark.parametrize("mode", ["core", "pygeos"])
+def test_read_memory_benchmark(tmpdir, mode, geometry_type, size, benchmark):
+    """Test memory usage and throughput of reading feather files"""
+
+    benchmark.group = "memory-read-{}-{}".format(geometry_type, size)
+
+    filename = str(tmpdir / "{}.feather".format(geometry_type))
+    write(mode, generate_frame(mode, geometry_type, size), filename)
+
+    run_benchmark(benchmark, read, (mode, filename), {}, size, filename)
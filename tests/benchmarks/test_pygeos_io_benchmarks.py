@@ -1,4 +1,9 @@
+import tracemalloc
+
 import geopandas as gp
+import numpy as np
+from pandas import DataFrame
+import pygeos as pg
 import pytest
 
 from geofeather.pygeos import to_geofeather, from_geofeather
@@ -34,6 +39,16 @@ def test_polygons_pygeos_read_benchmark(tmpdir, pg_polygons_wgs84, benchmark):
     benchmark(from_geofeather, filename)
 
 
+@pytest.mark.benchmark(group="read-points")
+def test_points_pygeos_geoarrow_read_benchmark(tmpdir, pg_points_wgs84, benchmark):
+    """Test performance of reading feather files with geoarrow encoding"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(pg_points_wgs84, filename, encoding="geoarrow")
+
+    benchmark(from_geofeather, filename)
+
+
 @pytest.mark.benchmark(group="write-points")
 def test_points_pygeos_write_benchmark(tmpdir, pg_points_wgs84, benchmark):
     """Test performance of writing geofeather files"""
@@ -42,6 +57,16 @@ def test_points_pygeos_write_benchmark(tmpdir, pg_points_wgs84, benchmark):
     benchmark(to_geofeather, pg_points_wgs84, filename)
 
 
+@pytest.mark.benchmark(group="read-lines")
+def test_lines_pygeos_geoarrow_read_benchmark(tmpdir, pg_lines_wgs84, benchmark):
+    """Test performance of reading feather files with geoarrow encoding"""
+
+    filename = tmpdir / "lines_wgs84.feather"
+    to_geofeather(pg_lines_wgs84, filename, encoding="geoarrow")
+
+    benchmark(from_geofeather, filename)
+
+
 @pytest.mark.benchmark(group="write-lines")
 def test_lines_pygeos_write_benchmark(tmpdir, pg_lines_wgs84, benchmark):
     """Test performance of writing geofeather files"""
@@ -50,9 +75,45 @@ def test_lines_pygeos_write_benchmark(tmpdir, pg_lines_wgs84, benchmark):
     benchmark(to_geofeather, pg_lines_wgs84, filename)
 
 
+@pytest.mark.benchmark(group="read-polygons")
+def test_polygons_pygeos_geoarrow_read_benchmark(tmpdir, pg_polygons_wgs84, benchmark):
+    """Test performance of reading feather files with geoarrow encoding"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(pg_polygons_wgs84, filename, encoding="geoarrow")
+
+    benchmark(from_geofeather, filename)
+
+
 @pytest.mark.benchmark(group="write-polygons")
 def test_polygons_pygeos_write_benchmark(tmpdir, pg_polygons_wgs84, benchmark):
     """Test performance of writing geofeather files"""
 
     filename = tmpdir / "polygons_wgs84.feather"
     benchmark(to_geofeather, pg_polygons_wgs84, filename)
+
+
+@pytest.mark.benchmark(group="write-memory")
+def test_write_pygeos_peak_memory_benchmark(tmpdir, benchmark):
+    """Test peak memory allocated while writing a DataFrame with many numeric
+    attribute columns, which must not be copied"""
+
+    size = 100000
+    df = DataFrame({"a{}".format(i): np.random.random(size) for i in range(10)})
+    attribute_size = df.memory_usage(index=False).sum()
+    df["geometry"] = pg.points(np.random.random(size), np.random.random(size))
+
+    filename = tmpdir / "points.feather"
+
+    tracemalloc.start()
+    try:
+        to_geofeather(df, filename, crs="EPSG:4326")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info["peak_memory"] = peak
+    benchmark.extra_info["attribute_size"] = int(attribute_size)
+    assert peak < attribute_size
+
+    benchmark(to_geofeather, df, filename, crs="EPSG:4326")
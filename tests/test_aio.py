@@ -0,0 +1,110 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from geofeather import aio, iter_geofeather
+import geofeather.pygeos
+from pandas import concat
+from pandas.testing import assert_frame_equal
+import pytest
+
+
+def test_read_write(tmpdir, polygons_wgs84):
+    """Confirm that files can be read and written concurrently"""
+
+    filenames = [tmpdir / "polygons_{}.feather".format(i) for i in range(4)]
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            await asyncio.gather(
+                *[
+                    aio.to_geofeather(polygons_wgs84, filename, executor=executor)
+                    for filename in filenames
+                ]
+            )
+            return await asyncio.gather(
+                *[
+                    aio.from_geofeather(filename, executor=executor, threads=2)
+                    for filename in filenames
+                ],
+                aio.read_geofeather_dataset(filenames),
+            )
+
+    *results, dataset = asyncio.run(main())
+
+    for df in results:
+        assert_frame_equal(df, polygons_wgs84)
+
+    assert len(dataset) == 4 * len(polygons_wgs84)
+
+
+def test_run_pygeos(tmpdir, pg_polygons_wgs84):
+    filename = tmpdir / "polygons_wgs84.feather"
+
+    async def main():
+        await aio.run(
+            geofeather.pygeos.to_geofeather,
+            pg_polygons_wgs84,
+            filename,
+            crs="EPSG:4326",
+        )
+        return await aio.run(geofeather.pygeos.from_geofeather, filename)
+
+    df = asyncio.run(main())
+    assert len(df) == len(pg_polygons_wgs84)
+
+
+def test_iter_geofeather(tmpdir, polygons_wgs84):
+    """Confirm that batches are read ahead of the consumer, but only up to
+    max_pending batches"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    geofeather.to_geofeather(polygons_wgs84, filename, chunksize=100)
+
+    read = []
+    closed = []
+
+    def counting_iter(path, **kwargs):
+        try:
+            for df in iter_geofeather(path, **kwargs):
+                read.append(len(df))
+                yield df
+        finally:
+            closed.append(True)
+
+    async def consume(stop=None):
+        dfs = []
+        async for df in aio.iter_geofeather(
+            filename, max_pending=1, iter_func=counting_iter
+        ):
+            # give the producer time to read ahead
+            await asyncio.sleep(0.05)
+            # read: batches consumed, this batch, one batch in the queue, and
+            # one batch waiting to be queued
+            assert len(read) <= len(dfs) + 3
+            dfs.append(df)
+            if stop is not None and len(dfs) == stop:
+                break
+
+        return dfs
+
+    dfs = asyncio.run(consume())
+    assert len(dfs) == 10
+    assert_frame_equal(concat(dfs, ignore_index=True), polygons_wgs84)
+    assert closed == [True]
+
+    # stopping early closes the file
+    read.clear()
+    closed.clear()
+    dfs = asyncio.run(consume(stop=2))
+    assert len(dfs) == 2
+    assert len(read) < 10
+    assert closed == [True]
+
+
+def test_iter_geofeather_error(tmpdir):
+    async def main():
+        async for _ in aio.iter_geofeather(tmpdir / "missing.feather"):
+            pass
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(main())
@@ -0,0 +1,105 @@
+import os
+
+import geofeather.pygeos
+from geofeather import to_geofeather, GeoFeatherCache
+from pandas.testing import assert_frame_equal
+
+
+def test_cache(tmpdir, polygons_wgs84):
+    """Confirm that repeated reads are returned from the cache"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    cache = GeoFeatherCache()
+    df = cache.from_geofeather(filename)
+    assert_frame_equal(df, polygons_wgs84)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # modifying returned DataFrames does not modify the cache
+    df["new"] = 1
+    df.loc[0, "labels"] = "modified"
+    df.loc[1, "geometry"] = None
+    df = cache.from_geofeather(filename)
+    assert_frame_equal(df, polygons_wgs84)
+    assert df.crs == polygons_wgs84.crs
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # columns and bbox are part of the key
+    cache.from_geofeather(filename, columns=["labels", "geometry"])
+    cache.from_geofeather(filename, bbox=(-10, -10, 10, 10))
+    cache.from_geofeather(filename, bbox=(-10, -10, 10, 10), threads=2)
+    cache.from_geofeather(filename, filters=[("labels", "==", "a")])
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert len(cache) == 4
+    assert cache.size > 0
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_cache_stale(tmpdir, polygons_wgs84):
+    """Confirm that results for files that changed are not returned"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    cache = GeoFeatherCache()
+    cache.from_geofeather(filename)
+    cache.from_geofeather(filename, columns=["labels"])
+
+    to_geofeather(polygons_wgs84.iloc[:10], filename)
+    # make sure modification time changes on file systems with coarse times
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    df = cache.from_geofeather(filename)
+    assert len(df) == 10
+    assert cache.misses == 3
+    assert len(cache) == 1
+
+
+def test_cache_eviction(tmpdir, polygons_wgs84):
+    """Confirm that least recently used results are evicted to stay within budget"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    cache = GeoFeatherCache()
+    cache.from_geofeather(filename, columns=["labels", "geometry"])
+    size = cache.size
+
+    cache = GeoFeatherCache(max_bytes=int(size * 2.5))
+    for _ in range(2):
+        # each bbox includes all rows, so results are the same size
+        for bbox in [(-180, -90, 180, 90), (-181, -90, 180, 90), (-182, -90, 180, 90)]:
+            cache.from_geofeather(filename, columns=["labels", "geometry"], bbox=bbox)
+
+    assert cache.size <= cache.max_bytes
+    assert len(cache) == 2
+    # each result was evicted before it was read again
+    assert cache.hits == 0
+
+    cache.from_geofeather(
+        filename, columns=["labels", "geometry"], bbox=(-182, -90, 180, 90)
+    )
+    assert cache.hits == 1
+
+    # results larger than the budget are not cached
+    cache = GeoFeatherCache(max_bytes=10)
+    cache.from_geofeather(filename)
+    assert len(cache) == 0
+
+
+def test_cache_pygeos(tmpdir, pg_polygons_wgs84):
+    filename = tmpdir / "polygons_wgs84.feather"
+    geofeather.pygeos.to_geofeather(pg_polygons_wgs84, filename, crs="EPSG:4326")
+
+    cache = GeoFeatherCache(read=geofeather.pygeos.from_geofeather)
+    cache.from_geofeather(filename)
+    df = cache.from_geofeather(filename)
+
+    assert cache.hits == 1
+    assert len(df) == len(pg_polygons_wgs84)
+    assert df.crs == "EPSG:4326"
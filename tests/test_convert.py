@@ -0,0 +1,81 @@
+import json
+import os
+
+from geofeather import to_geofeather, from_geofeather
+from geofeather.convert import convert_geofeather, main
+import geopandas
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+import pytest
+
+
+@pytest.mark.parametrize("format", ["feather", "parquet"])
+def test_convert_geofeather(tmpdir, polygons_wgs84, format):
+    """Confirm that converted files can be read by geopandas"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, sindex=True, chunksize=300)
+
+    dst = tmpdir / "converted.{}".format(format)
+    stats = convert_geofeather(filename, dst, format=format)
+    assert stats.rows == len(polygons_wgs84)
+    assert stats.file_size == os.path.getsize(filename)
+
+    read = geopandas.read_feather if format == "feather" else geopandas.read_parquet
+    df = read(str(dst))
+    assert_frame_equal(df, polygons_wgs84)
+    assert df.crs == polygons_wgs84.crs
+
+
+def test_convert_legacy(tmpdir, points_wgs84):
+    """Confirm that files created with geofeather < 0.4 are converted with the
+    CRS from their .crs file"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    legacy = DataFrame(points_wgs84.copy())
+    legacy["wkb"] = points_wgs84.geometry.to_wkb()
+    legacy.drop(columns=["geometry"]).to_feather(filename)
+    with open("{}.crs".format(filename), "w") as crsfile:
+        crsfile.write(json.dumps({"wkt": points_wgs84.crs.to_wkt()}))
+
+    dst = tmpdir / "converted.feather"
+    convert_geofeather(filename, dst)
+
+    df = geopandas.read_feather(str(dst))
+    assert df.geometry.equals(points_wgs84.geometry)
+    assert df.crs == points_wgs84.crs
+
+
+def test_convert_geofeather_errors(tmpdir, polygons_wgs84):
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, encoding="geoarrow")
+
+    with pytest.raises(ValueError, match="only WKB geometries can be converted"):
+        convert_geofeather(filename, tmpdir / "converted.feather")
+
+    with pytest.raises(ValueError, match="format must be one of"):
+        convert_geofeather(filename, tmpdir / "converted.csv", format="csv")
+
+    with pytest.raises(ValueError, match="must be different files"):
+        convert_geofeather(filename, filename)
+
+
+def test_main(tmpdir, points_wgs84, lines_wgs84, capsys):
+    """Confirm that multiple files are converted from the command line"""
+
+    paths = []
+    for name, df in [("points", points_wgs84), ("lines", lines_wgs84)]:
+        paths.append(str(tmpdir / "{}.feather".format(name)))
+        to_geofeather(df, paths[-1])
+
+    output_dir = tmpdir / "out"
+    argv = ["-o", str(output_dir), "-f", "parquet", "-w", "2"] + paths
+    assert main(argv) == 0
+    assert "converted 2 files" in capsys.readouterr().out
+
+    df = geopandas.read_parquet(str(output_dir / "lines.parquet"))
+    assert_frame_equal(df, from_geofeather(paths[1]))
+
+    # errors are reported without stopping other files
+    assert main(["-o", str(output_dir), str(tmpdir / "missing.feather")] + paths) == 1
+    assert "missing.feather" in capsys.readouterr().err
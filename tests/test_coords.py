@@ -0,0 +1,134 @@
+import numpy as np
+import pygeos as pg
+import pytest
+
+from geofeather.coords import (
+    OFFSET_MAX,
+    _offsets,
+    from_arrow,
+    quantize_offset,
+    to_arrow,
+)
+
+
+def assert_geometry_equal(left, right):
+    assert np.array_equal(pg.to_wkt(left), pg.to_wkt(right))
+
+
+@pytest.mark.parametrize(
+    "wkts,encoding",
+    [
+        (["POINT (1 2)", "POINT EMPTY", None], "point"),
+        (["POINT Z (1 2 3)", "POINT Z (4 5 6)"], "point"),
+        (["LINESTRING (0 0, 1 1)", "LINESTRING EMPTY", None], "linestring"),
+        (
+            [
+                "POLYGON ((0 0, 10 0, 10 10, 0 0), (1 1, 2 1, 2 2, 1 1))",
+                None,
+                "POLYGON EMPTY",
+            ],
+            "polygon",
+        ),
+        (["MULTIPOINT (0 0, 1 1)", "MULTIPOINT EMPTY", None], "multipoint"),
+        (
+            ["MULTILINESTRING ((0 0, 1 1), (2 2, 3 3))", None],
+            "multilinestring",
+        ),
+        (
+            [
+                "MULTIPOLYGON (((0 0, 10 0, 10 10, 0 0)), ((20 20, 30 20, 30 30, 20 20), (21 21, 22 21, 22 22, 21 21)))",
+                None,
+                "MULTIPOLYGON EMPTY",
+            ],
+            "multipolygon",
+        ),
+    ],
+)
+def test_roundtrip(wkts, encoding):
+    geometries = pg.from_wkt(wkts)
+
+    array, actual_encoding = to_arrow(geometries, pg)
+    assert actual_encoding == encoding
+    assert array.null_count == sum(wkt is None for wkt in wkts)
+
+    assert_geometry_equal(from_arrow(array, encoding, pg), geometries)
+
+    # sliced arrays must be decoded relative to their offset
+    assert_geometry_equal(from_arrow(array[1:], encoding, pg), geometries[1:])
+
+
+def test_promote_to_multi():
+    geometries = pg.from_wkt(
+        ["POLYGON ((0 0, 1 0, 1 1, 0 0))", "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)))"]
+    )
+
+    array, encoding = to_arrow(geometries, pg)
+    assert encoding == "multipolygon"
+
+    assert_geometry_equal(
+        from_arrow(array, encoding, pg),
+        pg.from_wkt(["MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)))"] * 2),
+    )
+
+
+def test_mixed_types():
+    geometries = pg.from_wkt(["POINT (0 0)", "LINESTRING (0 0, 1 1)"])
+
+    with pytest.raises(ValueError, match="single type"):
+        to_arrow(geometries, pg)
+
+
+@pytest.mark.parametrize(
+    "wkts,expected",
+    [
+        (
+            ["POINT (1.23456 2.5)", "POINT EMPTY", None, "POINT Z (1 2 3.001)"],
+            ["POINT Z (1.23 2.5 NaN)", "POINT EMPTY", None, "POINT Z (1 2 3)"],
+        ),
+        (
+            ["LINESTRING (0 0, 1.23456 1, 2 2)", "LINESTRING EMPTY", None],
+            ["LINESTRING (0 0, 1.23 1, 2 2)", "LINESTRING EMPTY", None],
+        ),
+        (
+            [
+                "MULTIPOLYGON (((0 0, 10 0, 10 10, 0 0)), ((20 20, 30 20, 30 30, 20 20), (21 21, 22.2222 21, 22 22, 21 21)))",
+                None,
+                "MULTIPOLYGON EMPTY",
+            ],
+            [
+                "MULTIPOLYGON (((0 0, 10 0, 10 10, 0 0)), ((20 20, 30 20, 30 30, 20 20), (21 21, 22.22 21, 22 22, 21 21)))",
+                None,
+                "MULTIPOLYGON EMPTY",
+            ],
+        ),
+    ],
+)
+def test_quantize(wkts, expected):
+    geometries = pg.from_wkt(wkts)
+    expected = pg.from_wkt(expected)
+    quantize = {"scale": 0.01, "offset": quantize_offset(geometries, pg, 0.01)}
+
+    array, encoding = to_arrow(geometries, pg, quantize=quantize)
+    assert "double" not in str(array.type)
+
+    assert_geometry_equal(from_arrow(array, encoding, pg, quantize=quantize), expected)
+
+    # each part is delta encoded separately, so slices can be decoded
+    assert_geometry_equal(
+        from_arrow(array[1:], encoding, pg, quantize=quantize), expected[1:]
+    )
+
+
+def test_quantize_out_of_range():
+    geometries = pg.from_wkt(["LINESTRING (0 0, 1000 1000)"])
+
+    with pytest.raises(ValueError, match="use a larger precision"):
+        to_arrow(geometries, pg, quantize={"scale": 1e-7, "offset": [0, 0, 0]})
+
+
+def test_offsets_out_of_range():
+    # a view of a single value, so that memory is not allocated for each item
+    index = np.broadcast_to(np.int64(0), (OFFSET_MAX + 1,))
+
+    with pytest.raises(ValueError, match="too many parts or coordinates"):
+        _offsets(index, 1)
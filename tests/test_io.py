@@ -1,8 +1,29 @@
+import json
 import os
 
-from geofeather import to_geofeather, from_geofeather
+from geofeather import (
+    to_geofeather,
+    from_geofeather,
+    iter_geofeather,
+    GeoFeatherWriter,
+    read_geofeather_metadata,
+    read_geofeather_dataset,
+    to_geofeather_dataset,
+    to_geoparquet,
+    from_geoparquet,
+    record_stats,
+)
+from geofeather.core import _expand_paths
+import geopandas
+import numpy as np
+from geopandas import GeoDataFrame
+from numpy import array_equal
+from pandas import DataFrame, concat
 from pandas.testing import assert_frame_equal
+import pyarrow.parquet as pq
 import pytest
+import shapely
+from shapely.geometry import MultiPolygon, box
 
 
 def test_points_geofeather(tmpdir, points_wgs84):
@@ -45,13 +66,42 @@ def test_points_geofeather_wkt(tmpdir, points_albers_conus_wkt):
     assert df.crs == points_albers_conus_wkt.crs
 
 
-def test_missing_crs_warning(tmpdir, points_wgs84):
-    """Confirm that a warning is raised if the crs file is missing"""
+def legacy_geofeather(df, filename):
+    """Write a feather file as created with geofeather < 0.4, which stored the
+    CRS in a .crs file instead of the schema metadata"""
+    legacy = DataFrame(df.copy())
+    legacy["geometry"] = df.geometry.to_wkb()
+    legacy.to_feather(filename)
+
+
+def test_crs_metadata(tmpdir, points_wgs84):
+    """Confirm that the CRS is stored in the file instead of a .crs file"""
 
     filename = tmpdir / "points_wgs84.feather"
     to_geofeather(points_wgs84, filename)
 
-    os.remove("{}.crs".format(filename))
+    assert not os.path.exists("{}.crs".format(filename))
+    assert from_geofeather(filename).crs == points_wgs84.crs
+
+
+def test_legacy_crs_file(tmpdir, points_wgs84):
+    """Confirm that the CRS is read from a .crs file for older files"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    legacy_geofeather(points_wgs84, filename)
+    with open("{}.crs".format(filename), "w") as crsfile:
+        crsfile.write(json.dumps({"wkt": points_wgs84.crs.to_wkt()}))
+
+    df = from_geofeather(filename)
+    assert_frame_equal(df, points_wgs84)
+    assert df.crs == points_wgs84.crs
+
+
+def test_missing_crs_warning(tmpdir, points_wgs84):
+    """Confirm that a warning is raised if the crs file is missing for older files"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    legacy_geofeather(points_wgs84, filename)
 
     with pytest.warns(UserWarning) as warning:
         df = from_geofeather(filename)
@@ -86,3 +136,687 @@ def test_polygons_geofeather(tmpdir, polygons_wgs84):
     df = from_geofeather(filename)
     assert_frame_equal(df, polygons_wgs84)
     assert df.crs == polygons_wgs84.crs
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["points_wgs84", "lines_wgs84", "polygons_wgs84"],
+)
+def test_geoarrow_encoding(tmpdir, fixture, request):
+    """Confirm that we can round-trip geometries using geoarrow encoding"""
+
+    expected = request.getfixturevalue(fixture)
+
+    filename = tmpdir / "{}.feather".format(fixture)
+    to_geofeather(expected, filename, encoding="geoarrow")
+
+    df = from_geofeather(filename)
+    assert_frame_equal(df, expected)
+    assert df.crs == expected.crs
+
+
+def test_read_columns(tmpdir, polygons_wgs84):
+    """Confirm that we can read a subset of columns"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    columns = ["f", "geometry"]
+    df = from_geofeather(filename, columns=columns)
+    assert_frame_equal(df, polygons_wgs84[columns])
+    assert columns == ["f", "geometry"]
+
+
+def test_legacy_wkb_column(tmpdir, points_wgs84):
+    """Confirm that we can read files created with geofeather 0.1.0"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    df = DataFrame(points_wgs84.copy())
+    df["wkb"] = points_wgs84.geometry.to_wkb()
+    df.drop(columns=["geometry"]).to_feather(filename)
+
+    df = from_geofeather(filename, columns=["i", "geometry"])
+    assert df.geometry.equals(points_wgs84.geometry)
+
+
+def test_memory_map(tmpdir, lines_wgs84):
+    """Confirm that we can read a memory mapped feather file"""
+
+    filename = tmpdir / "lines_wgs84.feather"
+    to_geofeather(lines_wgs84, filename)
+
+    df = from_geofeather(filename, memory_map=True)
+    assert_frame_equal(df, lines_wgs84)
+    assert df.crs == lines_wgs84.crs
+
+
+def test_iter_geofeather(tmpdir, polygons_wgs84):
+    """Confirm that we can read a feather file in batches"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    batches = list(iter_geofeather(filename, batch_size=300))
+    assert [len(df) for df in batches] == [300, 300, 300, 100]
+
+    for df in batches:
+        assert isinstance(df, GeoDataFrame)
+        assert df.crs == polygons_wgs84.crs
+
+    df = GeoDataFrame(concat(batches, ignore_index=True), crs=polygons_wgs84.crs)
+    assert_frame_equal(df, polygons_wgs84)
+
+    columns = ["geometry", "f"]
+    df = next(iter_geofeather(filename, columns=columns))
+    assert_frame_equal(df, polygons_wgs84[columns])
+
+
+def test_geofeather_writer(tmpdir, lines_wgs84):
+    """Confirm that we can write a feather file in chunks"""
+
+    filename = tmpdir / "lines_wgs84.feather"
+    with GeoFeatherWriter(filename) as writer:
+        for i in range(0, len(lines_wgs84), 300):
+            writer.write(lines_wgs84.iloc[i : i + 300])
+
+    df = from_geofeather(filename)
+    assert_frame_equal(df, lines_wgs84)
+    assert df.crs == lines_wgs84.crs
+
+    assert [len(df) for df in iter_geofeather(filename)] == [300, 300, 300, 100]
+
+
+def test_geofeather_writer_multi_part(tmpdir, polygons_wgs84):
+    """Confirm that chunks of single and multi part geometries can be written
+    with geoarrow encoding"""
+
+    df = polygons_wgs84.copy()
+    df.loc[500:, "geometry"] = [MultiPolygon([g]) for g in df.geometry.iloc[500:]]
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    with GeoFeatherWriter(filename, encoding="geoarrow") as writer:
+        writer.write(df.iloc[:500])
+        writer.write(df.iloc[500:])
+
+    assert read_geofeather_metadata(filename)["encoding"] == "multipolygon"
+
+    actual = from_geofeather(filename)
+    assert (actual.geom_type == "MultiPolygon").all()
+    assert actual.geometry.geom_equals(df.geometry).all()
+
+
+def test_geofeather_writer_schema_mismatch(tmpdir, lines_wgs84):
+    """Confirm that chunks with different columns raise an error"""
+
+    filename = tmpdir / "lines_wgs84.feather"
+    with GeoFeatherWriter(filename) as writer:
+        writer.write(lines_wgs84.iloc[:10])
+
+        with pytest.raises(ValueError, match="does not match"):
+            writer.write(lines_wgs84.iloc[10:20].drop(columns=["f"]))
+
+    assert len(from_geofeather(filename)) == 10
+
+
+def test_geofeather_writer_crs_mismatch(tmpdir, points_wgs84):
+    """Confirm that chunks with a different CRS raise an error"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    with GeoFeatherWriter(filename) as writer:
+        writer.write(points_wgs84.iloc[:10])
+        # equivalent CRS
+        writer.write(
+            points_wgs84.iloc[10:20].set_crs(
+                points_wgs84.crs.to_wkt(), allow_override=True
+            )
+        )
+
+        with pytest.raises(ValueError, match="CRS of chunk does not match"):
+            writer.write(points_wgs84.iloc[20:30].to_crs("EPSG:3857"))
+
+    df = from_geofeather(filename)
+    assert len(df) == 20
+    assert df.crs == points_wgs84.crs
+
+    with pytest.raises(ValueError, match="CRS of chunk does not match"):
+        with GeoFeatherWriter(filename, crs="EPSG:3857") as writer:
+            writer.write(points_wgs84)
+
+
+@pytest.mark.parametrize(
+    "bounds,sindex", [(False, False), (True, False), (False, True)]
+)
+def test_read_bbox(tmpdir, polygons_wgs84, bounds, sindex):
+    """Confirm that we can read geometries that intersect a bounding box"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+
+    # sort by x so that record batches are spatially distinct
+    expected = polygons_wgs84.iloc[polygons_wgs84.geometry.bounds.minx.argsort()]
+    with GeoFeatherWriter(filename, bounds=bounds, sindex=sindex) as writer:
+        for i in range(0, len(expected), 100):
+            writer.write(expected.iloc[i : i + 100])
+
+    bbox = (-10, -10, 10, 10)
+    b = expected.geometry.bounds
+    expected = expected.loc[
+        (b.minx <= 10) & (b.maxx >= -10) & (b.miny <= 10) & (b.maxy >= -10)
+    ].reset_index(drop=True)
+
+    df = from_geofeather(filename, bbox=bbox)
+    assert "bbox" not in df.columns
+    assert_frame_equal(df, expected)
+
+    df = from_geofeather(filename, columns=["f", "geometry"], bbox=bbox)
+    assert_frame_equal(df, expected[["f", "geometry"]])
+
+    df = from_geofeather(filename, bbox=(1000, 1000, 1001, 1001))
+    assert len(df) == 0
+    assert df.columns.tolist() == expected.columns.tolist()
+
+    df = concat(iter_geofeather(filename, bbox=bbox), ignore_index=True)
+    assert_frame_equal(GeoDataFrame(df, crs=expected.crs), expected)
+
+
+def test_read_geofeather_metadata(tmpdir, polygons_wgs84):
+    """Confirm that we can read the metadata of a file without reading the data"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, bounds=True)
+
+    metadata = read_geofeather_metadata(filename)
+    assert metadata["encoding"] == "wkb"
+    assert metadata["crs"] == polygons_wgs84.crs.to_wkt()
+    assert metadata["geometry_types"] == ["Polygon"]
+    assert metadata["bbox"] == polygons_wgs84.total_bounds.tolist()
+    assert metadata["columns"] == polygons_wgs84.columns.tolist()
+    assert metadata["bounds"]
+
+    # geometry types and total bounds are not known when writing in chunks
+    with GeoFeatherWriter(filename, encoding="geoarrow") as writer:
+        writer.write(polygons_wgs84)
+
+    metadata = read_geofeather_metadata(filename)
+    assert metadata["encoding"] == "multipolygon"
+    assert metadata["geometry_types"] is None
+    assert metadata["bbox"] is None
+    assert not metadata["bounds"]
+
+
+@pytest.mark.parametrize("encoding", ["wkb", "geoarrow"])
+def test_threads(tmpdir, polygons_wgs84, encoding):
+    """Confirm that we can decode geometries using multiple threads"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    with GeoFeatherWriter(filename, encoding=encoding) as writer:
+        for i in range(0, len(polygons_wgs84), 300):
+            writer.write(polygons_wgs84.iloc[i : i + 300])
+
+    df = from_geofeather(filename, threads=4)
+
+    if encoding == "geoarrow":
+        # chunks are written as multi part geometries
+        assert (df.geom_type == "MultiPolygon").all()
+        df["geometry"] = geopandas.GeoSeries(
+            shapely.get_geometry(df.geometry.values, 0), crs=df.crs
+        )
+
+    assert_frame_equal(df, polygons_wgs84)
+
+
+def test_read_geofeather_dataset(tmpdir, polygons_wgs84):
+    """Confirm that we can read multiple feather files into a single GeoDataFrame"""
+
+    for i in range(0, len(polygons_wgs84), 250):
+        to_geofeather(
+            polygons_wgs84.iloc[i : i + 250].reset_index(drop=True),
+            tmpdir / "polygons_{:04d}.feather".format(i),
+            bounds=i > 0,
+        )
+
+    df = read_geofeather_dataset(tmpdir, workers=2)
+    assert_frame_equal(df, polygons_wgs84)
+    assert df.crs == polygons_wgs84.crs
+
+    df = read_geofeather_dataset(
+        str(tmpdir / "polygons_*.feather"), columns=["geometry", "f"]
+    )
+    assert_frame_equal(df, polygons_wgs84[["geometry", "f"]])
+
+    # first file does not have bounds, others do
+    bbox = (-10, -10, 10, 10)
+    b = polygons_wgs84.geometry.bounds
+    expected = polygons_wgs84.loc[
+        (b.minx <= 10) & (b.maxx >= -10) & (b.miny <= 10) & (b.maxy >= -10)
+    ].reset_index(drop=True)
+    df = read_geofeather_dataset(tmpdir, bbox=bbox)
+    assert_frame_equal(df, expected)
+
+
+def test_read_geofeather_dataset_mismatch(
+    tmpdir, points_wgs84, points_albers_conus_wkt
+):
+    """Confirm that files with different CRS or columns cannot be combined"""
+
+    with pytest.raises(ValueError, match="No feather files found"):
+        read_geofeather_dataset(tmpdir)
+
+    to_geofeather(points_wgs84, tmpdir / "a.feather")
+    to_geofeather(points_albers_conus_wkt, tmpdir / "b.feather")
+
+    with pytest.raises(ValueError, match="CRS of"):
+        read_geofeather_dataset(tmpdir)
+
+    to_geofeather(points_wgs84[["geometry"]], tmpdir / "b.feather")
+
+    with pytest.raises(ValueError, match="Schema of"):
+        read_geofeather_dataset(tmpdir)
+
+
+def test_read_attributes(tmpdir, polygons_wgs84):
+    """Confirm that we can read attributes without reading geometries"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    columns = ["f"]
+    df = from_geofeather(filename, columns=columns)
+    assert columns == ["f"]
+    assert not isinstance(df, GeoDataFrame)
+    assert_frame_equal(df, DataFrame(polygons_wgs84[["f"]]))
+
+    # geometries are decoded to filter by bbox if bounds are not stored
+    bbox = (-10, -10, 10, 10)
+    b = polygons_wgs84.geometry.bounds
+    expected = DataFrame(
+        polygons_wgs84.loc[
+            (b.minx <= 10) & (b.maxx >= -10) & (b.miny <= 10) & (b.maxy >= -10), ["f"]
+        ].reset_index(drop=True)
+    )
+    assert_frame_equal(from_geofeather(filename, columns=columns, bbox=bbox), expected)
+
+    to_geofeather(polygons_wgs84, filename, bounds=True)
+    assert_frame_equal(from_geofeather(filename, columns=columns, bbox=bbox), expected)
+
+
+def test_read_lite(tmpdir, polygons_wgs84):
+    """Confirm that we can read stored bounds instead of geometries"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    with pytest.raises(ValueError, match="bounds=True"):
+        from_geofeather(filename, lite="bounds")
+
+    to_geofeather(polygons_wgs84, filename, bounds=True)
+
+    b = polygons_wgs84.geometry.bounds
+    df = from_geofeather(filename, lite="bounds")
+    assert df.columns.tolist() == polygons_wgs84.columns.drop("geometry").tolist() + [
+        "xmin",
+        "ymin",
+        "xmax",
+        "ymax",
+    ]
+    assert array_equal(df[["xmin", "ymin", "xmax", "ymax"]].values, b.values)
+
+    df = from_geofeather(filename, columns=["f", "geometry"], lite="center")
+    assert df.columns.tolist() == ["f", "x", "y"]
+    assert array_equal(df.x.values, ((b.minx + b.maxx) / 2).values)
+
+    df = from_geofeather(filename, bbox=(1000, 1000, 1001, 1001), lite="center")
+    assert len(df) == 0
+
+
+def test_to_geofeather_dataset(tmpdir, points_wgs84):
+    """Confirm that we can write a partitioned dataset and read it back"""
+
+    expected = points_wgs84.copy()
+    expected["group"] = expected.i % 3
+
+    root = tmpdir / "by_group"
+    to_geofeather_dataset(expected, root, partition_by="group")
+
+    with open(root / "_manifest.json") as manifestfile:
+        manifest = json.loads(manifestfile.read())
+
+    assert [p["key"] for p in manifest["partitions"]] == [0, 1, 2]
+    assert sum(p["num_rows"] for p in manifest["partitions"]) == len(expected)
+
+    df = read_geofeather_dataset(root)
+    assert df.crs == expected.crs
+    assert_frame_equal(
+        df.sort_values(["i", "x"]).reset_index(drop=True),
+        expected.sort_values(["i", "x"]).reset_index(drop=True),
+    )
+
+    root = tmpdir / "by_grid"
+    to_geofeather_dataset(expected, root, grid=90, bounds=True)
+
+    with open(root / "_manifest.json") as manifestfile:
+        manifest = json.loads(manifestfile.read())
+
+    for partition in manifest["partitions"]:
+        x, y = partition["key"]
+        xmin, ymin, xmax, ymax = partition["bbox"]
+        assert x * 90 <= xmin and xmax < (x + 1) * 90
+        assert y * 90 <= ymin and ymax < (y + 1) * 90
+
+    # only partitions that intersect bbox are read
+    bbox = (1, 1, 10, 10)
+    assert _expand_paths(root, bbox=bbox) == [
+        os.path.join(root, p["path"])
+        for p in manifest["partitions"]
+        if p["key"] == [0, 0]
+    ]
+
+    df = read_geofeather_dataset(root, bbox=bbox)
+    assert_frame_equal(
+        df.sort_values(["i", "x"]).reset_index(drop=True),
+        expected.loc[expected.x.between(1, 10) & expected.y.between(1, 10)]
+        .sort_values(["i", "x"])
+        .reset_index(drop=True),
+    )
+
+    with pytest.raises(ValueError, match="Exactly one"):
+        to_geofeather_dataset(expected, root)
+
+
+def test_to_geofeather_dataset_missing(tmpdir, polygons_wgs84):
+    """Confirm that partitions have the same schema when columns only have
+    missing values within some partitions"""
+
+    expected = polygons_wgs84.copy()
+    missing = expected.index % 3 == 0
+    expected["group"] = np.where(missing, None, (expected.i % 2).astype("str"))
+    # only the partition of missing groups has a note
+    expected["note"] = np.where(missing, expected.labels, None)
+    # only the partition of missing groups has multipolygons
+    expected.loc[missing, "geometry"] = [
+        MultiPolygon([g]) for g in expected.geometry[missing]
+    ]
+
+    expected = expected.sort_values("f").reset_index(drop=True)
+
+    for encoding in ["wkb", "geoarrow"]:
+        root = tmpdir / encoding
+        to_geofeather_dataset(expected, root, partition_by="group", encoding=encoding)
+
+        df = read_geofeather_dataset(root).sort_values("f").reset_index(drop=True)
+        assert_frame_equal(
+            df.drop(columns=["geometry"]), expected.drop(columns=["geometry"])
+        )
+        # geoarrow encoding stores all polygons as multipolygons
+        assert df.geometry.geom_equals(expected.geometry).all()
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd", "uncompressed"])
+def test_write_options(tmpdir, polygons_wgs84, compression):
+    """Confirm that we can control compression, chunk size, and dictionary encoding"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(
+        polygons_wgs84,
+        filename,
+        encoding="geoarrow",
+        compression=compression,
+        compression_level=3 if compression == "zstd" else None,
+        chunksize=300,
+        dictionary_columns=["labels"],
+    )
+
+    df = from_geofeather(filename)
+    assert df.labels.dtype == "category"
+    df["labels"] = df.labels.astype(polygons_wgs84.labels.dtype)
+    assert_frame_equal(df, polygons_wgs84)
+
+    assert [len(df) for df in iter_geofeather(filename)] == [300, 300, 300, 100]
+
+    with pytest.raises(ValueError, match="compression must be one of"):
+        to_geofeather(polygons_wgs84, filename, compression="gzip")
+
+    with pytest.raises(ValueError, match="not an attribute column"):
+        to_geofeather(polygons_wgs84, filename, dictionary_columns=["geometry"])
+
+
+@pytest.mark.parametrize("fixture", ["points_wgs84", "lines_wgs84", "polygons_wgs84"])
+def test_precision(tmpdir, fixture, request):
+    """Confirm that quantized coordinates are read back rounded to the precision
+    and are smaller than float64 coordinates"""
+
+    df = request.getfixturevalue(fixture)
+
+    filename = tmpdir / "quantized.feather"
+    to_geofeather(
+        df, filename, encoding="geoarrow", precision=1e-6, compression="uncompressed"
+    )
+
+    actual = from_geofeather(filename)
+    assert_frame_equal(actual.drop(columns=["geometry"]), df.drop(columns=["geometry"]))
+    assert actual.geometry.geom_equals_exact(df.geometry, 1e-6).all()
+    assert read_geofeather_metadata(filename)["precision"] == 1e-6
+
+    unquantized = tmpdir / "unquantized.feather"
+    to_geofeather(df, unquantized, encoding="geoarrow", compression="uncompressed")
+    assert os.path.getsize(filename) < os.path.getsize(unquantized)
+
+    with GeoFeatherWriter(filename, encoding="geoarrow", precision=1e-6) as writer:
+        for i in range(0, len(df), 300):
+            writer.write(df.iloc[i : i + 300])
+
+    # chunks are written as multi part geometries
+    actual = shapely.get_geometry(from_geofeather(filename).geometry.values, 0)
+    assert shapely.equals_exact(actual, df.geometry.values, 1e-6).all()
+
+    with pytest.raises(ValueError, match="precision requires a coordinate encoding"):
+        to_geofeather(df, filename, precision=1e-6)
+
+    with pytest.raises(ValueError, match="use a larger precision"):
+        to_geofeather(df, filename, encoding="geoarrow", precision=1e-12)
+
+
+def test_sort_hilbert(tmpdir, points_wgs84):
+    """Confirm that sorted rows can be restored to their original order, and that
+    sorting reduces the extent of each record batch"""
+
+    df = points_wgs84.copy()
+    df.loc[[0, 10], "geometry"] = None
+
+    filename = tmpdir / "sorted.feather"
+    to_geofeather(
+        df, filename, bounds=True, sort="hilbert", order_column="order", chunksize=100
+    )
+    assert read_geofeather_metadata(filename)["sort"] == "hilbert"
+
+    actual = from_geofeather(filename)
+    assert actual.order.tolist() != list(range(len(df)))
+    # missing geometries are written last
+    assert actual.order.tolist()[-2:] == [0, 10]
+
+    restored = actual.sort_values("order").drop(columns=["order"])
+    assert_frame_equal(restored.reset_index(drop=True), df)
+
+    def batch_area(path):
+        return sum(
+            (xmax - xmin) * (ymax - ymin)
+            for xmin, ymin, xmax, ymax in (
+                batch.geometry.dropna().total_bounds for batch in iter_geofeather(path)
+            )
+        )
+
+    unsorted = tmpdir / "unsorted.feather"
+    to_geofeather(df, unsorted, bounds=True, chunksize=100)
+    assert batch_area(filename) < batch_area(unsorted) / 4
+
+    bbox = (-10, -10, 10, 10)
+    expected = from_geofeather(unsorted, bbox=bbox)
+    actual = from_geofeather(filename, bbox=bbox).sort_values("order")
+    actual = actual.drop(columns=["order"]).reset_index(drop=True)
+    assert_frame_equal(actual, expected)
+
+    # order column is optional
+    to_geofeather(df, filename, sort="hilbert")
+    assert from_geofeather(filename).columns.tolist() == df.columns.tolist()
+
+    with pytest.raises(ValueError, match="sort must be one of"):
+        to_geofeather(df, filename, sort="zorder")
+
+    with pytest.raises(ValueError, match="order_column requires sort"):
+        to_geofeather(df, filename, order_column="order")
+
+    with pytest.raises(ValueError, match="already exists"):
+        to_geofeather(df, filename, sort="hilbert", order_column="labels")
+
+
+def test_sort_hilbert_order(tmpdir):
+    """Confirm that rows are written in the order of a Hilbert curve"""
+
+    # a block of cells at the origin of the 2**16 x 2**16 grid, and a point at
+    # the opposite corner so that each cell maps to one cell of the grid
+    size = 32
+    points = [(x, y) for x in range(size) for y in range(size)]
+    points.append(((1 << 16) - 1, (1 << 16) - 1))
+    df = GeoDataFrame(
+        {"geometry": geopandas.points_from_xy(*zip(*points))}, crs="EPSG:3857"
+    )
+    df = df.sample(frac=1, random_state=0).reset_index(drop=True)
+
+    filename = tmpdir / "sorted.feather"
+    to_geofeather(df, filename, sort="hilbert")
+
+    actual = from_geofeather(filename)
+    x = actual.geometry.x.values[: size * size]
+    y = actual.geometry.y.values[: size * size]
+
+    # the curve starts at the origin and fills the block before leaving it,
+    # moving to an adjacent cell at each step
+    assert (x[0], y[0]) == (0, 0)
+    assert (abs(x[1:] - x[:-1]) + abs(y[1:] - y[:-1]) == 1).all()
+
+
+@pytest.mark.parametrize("encoding", ["wkb", "geoarrow"])
+def test_geoparquet(tmpdir, polygons_wgs84, encoding):
+    """Confirm that we can round-trip polygons to / from parquet file"""
+
+    filename = tmpdir / "polygons_wgs84.parquet"
+    to_geoparquet(polygons_wgs84, filename, encoding=encoding, compression="zstd")
+
+    df = from_geoparquet(filename)
+    assert_frame_equal(df, polygons_wgs84)
+    assert df.crs == polygons_wgs84.crs
+
+    df = from_geoparquet(filename, columns=["labels"])
+    assert_frame_equal(df, DataFrame(polygons_wgs84[["labels"]]))
+
+    if encoding == "wkb":
+        # WKB files can also be read by geopandas
+        assert_frame_equal(geopandas.read_parquet(str(filename)), polygons_wgs84)
+
+    # a non-default index is restored
+    expected = polygons_wgs84.iloc[::2]
+    to_geoparquet(expected, filename, encoding=encoding)
+    assert from_geoparquet(filename).index.tolist() == expected.index.tolist()
+    assert_frame_equal(from_geoparquet(filename), expected)
+
+
+def test_geoparquet_bbox(tmpdir, points_wgs84):
+    """Confirm that row groups that do not intersect bbox are skipped"""
+
+    bbox = (-10, -10, 10, 10)
+
+    filename = tmpdir / "points_wgs84.parquet"
+    to_geoparquet(
+        points_wgs84, filename, bounds=True, sort="hilbert", row_group_size=50
+    )
+    assert pq.ParquetFile(str(filename)).metadata.num_row_groups == 20
+
+    unsorted = tmpdir / "unsorted.parquet"
+    to_geoparquet(points_wgs84, unsorted)
+    expected = from_geoparquet(unsorted, bbox=bbox)
+    assert 0 < len(expected) < len(points_wgs84)
+
+    df = from_geoparquet(filename, bbox=bbox)
+    assert df.geometry.intersects(box(*bbox)).all()
+    assert sorted(df.i) == sorted(expected.i)
+
+    df = from_geoparquet(filename, columns=["i"], bbox=bbox)
+    assert df.columns.tolist() == ["i"]
+    assert sorted(df.i) == sorted(expected.i)
+
+    df = from_geoparquet(unsorted, columns=["i"], bbox=bbox)
+    assert sorted(df.i) == sorted(expected.i)
+
+    with record_stats() as stats:
+        from_geoparquet(filename, bbox=bbox)
+        from_geoparquet(unsorted, bbox=bbox)
+
+    # only some of the row groups are read
+    assert stats[0].arrow_bytes < stats[1].arrow_bytes / 2
+
+
+def test_filters(tmpdir, points_wgs84):
+    """Confirm that only rows that match filters are read"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(points_wgs84, filename, bounds=True)
+
+    mask = (points_wgs84.i > 0) & (points_wgs84.ui < 30000)
+    expected = points_wgs84.loc[mask].reset_index(drop=True)
+
+    filters = [("i", ">", 0), ("ui", "<", 30000)]
+    assert_frame_equal(from_geofeather(filename, filters=filters), expected)
+
+    # columns used by filters do not need to be read
+    df = from_geofeather(filename, columns=["labels", "geometry"], filters=filters)
+    assert_frame_equal(df, expected[["labels", "geometry"]])
+
+    df = from_geofeather(filename, columns=["labels"], filters=filters)
+    assert_frame_equal(df, DataFrame(expected[["labels"]]))
+
+    df = from_geofeather(filename, lite="center", filters=filters)
+    assert array_equal(df.x.values, expected.geometry.x.values)
+
+    # list of lists are combined with OR
+    labels = points_wgs84.labels.iloc[:3].tolist()
+    df = from_geofeather(
+        filename, filters=[[("labels", "in", labels)], [("i", "<", -30000)]]
+    )
+    mask = points_wgs84.labels.isin(labels) | (points_wgs84.i < -30000)
+    assert_frame_equal(df, points_wgs84.loc[mask].reset_index(drop=True))
+
+    bbox = (-10, -10, 10, 10)
+    df = from_geofeather(filename, bbox=bbox, filters=filters)
+    assert_frame_equal(
+        df,
+        from_geofeather(filename, bbox=bbox)
+        .query("i > 0 and ui < 30000")
+        .reset_index(drop=True),
+    )
+
+    assert len(from_geofeather(filename, filters=[("i", ">", 40000)])) == 0
+
+    parquet = tmpdir / "points_wgs84.parquet"
+    to_geoparquet(points_wgs84, parquet)
+    assert_frame_equal(from_geoparquet(parquet, filters=filters), expected)
+
+    with pytest.raises(ValueError, match="only be used with attribute columns"):
+        from_geofeather(filename, filters=[("geometry", "==", None)])
+
+
+def test_write_does_not_modify_input(tmpdir, polygons_wgs84):
+    """Confirm that writing does not modify the GeoDataFrame being written"""
+
+    expected = polygons_wgs84.copy()
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(
+        polygons_wgs84,
+        filename,
+        encoding="geoarrow",
+        sindex=True,
+        dictionary_columns=["labels"],
+        precision=1e-6,
+    )
+
+    assert isinstance(polygons_wgs84, GeoDataFrame)
+    assert_frame_equal(polygons_wgs84, expected)
@@ -0,0 +1,150 @@
+import geofeather.pygeos
+from geofeather import to_geofeather, from_geofeather, GeoFeatherCache
+from geofeather.lazy import LazyGeometryArray, to_geodataframe
+from geopandas import GeoDataFrame
+import numpy as np
+from pandas import concat
+from pandas.testing import assert_frame_equal
+import pytest
+import shapely
+
+
+@pytest.mark.parametrize("encoding", ["wkb", "geoarrow"])
+def test_lazy(tmpdir, polygons_wgs84, encoding):
+    """Confirm that geometries are only decoded when accessed"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, encoding=encoding)
+
+    df = from_geofeather(filename, lazy=True)
+    assert not isinstance(df, GeoDataFrame)
+    assert df.columns.tolist() == polygons_wgs84.columns.tolist()
+
+    geometry = df.geometry.array
+    assert isinstance(geometry, LazyGeometryArray)
+    assert geometry.num_decoded == 0
+
+    # filtering does not decode geometries
+    subset = df.loc[df.labels.isin(polygons_wgs84.labels.iloc[:3])]
+    assert geometry.num_decoded == 0
+    assert subset.geometry.array.num_decoded == 0
+
+    # accessing a row only decodes that row
+    assert subset.geometry.iloc[0].equals(polygons_wgs84.geometry.iloc[0])
+    assert subset.geometry.array.num_decoded == 1
+
+    # slices share decoded geometries
+    head = df.iloc[:10]
+    assert head.geometry.iloc[2].equals(polygons_wgs84.geometry.iloc[2])
+    assert geometry.num_decoded == 1
+
+    # vectorized functions decode all geometries
+    expected = np.asarray(polygons_wgs84.geometry.iloc[subset.index])
+    assert shapely.equals(subset.geometry, expected).all()
+    assert subset.geometry.array.num_decoded == len(subset)
+
+    actual = to_geodataframe(df)
+    assert_frame_equal(actual, polygons_wgs84)
+    assert actual.crs == polygons_wgs84.crs
+    assert geometry.num_decoded == len(df)
+    assert isinstance(df.geometry.array, LazyGeometryArray)
+
+
+def test_lazy_setitem(tmpdir, points_wgs84):
+    """Confirm that geometries can be set without decoding other geometries"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(points_wgs84, filename)
+
+    df = from_geofeather(filename, lazy=True)
+    copy = df.copy()
+
+    point = shapely.Point(1, 1)
+    df.loc[0, "geometry"] = point
+    assert isinstance(df.geometry.array, LazyGeometryArray)
+    assert df.geometry.array.num_decoded == 1
+    assert df.geometry.iloc[0] == point
+
+    # copies are not modified
+    assert copy.geometry.iloc[0].equals(points_wgs84.geometry.iloc[0])
+
+    df.loc[1:2, "geometry"] = None
+    df.loc[df.index >= len(df) - 2, "geometry"] = [point, point]
+    geometry = df.geometry.array
+    geometry[3:5] = [point, None]
+
+    expected = points_wgs84.geometry.copy()
+    expected.iloc[[0, 3, -2, -1]] = point
+    expected.iloc[[1, 2, 4]] = None
+    assert np.array_equal(df.geometry.isna(), expected.isna())
+    assert shapely.equals(df.geometry, expected.values)[expected.notna()].all()
+
+
+def test_lazy_missing(tmpdir, points_wgs84):
+    df = points_wgs84.copy()
+    df.loc[[1, 5], "geometry"] = None
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(df, filename)
+
+    lazy = from_geofeather(filename, lazy=True)
+    assert lazy.geometry.isna().tolist() == df.geometry.isna().tolist()
+    assert lazy.geometry.array.num_decoded == 0
+    assert lazy.geometry.iloc[1] is None
+
+    # reindexing adds missing values
+    reindexed = lazy.reindex([0, len(df)])
+    assert reindexed.geometry.iloc[1] is None
+
+    combined = concat([lazy.iloc[:10], lazy.iloc[10:]], ignore_index=True)
+    assert isinstance(combined.geometry.array, LazyGeometryArray)
+    assert_frame_equal(to_geodataframe(combined), df)
+
+
+def test_lazy_bbox(tmpdir, points_wgs84):
+    """Confirm that lazy reads can be filtered by bbox with or without bounds"""
+
+    bbox = (-10, -10, 10, 10)
+
+    for bounds in (True, False):
+        filename = tmpdir / "points_wgs84.feather"
+        to_geofeather(points_wgs84, filename, bounds=bounds)
+
+        expected = from_geofeather(filename, bbox=bbox)
+        df = from_geofeather(filename, bbox=bbox, lazy=True)
+        assert_frame_equal(to_geodataframe(df), expected)
+
+
+def test_lazy_pygeos(tmpdir, pg_points_wgs84):
+    import pygeos
+
+    filename = tmpdir / "points_wgs84.feather"
+    geofeather.pygeos.to_geofeather(pg_points_wgs84, filename, crs="EPSG:4326")
+
+    df = geofeather.pygeos.from_geofeather(filename, lazy=True)
+    assert df.crs == "EPSG:4326"
+    assert df.geometry.array.num_decoded == 0
+
+    assert pygeos.equals(df.geometry.iloc[0], pg_points_wgs84.geometry.iloc[0])
+    assert np.array_equal(pygeos.get_x(df.geometry), pg_points_wgs84.x)
+
+
+def test_lazy_cache(tmpdir, polygons_wgs84):
+    """Confirm that decoded geometries of lazy results are cached"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    cache = GeoFeatherCache()
+    cache.from_geofeather(filename, lazy=True).geometry.iloc[0]
+    df = cache.from_geofeather(filename, lazy=True)
+    assert cache.hits == 1
+    assert df.geometry.array.num_decoded == 1
+
+    # setting geometries does not modify the cache
+    df.loc[0, "geometry"] = None
+    df = cache.from_geofeather(filename, lazy=True)
+    assert df.geometry.iloc[0].equals(polygons_wgs84.geometry.iloc[0])
+
+    assert isinstance(cache.from_geofeather(filename), GeoDataFrame)
+    assert cache.misses == 2
@@ -1,11 +1,24 @@
 import os
 
-from geofeather.pygeos import to_geofeather, from_geofeather
+import geofeather
+from geofeather.pygeos import (
+    to_geofeather,
+    from_geofeather,
+    iter_geofeather,
+    GeoFeatherWriter,
+    read_geofeather_metadata,
+    read_geofeather_dataset,
+    to_geofeather_dataset,
+    to_geoparquet,
+    from_geoparquet,
+)
+import geopandas
 from numpy import array_equal
+from pandas import concat
 from pandas.testing import assert_frame_equal
-from pygeos import to_wkb
+from pygeos import equals_exact, get_geometry, to_wkb
 import pytest
-
+import shapely
 
 GEO_CRS = "EPSG:4326"
 
@@ -39,8 +52,7 @@ def test_points_geofeather_no_crs(tmpdir, pg_points_wgs84):
 
     assert os.path.exists(filename)
 
-    with pytest.warns(UserWarning):
-        df = from_geofeather(filename)
+    df = from_geofeather(filename)
 
     cols = df.columns.drop("geometry")
     assert_frame_equal(df[cols], pg_points_wgs84[cols])
@@ -79,3 +91,264 @@ def test_polygons_geofeather(tmpdir, pg_polygons_wgs84):
     assert_geometry_equal(df.geometry, pg_polygons_wgs84.geometry)
 
     assert df.crs == GEO_CRS
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["pg_points_wgs84", "pg_lines_wgs84", "pg_polygons_wgs84"],
+)
+def test_geoarrow_encoding(tmpdir, fixture, request):
+    """Confirm that we can round-trip geometries using geoarrow encoding"""
+
+    expected = request.getfixturevalue(fixture)
+
+    filename = tmpdir / "{}.feather".format(fixture)
+    to_geofeather(expected, filename, crs=GEO_CRS, encoding="geoarrow")
+
+    df = from_geofeather(filename)
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], expected[cols])
+    assert_geometry_equal(df.geometry, expected.geometry)
+
+
+def test_memory_map(tmpdir, pg_lines_wgs84):
+    """Confirm that we can read a memory mapped feather file"""
+
+    filename = tmpdir / "lines_wgs84.feather"
+    to_geofeather(pg_lines_wgs84, filename, crs=GEO_CRS)
+
+    df = from_geofeather(filename, memory_map=True)
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_lines_wgs84[cols])
+    assert_geometry_equal(df.geometry, pg_lines_wgs84.geometry)
+
+
+def test_iter_geofeather(tmpdir, pg_polygons_wgs84):
+    """Confirm that we can read a feather file in batches"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(pg_polygons_wgs84, filename, crs=GEO_CRS)
+
+    batches = list(iter_geofeather(filename, batch_size=300))
+    assert [len(df) for df in batches] == [300, 300, 300, 100]
+    assert all(df.crs == GEO_CRS for df in batches)
+
+    df = concat(batches, ignore_index=True)
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_polygons_wgs84[cols])
+    assert_geometry_equal(df.geometry, pg_polygons_wgs84.geometry)
+
+
+def test_geofeather_writer(tmpdir, pg_polygons_wgs84):
+    """Confirm that we can write a feather file in chunks"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    with GeoFeatherWriter(filename, crs=GEO_CRS, encoding="geoarrow") as writer:
+        for i in range(0, len(pg_polygons_wgs84), 300):
+            writer.write(pg_polygons_wgs84.iloc[i : i + 300])
+
+    df = from_geofeather(filename)
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_polygons_wgs84[cols])
+    # chunks are written as multi part geometries
+    assert_geometry_equal(
+        get_geometry(df.geometry.values, 0), pg_polygons_wgs84.geometry
+    )
+    assert df.crs == GEO_CRS
+
+
+@pytest.mark.parametrize("sindex", [False, True])
+def test_read_bbox(tmpdir, pg_points_wgs84, sindex):
+    """Confirm that we can read geometries that intersect a bounding box"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(pg_points_wgs84, filename, crs=GEO_CRS, bounds=True, sindex=sindex)
+    assert os.path.exists("{}.sindex".format(filename)) == sindex
+
+    bbox = (-10, -10, 10, 10)
+    expected = pg_points_wgs84.loc[
+        pg_points_wgs84.x.between(-10, 10) & pg_points_wgs84.y.between(-10, 10)
+    ].reset_index(drop=True)
+
+    df = from_geofeather(filename, bbox=bbox)
+    assert "bbox" not in df.columns
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], expected[cols])
+    assert_geometry_equal(df.geometry, expected.geometry)
+
+
+def test_read_geofeather_metadata(tmpdir, pg_points_wgs84):
+    """Confirm that we can read the metadata of a file without reading the data"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(pg_points_wgs84, filename, crs=GEO_CRS)
+
+    metadata = read_geofeather_metadata(filename)
+    assert metadata["crs"] == GEO_CRS
+    assert metadata["geometry_types"] == ["Point"]
+    assert metadata["bbox"] == [
+        pg_points_wgs84.x.min(),
+        pg_points_wgs84.y.min(),
+        pg_points_wgs84.x.max(),
+        pg_points_wgs84.y.max(),
+    ]
+
+
+def test_threads(tmpdir, pg_polygons_wgs84):
+    """Confirm that we can decode geometries using multiple threads"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(pg_polygons_wgs84, filename)
+
+    df = from_geofeather(filename, threads=4)
+    assert_geometry_equal(df.geometry, pg_polygons_wgs84.geometry)
+
+
+def test_read_geofeather_dataset(tmpdir, pg_points_wgs84):
+    """Confirm that we can read multiple feather files into a single DataFrame"""
+
+    filenames = []
+    for i in range(0, len(pg_points_wgs84), 250):
+        filenames.append(tmpdir / "points_{:04d}.feather".format(i))
+        to_geofeather(
+            pg_points_wgs84.iloc[i : i + 250].reset_index(drop=True),
+            filenames[-1],
+            crs=GEO_CRS,
+        )
+
+    df = read_geofeather_dataset(filenames, workers=2)
+    assert df.crs == GEO_CRS
+
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_points_wgs84[cols])
+    assert_geometry_equal(df.geometry, pg_points_wgs84.geometry)
+
+
+def test_read_geofeather_dataset_crs(tmpdir, pg_points_wgs84):
+    """Confirm that files that store the same CRS differently can be read
+    together"""
+
+    filenames = [tmpdir / "pygeos.feather", tmpdir / "geopandas.feather"]
+    to_geofeather(pg_points_wgs84, filenames[0], crs=GEO_CRS)
+
+    # stored as WKT
+    gdf = geopandas.GeoDataFrame(
+        pg_points_wgs84.drop(columns=["geometry"]),
+        geometry=shapely.from_wkb(to_wkb(pg_points_wgs84.geometry.values)),
+        crs=GEO_CRS,
+    )
+    geofeather.to_geofeather(gdf, filenames[1])
+
+    df = read_geofeather_dataset(filenames)
+    assert len(df) == 2 * len(pg_points_wgs84)
+    assert df.crs == GEO_CRS
+
+    geofeather.to_geofeather(gdf.to_crs("EPSG:3857"), filenames[1])
+    with pytest.raises(ValueError, match="CRS of .* does not match"):
+        read_geofeather_dataset(filenames)
+
+
+def test_read_attributes(tmpdir, pg_points_wgs84):
+    """Confirm that we can read attributes or bounds without reading geometries"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(pg_points_wgs84, filename, crs=GEO_CRS, bounds=True)
+
+    df = from_geofeather(filename, columns=["i"])
+    assert_frame_equal(df, pg_points_wgs84[["i"]])
+
+    df = from_geofeather(filename, lite="center")
+    assert array_equal(df.x.values, pg_points_wgs84.x.values)
+    assert array_equal(df.y.values, pg_points_wgs84.y.values)
+
+
+def test_to_geofeather_dataset(tmpdir, pg_points_wgs84):
+    """Confirm that we can write a partitioned dataset and read it back"""
+
+    to_geofeather_dataset(pg_points_wgs84, tmpdir, crs=GEO_CRS, grid=(90, 45))
+
+    df = read_geofeather_dataset(tmpdir)
+    assert df.crs == GEO_CRS
+    assert len(df) == len(pg_points_wgs84)
+    assert array_equal(
+        df.x.sort_values().values, pg_points_wgs84.x.sort_values().values
+    )
+
+
+def test_precision(tmpdir, pg_polygons_wgs84):
+    """Confirm that quantized coordinates are read back rounded to the precision"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(
+        pg_polygons_wgs84, filename, crs=GEO_CRS, encoding="geoarrow", precision=1e-6
+    )
+
+    df = from_geofeather(filename)
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_polygons_wgs84[cols])
+    assert equals_exact(
+        df.geometry.values, pg_polygons_wgs84.geometry.values, 1e-6
+    ).all()
+    assert read_geofeather_metadata(filename)["precision"] == 1e-6
+
+
+def test_sort_hilbert(tmpdir, pg_points_wgs84):
+    """Confirm that sorted rows can be restored to their original order"""
+
+    filename = tmpdir / "sorted.feather"
+    to_geofeather(
+        pg_points_wgs84, filename, crs=GEO_CRS, sort="hilbert", order_column="order"
+    )
+    assert read_geofeather_metadata(filename)["sort"] == "hilbert"
+
+    df = from_geofeather(filename)
+    assert df.order.tolist() != list(range(len(df)))
+
+    df = df.sort_values("order").drop(columns=["order"]).reset_index(drop=True)
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_points_wgs84[cols])
+    assert_geometry_equal(df.geometry.values, pg_points_wgs84.geometry.values)
+
+
+def test_geoparquet(tmpdir, pg_points_wgs84):
+    filename = tmpdir / "points_wgs84.parquet"
+    to_geoparquet(
+        pg_points_wgs84, filename, crs=GEO_CRS, bounds=True, row_group_size=100
+    )
+
+    df = from_geoparquet(filename)
+    assert df.crs == GEO_CRS
+    cols = df.columns.drop("geometry")
+    assert_frame_equal(df[cols], pg_points_wgs84[cols])
+    assert_geometry_equal(df.geometry.values, pg_points_wgs84.geometry.values)
+
+    bbox = (-10, -10, 10, 10)
+    df = from_geoparquet(filename, bbox=bbox)
+    assert array_equal(
+        df.i.values,
+        pg_points_wgs84.i.values[
+            pg_points_wgs84.x.between(-10, 10) & pg_points_wgs84.y.between(-10, 10)
+        ],
+    )
+
+
+def test_filters(tmpdir, pg_points_wgs84):
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(pg_points_wgs84, filename, crs=GEO_CRS)
+
+    df = from_geofeather(filename, columns=["geometry"], filters=[("i", ">", 0)])
+    expected = pg_points_wgs84.loc[pg_points_wgs84.i > 0]
+    assert df.columns.tolist() == ["geometry"]
+    assert_geometry_equal(df.geometry.values, expected.geometry.values)
+
+
+def test_write_does_not_modify_input(tmpdir, pg_polygons_wgs84):
+    """Confirm that writing does not modify the DataFrame being written"""
+
+    expected = pg_polygons_wgs84.copy()
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(pg_polygons_wgs84, filename, crs=GEO_CRS, sindex=True)
+
+    assert_frame_equal(pg_polygons_wgs84, expected)
+    assert not hasattr(pg_polygons_wgs84, "crs")
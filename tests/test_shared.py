@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+
+import geofeather.pygeos
+from geofeather import (
+    to_geofeather,
+    from_geofeather,
+    read_geofeather_metadata,
+    publish_geofeather,
+    attach_geofeather,
+)
+from pandas.testing import assert_frame_equal
+import pytest
+
+
+def count_rows(name):
+    return len(attach_geofeather(name))
+
+
+def test_publish_geofeather(tmpdir, polygons_wgs84):
+    """Confirm that published data can be attached to by name"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, bounds=True)
+
+    with publish_geofeather(filename) as shared:
+        assert os.path.exists(shared.path)
+        assert read_geofeather_metadata(shared.path)["encoding"] == "wkb"
+
+        df = attach_geofeather(shared.name)
+        assert_frame_equal(df, polygons_wgs84)
+        assert df.crs == polygons_wgs84.crs
+
+        bbox = (-10, -10, 10, 10)
+        expected = from_geofeather(filename, bbox=bbox)
+        assert_frame_equal(attach_geofeather(shared.name, bbox=bbox), expected)
+
+    assert not os.path.exists(shared.path)
+
+    with pytest.raises(ValueError, match="no data published"):
+        attach_geofeather(shared.name)
+
+    with pytest.raises(ValueError, match="invalid name"):
+        publish_geofeather(filename, name="../test")
+
+    with pytest.raises(ValueError, match="'geometry' must be included"):
+        publish_geofeather(filename, columns=["labels"])
+
+
+def test_publish_geofeather_geoarrow(tmpdir, polygons_wgs84):
+    """Confirm that WKB geometries can be converted to coordinates when published"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    with publish_geofeather(
+        filename, columns=["labels", "geometry"], encoding="geoarrow", name="test"
+    ) as shared:
+        assert shared.name == "test"
+        assert read_geofeather_metadata(shared.path)["encoding"] == "polygon"
+
+        df = attach_geofeather("test")
+        assert df.columns.tolist() == ["labels", "geometry"]
+        assert df.geometry.geom_equals(polygons_wgs84.geometry).all()
+
+        pg_df = geofeather.pygeos.attach_geofeather("test")
+        assert len(pg_df) == len(polygons_wgs84)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_attach_geofeather_processes(tmpdir, points_wgs84):
+    """Confirm that other processes can attach to published data"""
+
+    filename = tmpdir / "points_wgs84.feather"
+    to_geofeather(points_wgs84, filename)
+
+    with publish_geofeather(filename) as shared:
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            assert pool.map(count_rows, [shared.name] * 2) == [len(points_wgs84)] * 2
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+from geofeather import to_geofeather, from_geofeather, PackedRTree, read_sindex
+from geofeather.sindex import hilbert_distance
+
+
+def brute_force(bounds, bbox):
+    return np.flatnonzero(
+        (bounds[:, 0] <= bbox[2])
+        & (bounds[:, 2] >= bbox[0])
+        & (bounds[:, 1] <= bbox[3])
+        & (bounds[:, 3] >= bbox[1])
+    )
+
+
+@pytest.mark.parametrize("size", [0, 1, 16, 17, 1000])
+def test_query(size):
+    """Confirm that the tree returns the same results as a full scan"""
+
+    rng = np.random.RandomState(0)
+    mins = rng.uniform(-100, 100, size=(size, 2))
+    bounds = np.hstack([mins, mins + rng.uniform(0, 5, size=(size, 2))])
+
+    tree = PackedRTree.build(bounds)
+    assert len(tree) == size
+
+    for bbox in [(-10, -10, 10, 10), (-100, -100, 100, 100), (200, 200, 201, 201)]:
+        assert np.array_equal(tree.query(bbox), brute_force(bounds, bbox))
+
+
+def test_query_missing():
+    """Confirm that missing and empty geometries are not indexed"""
+
+    bounds = np.array([[0, 0, 1, 1], [np.nan] * 4, [2, 2, 3, 3]])
+    tree = PackedRTree.build(bounds)
+
+    assert len(tree) == 2
+    assert tree.query((-10, -10, 10, 10)).tolist() == [0, 2]
+
+
+def test_hilbert_distance():
+    """Confirm that the Hilbert distance visits each cell of a block once, in
+    order of adjacent cells"""
+
+    size = 1 << 5
+    y, x = np.divmod(np.arange(size * size), size)
+    bounds = np.stack([x, y, x, y], axis=1)
+
+    # use the full grid so that cells map to the same grid coordinates
+    distance = hilbert_distance(
+        bounds, total_bounds=(0, 0, (1 << 16) - 1, (1 << 16) - 1)
+    )
+    assert distance.dtype == np.uint32
+
+    # the curve starts at the origin, so it fills this block first
+    assert np.array_equal(np.sort(distance), np.arange(size * size))
+
+    order = np.argsort(distance)
+    steps = np.abs(np.diff(x[order])) + np.abs(np.diff(y[order]))
+    assert (steps == 1).all()
+
+
+def test_read_sindex(tmpdir, polygons_wgs84):
+    """Confirm that the spatial index is stored alongside the feather file"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename, sindex=True)
+
+    tree = read_sindex(filename)
+    assert len(tree) == len(polygons_wgs84)
+    assert tree.batch_offsets == [0, len(polygons_wgs84)]
+
+    bbox = (-10, -10, 10, 10)
+    expected = brute_force(polygons_wgs84.geometry.bounds.values, bbox)
+    assert np.array_equal(tree.query(bbox), expected)
+
+    # overwriting the file without a spatial index removes the stale index
+    to_geofeather(polygons_wgs84.iloc[:10], filename)
+    assert not os.path.exists("{}.sindex".format(filename))
+    assert read_sindex(filename) is None
+    assert len(from_geofeather(filename, bbox=(-180, -90, 180, 90))) == 10
@@ -0,0 +1,80 @@
+import os
+
+import geofeather.pygeos
+from geofeather import (
+    to_geofeather,
+    from_geofeather,
+    read_geofeather_dataset,
+    record_stats,
+    GeoFeatherStats,
+)
+from geofeather.stats import current_stats
+
+
+def test_record_stats(tmpdir, polygons_wgs84):
+    """Confirm that the phases of each read and write call are recorded"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    callbacks = []
+
+    with record_stats(callback=callbacks.append) as stats:
+        to_geofeather(polygons_wgs84, filename, sindex=True)
+        from_geofeather(filename)
+        read_geofeather_dataset([filename, filename])
+
+    assert callbacks == stats
+    assert [s.operation for s in stats] == [
+        "to_geofeather",
+        "from_geofeather",
+        "read_geofeather_dataset",
+    ]
+
+    write, read, dataset = stats
+    assert isinstance(write, GeoFeatherStats)
+    assert write.path == str(filename)
+    assert set(write.durations) == {"bounds", "encode", "to_arrow", "write", "sindex"}
+    assert write.rows == len(polygons_wgs84)
+    assert write.file_size == os.path.getsize(filename)
+    assert write.arrow_bytes > 0
+    assert write.duration >= sum(write.durations.values())
+
+    assert set(read.durations) == {"read", "crs", "to_pandas", "decode"}
+    assert read.rows == len(polygons_wgs84)
+    assert read.file_size == write.file_size
+    assert read.arrow_bytes == write.arrow_bytes
+    assert read.dataframe_bytes > 0
+
+    assert dataset.path == [filename, filename]
+    assert dataset.rows == 2 * len(polygons_wgs84)
+    assert dataset.file_size == 2 * write.file_size
+
+    # stats are not recorded outside of record_stats
+    from_geofeather(filename)
+    assert len(stats) == 3
+
+
+def test_record_stats_nested(tmpdir, polygons_wgs84):
+    """Confirm that only the outermost call is recorded"""
+
+    filename = tmpdir / "polygons_wgs84.feather"
+    to_geofeather(polygons_wgs84, filename)
+
+    with record_stats() as stats:
+        # reads geometries to filter by bbox using a nested call
+        df = from_geofeather(filename, columns=["labels"], bbox=(-10, -10, 10, 10))
+
+    assert len(stats) == 1
+    assert stats[0].rows == len(df)
+    assert "decode" in stats[0].durations
+    assert current_stats() is None
+
+
+def test_record_stats_pygeos(tmpdir, pg_polygons_wgs84):
+    filename = tmpdir / "polygons_wgs84.feather"
+
+    with record_stats() as stats:
+        geofeather.pygeos.to_geofeather(pg_polygons_wgs84, filename, crs="EPSG:4326")
+        geofeather.pygeos.from_geofeather(filename)
+
+    assert [s.rows for s in stats] == [len(pg_polygons_wgs84)] * 2
+    assert "decode" in stats[1].durations